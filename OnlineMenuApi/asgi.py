@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'OnlineMenuApi.settings')
 
 application = get_asgi_application()
+
+# Flush the in-memory menu view counters periodically and on exit
+from analytics.utils import view_counter  # noqa: E402
+
+view_counter.start()
@@ -37,20 +37,55 @@ INSTALLED_APPS = [
     "django_cleanup.apps.CleanupSelectedConfig",  # Clean up unused media files
     # Custom apps
     "users",
+    "menu",
+    "emails",
+    "analytics",
 ]
 
 # Middleware configuration
+# API routes only run this lean stack; session routes (the admin) also run
+# SESSION_MIDDLEWARE through SessionRouteMiddleware
 MIDDLEWARE = [
+    "utils.middleware.ProfilingMiddleware",  # On-demand request profiling
     "corsheaders.middleware.CorsMiddleware",  # CORS middleware
+    "utils.middleware.CompressionMiddleware",  # Gzip compression
     "django.middleware.security.SecurityMiddleware",  # Security middleware
-    "django.contrib.sessions.middleware.SessionMiddleware",  # Session middleware
     "django.middleware.common.CommonMiddleware",  # Common middleware
+    "utils.middleware.SessionRouteMiddleware",  # Session stack for session routes only
+]
+
+# Middleware only needed by routes relying on sessions (the admin)
+SESSION_MIDDLEWARE = [
+    "django.contrib.sessions.middleware.SessionMiddleware",  # Session middleware
     "django.middleware.csrf.CsrfViewMiddleware",  # CSRF protection
     "django.contrib.auth.middleware.AuthenticationMiddleware",  # Authentication middleware
     "django.contrib.messages.middleware.MessageMiddleware",  # Message middleware
     "django.middleware.clickjacking.XFrameOptionsMiddleware",  # Prevent clickjacking
 ]
 
+# Path prefixes running SESSION_MIDDLEWARE (keep in sync with OnlineMenuApi/urls.py)
+BASE_URL = os.getenv("BASE_URL", "")
+SESSION_ROUTE_PREFIXES = ["/" + BASE_URL + os.getenv("ADMIN_URL", "admin/")]
+
+# The admin checks look for the session middleware in MIDDLEWARE only,
+# they run through SessionRouteMiddleware instead
+SILENCED_SYSTEM_CHECKS = ["admin.E408", "admin.E409", "admin.E410"]
+
+# Response compression
+COMPRESSION_MIN_SIZE = 1024  # Smaller bodies are sent as-is (bytes)
+COMPRESSION_LEVEL = 6  # Gzip level for responses compressed on the fly
+PRECOMPRESSION_LEVEL = 9  # Gzip level for cached payloads compressed once
+
+# On-demand request profiling (see ProfilingMiddleware)
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "False").lower() == "true"
+PROFILING_HEADER = "X-Profile"  # Carries a token from the profiling/token/ endpoint
+PROFILING_TOKEN_MAX_AGE = int(os.getenv("PROFILING_TOKEN_MAX_AGE", 600))  # Seconds
+PROFILING_TOKEN_MAX_USES = int(os.getenv("PROFILING_TOKEN_MAX_USES", 10))  # Requests per token
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", 0))  # 0.01 = 1% of requests
+PROFILING_SAMPLE_INTERVAL = 0.001  # Stack sampling interval (seconds)
+PROFILING_DIR = os.getenv("PROFILING_DIR", BASE_DIR / "profiles")
+PROFILING_MAX_PROFILES = int(os.getenv("PROFILING_MAX_PROFILES", 500))  # Older ones are deleted
+
 # Debug Toolbar (optional)
 ENABLE_DEBUG_TOOLBAR = os.getenv("ENABLE_DEBUG_TOOLBAR", "False").lower() == "true"
 if ENABLE_DEBUG_TOOLBAR:
@@ -106,15 +141,46 @@ DATABASES = {
 #     }
 # }
 
+# ---------------------------------------------------------------
+# Cache Configuration
+# ---------------------------------------------------------------
+
+# In-process LRU (L1) in front of a SQLite file shared by the workers of the host (L2)
+CACHES = {
+    "default": {
+        "BACKEND": "utils.cache.TwoTierCache",
+        "LOCATION": os.getenv("CACHE_LOCATION", BASE_DIR / "cache.sqlite3"),
+        "TIMEOUT": 300,  # Default entry lifetime (seconds)
+        "OPTIONS": {
+            "MAX_ENTRIES": 100_000,  # Shared entries before culling
+            "L1_MAX_ENTRIES": int(os.getenv("CACHE_L1_MAX_ENTRIES", 1000)),  # Per process
+            "L1_MAX_BYTES": int(os.getenv("CACHE_L1_MAX_BYTES", 16 * 1024 * 1024)),  # Per process
+            "L1_TIMEOUT": 60,  # Lifetime (seconds) of the in-process copies
+        },
+    }
+}
+
+# Tests clear the cache, the runner gives them a file of their own instead of the shared one
+TEST_RUNNER = "utils.testing.TestRunner"
+
 # ---------------------------------------------------------------
 # Authentication Backends
 # ---------------------------------------------------------------
 
 AUTHENTICATION_BACKENDS = [
     "users.backends.AuthBackend",  # Custom authentication backend
-    "django.contrib.auth.backends.ModelBackend",  # Default Django authentication
+    "users.backends.CachedPermissionBackend",  # Django authentication with cached permissions
 ]
 
+# Lifetime (seconds) of cached user permissions, entries are also invalidated on change
+PERMISSION_CACHE_TIMEOUT = 60 * 60
+
+# Lifetime (seconds) of the cached user details, entries are also invalidated on change
+USER_INFO_CACHE_TIMEOUT = 60 * 10
+
+# Days without a login after which regular users are archived (see archive_users)
+USER_ARCHIVE_AFTER_DAYS = int(os.getenv("USER_ARCHIVE_AFTER_DAYS", 365))
+
 # ---------------------------------------------------------------
 # Password Validation
 # ---------------------------------------------------------------
@@ -151,6 +217,85 @@ STATIC_ROOT = os.path.join(BASE_DIR, os.getenv("STATIC_ROOT", "static"))
 MEDIA_URL = os.getenv("MEDIA_URL", "/media/")  # Default is "/media/"
 MEDIA_ROOT = BASE_DIR / os.getenv("MEDIA_ROOT", "media")
 
+# How media files are delivered: "django" streams them from Python,
+# "accel" hands them to nginx (X-Accel-Redirect), "sendfile" to Apache (X-Sendfile)
+MEDIA_SERVE_MODE = os.getenv("MEDIA_SERVE_MODE", "django")
+# Internal nginx location aliasing MEDIA_ROOT (used by the "accel" mode)
+MEDIA_ACCEL_REDIRECT_PREFIX = os.getenv(
+    "MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media/"
+)
+# Browser cache lifetime (seconds) of media files without a content hash in their name
+MEDIA_CACHE_MAX_AGE = int(os.getenv("MEDIA_CACHE_MAX_AGE", 3600))
+# Chunk size used when Django streams media files itself
+MEDIA_BLOCK_SIZE = 64 * 1024
+
+# Background workers resizing uploaded product images (0 to resize inline)
+IMAGE_PIPELINE_WORKERS = int(os.getenv("IMAGE_PIPELINE_WORKERS", 2))
+
+# Product image variants (name -> maximum width in pixels)
+MENU_IMAGE_VARIANTS = {"thumbnail": 160, "card": 480, "full": 1280}
+
+# Products a single bulk update request may change
+MENU_BULK_UPDATE_MAX = 100
+
+# ---------------------------------------------------------------
+# Live Menu Events (Server-Sent Events over ASGI)
+# ---------------------------------------------------------------
+
+# Carries menu changes to every worker: LocalBroker (single process) or
+# SQLiteBroker (several processes on one host, through PUBSUB_SQLITE_PATH)
+PUBSUB_BROKER = os.getenv("PUBSUB_BROKER", "utils.pubsub.LocalBroker")
+PUBSUB_SQLITE_PATH = os.getenv("PUBSUB_SQLITE_PATH", BASE_DIR / "pubsub.sqlite3")
+PUBSUB_POLL_INTERVAL = 0.25  # SQLiteBroker polling interval (seconds)
+PUBSUB_RETENTION = 60  # SQLiteBroker message lifetime (seconds)
+PUBSUB_QUEUE_SIZE = 100  # Pending messages before a slow subscriber is dropped
+
+MENU_EVENTS_HEARTBEAT = 15  # Seconds between keep-alive comments on idle streams
+MENU_EVENTS_RETRY = 3000  # Browser reconnection delay (milliseconds)
+# Open streams allowed per client (in each worker process), told apart like throttled clients
+MENU_EVENTS_MAX_CONNECTIONS = int(os.getenv("MENU_EVENTS_MAX_CONNECTIONS", 20))
+
+# ---------------------------------------------------------------
+# Menu Delta Sync (menu/<id>/changes/)
+# ---------------------------------------------------------------
+
+MENU_CHANGES_MAX = 500  # Changes in one delta sync, clients further behind get a snapshot
+MENU_CHANGES_RETENTION = 30  # Days tombstones are kept before compaction
+
+# ---------------------------------------------------------------
+# Edge Caching (reverse proxy in front of the workers)
+# ---------------------------------------------------------------
+
+# Evicts tagged responses on changes: NullPurger (no tag-aware cache) or
+# HTTPPurger (PURGE requests to every CACHE_PURGE_URLS endpoint)
+CACHE_PURGER = os.getenv("CACHE_PURGER", "utils.purge.NullPurger")
+CACHE_PURGE_URLS = [url for url in os.getenv("CACHE_PURGE_URLS", "").split(",") if url]
+CACHE_PURGE_HEADER = os.getenv("CACHE_PURGE_HEADER", "Surrogate-Key")  # Header carrying the tags
+CACHE_PURGE_TIMEOUT = 2  # Seconds to wait for a purge endpoint
+# Background threads sending the purges (0 to purge inline, useful for tests)
+CACHE_PURGE_WORKERS = int(os.getenv("CACHE_PURGE_WORKERS", 1))
+
+# Seconds shared caches keep public menu responses (0 to not mark them cacheable),
+# tagged responses are purged as soon as their data changes. Off by default
+# without a purger, edge copies would outlive the changes.
+EDGE_CACHE_MAX_AGE = int(
+    os.getenv(
+        "EDGE_CACHE_MAX_AGE", 0 if CACHE_PURGER == "utils.purge.NullPurger" else 60
+    )
+)
+# Seconds a stale response may still be served while it is refetched
+EDGE_CACHE_STALE_WHILE_REVALIDATE = int(
+    os.getenv("EDGE_CACHE_STALE_WHILE_REVALIDATE", 30)
+)
+
+# ---------------------------------------------------------------
+# Analytics (menu view counters)
+# ---------------------------------------------------------------
+
+# Seconds between two flushes of the in-memory view counters (0 to flush manually)
+ANALYTICS_FLUSH_INTERVAL = int(os.getenv("ANALYTICS_FLUSH_INTERVAL", 10))
+ANALYTICS_MAX_PENDING = 100_000  # Distinct pending counters kept in memory per worker
+
 # ---------------------------------------------------------------
 # Default Primary Key Field Type
 # ---------------------------------------------------------------
@@ -207,7 +352,10 @@ REST_FRAMEWORK = {
     "DEFAULT_THROTTLE_RATES": {
         "user": os.getenv("USER_THROTTLE_RATE", "20/minute"),
         "anon": os.getenv("ANON_THROTTLE_RATE", "10/minute"),
+        "menu": os.getenv("MENU_THROTTLE_RATE", "120/minute"),
     },
+    # Reverse proxies in front of the app, clients are then told apart by X-Forwarded-For
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES")) if os.getenv("NUM_PROXIES") else None,
 }
 
 # ---------------------------------------------------------------
@@ -229,8 +377,11 @@ SIMPLE_JWT = {
 # ---------------------------------------------------------------
 
 EMAIL_BACKEND = os.getenv(
-    "EMAIL_BACKEND", default="django.core.mail.backends.smtp.EmailBackend"
-)  # Email backend
+    "EMAIL_BACKEND", default="emails.backends.OutboxEmailBackend"
+)  # Email backend (the outbox queues emails for the send_outbox worker)
+OUTBOX_DELIVERY_BACKEND = os.getenv(
+    "OUTBOX_DELIVERY_BACKEND", default="django.core.mail.backends.smtp.EmailBackend"
+)  # Backend used by the send_outbox worker to deliver queued emails
 EMAIL_HOST = os.getenv("EMAIL_HOST")  # SMTP host
 EMAIL_PORT = os.getenv("EMAIL_PORT", 587)  # SMTP port
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")  # SMTP user
@@ -238,6 +389,11 @@ DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")  # Default email sender
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")  # SMTP password
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "False") == "True"  # Use TLS encryption
 
+OUTBOX_BATCH_SIZE = 50  # Emails claimed per batch by the send_outbox worker
+OUTBOX_MAX_ATTEMPTS = 5  # Attempts before an email is marked as failed
+OUTBOX_RETRY_DELAY = 60  # First retry delay in seconds, doubled on each attempt
+OUTBOX_MAX_RETRY_DELAY = 60 * 60  # Upper bound of the retry delay in seconds
+
 # ---------------------------------------------------------------
 # Logging Configuration
 # ---------------------------------------------------------------
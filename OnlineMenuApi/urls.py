@@ -1,15 +1,20 @@
 import os
+import re
 from dotenv import load_dotenv
 from django.contrib import admin
 from django.conf import settings
 from rest_framework import routers
-from django.urls import path, include
-from django.conf.urls.static import static
+from utils.views import MediaView, ProfilingTokenView
+from django.urls import path, re_path, include
+from menu.views import RestaurantViewSet, CategoryViewSet, ProductViewSet
 
 # Loads the variables from the .env file into the environment
 load_dotenv()
 
 router = routers.DefaultRouter()
+router.register("restaurants", RestaurantViewSet, basename="restaurant")
+router.register("categories", CategoryViewSet, basename="category")
+router.register("products", ProductViewSet, basename="product")
 
 
 base_url: str = os.getenv("BASE_URL", "")
@@ -20,11 +25,26 @@ urlpatterns = [
     path(base_url + os.getenv("ADMIN_URL", "admin/"), admin.site.urls),
     # api version 1
     path(base_url + "users/", include("users.urls")),
+    # public restaurant menus
+    path(base_url + "menu/", include("menu.urls")),
+    # menu view counters and staff reports
+    path(base_url + "analytics/", include("analytics.urls")),
+    # on-demand request profiling (staff only)
+    path(
+        base_url + "profiling/token/",
+        ProfilingTokenView.as_view(),
+        name="profiling-token",
+    ),
+    # uploaded media (delegated to the front proxy when configured)
+    re_path(
+        r"^%s(?P<path>.+)$" % re.escape(settings.MEDIA_URL.lstrip("/")),
+        MediaView.as_view(),
+        name="media",
+    ),
 ]
 
 if settings.DEBUG:
     urlpatterns += (path("__debug__/", include("debug_toolbar.urls")),)
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
 
 admin.site.index_title = "Online Menu"
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'OnlineMenuApi.settings')
 
 application = get_wsgi_application()
+
+# Flush the in-memory menu view counters periodically and on exit
+from analytics.utils import view_counter  # noqa: E402
+
+view_counter.start()
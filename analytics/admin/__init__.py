@@ -0,0 +1 @@
+from .daily_views_admin import RestaurantDailyViewsAdmin, ProductDailyViewsAdmin
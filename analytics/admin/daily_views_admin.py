@@ -0,0 +1,22 @@
+from django.contrib import admin
+from analytics.models import RestaurantDailyViewsModel, ProductDailyViewsModel
+
+
+@admin.register(RestaurantDailyViewsModel)
+class RestaurantDailyViewsAdmin(admin.ModelAdmin):
+    model = RestaurantDailyViewsModel
+
+    list_display = ["restaurant", "date", "views", "updated_at"]
+    list_filter = ["date"]
+    list_select_related = ["restaurant"]
+    readonly_fields = ["restaurant", "date", "views", "updated_at"]
+
+
+@admin.register(ProductDailyViewsModel)
+class ProductDailyViewsAdmin(admin.ModelAdmin):
+    model = ProductDailyViewsModel
+
+    list_display = ["product", "restaurant", "date", "views", "updated_at"]
+    list_filter = ["date"]
+    list_select_related = ["product", "restaurant"]
+    readonly_fields = ["product", "restaurant", "date", "views", "updated_at"]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.7 on 2026-10-19 18:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('menu', '0003_menu_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductDailyViewsModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='menu.productmodel')),
+                ('restaurant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_daily_views', to='menu.restaurantmodel')),
+            ],
+            options={
+                'verbose_name': 'product daily views',
+                'verbose_name_plural': 'product daily views',
+                'ordering': ('-date',),
+                'indexes': [models.Index(fields=['restaurant', 'date'], name='product_views_restaurant_idx')],
+                'constraints': [models.UniqueConstraint(fields=('product', 'date'), name='product_daily_views_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='RestaurantDailyViewsModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('restaurant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='menu.restaurantmodel')),
+            ],
+            options={
+                'verbose_name': 'restaurant daily views',
+                'verbose_name_plural': 'restaurant daily views',
+                'ordering': ('-date',),
+                'constraints': [models.UniqueConstraint(fields=('restaurant', 'date'), name='restaurant_daily_views_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,2 @@
+from .restaurant_daily_views_model import RestaurantDailyViewsModel
+from .product_daily_views_model import ProductDailyViewsModel
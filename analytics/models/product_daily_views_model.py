@@ -0,0 +1,51 @@
+from django.db import models
+from menu.models import RestaurantModel, ProductModel
+
+
+class ProductDailyViewsModel(models.Model):
+    """
+    Number of detail views of a product on one day.
+    Rows are upserted in batches by the view counter, never one per view.
+    """
+
+    product = models.ForeignKey(
+        ProductModel,
+        on_delete=models.CASCADE,
+        related_name="daily_views",
+    )
+
+    # Denormalized from the product so per-restaurant reports need no join
+    restaurant = models.ForeignKey(
+        RestaurantModel,
+        on_delete=models.CASCADE,
+        related_name="product_daily_views",
+    )
+
+    date = models.DateField()
+    views = models.PositiveBigIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Meta class for the ProductDailyViewsModel.
+        """
+
+        verbose_name = "product daily views"
+        verbose_name_plural = "product daily views"
+        ordering = ("-date",)
+        constraints = [
+            # Target of the upserts made by the view counter
+            models.UniqueConstraint(
+                fields=["product", "date"], name="product_daily_views_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["restaurant", "date"], name="product_views_restaurant_idx"),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the daily views.
+        """
+        return f"{self.product_id} {self.date}: {self.views}"
@@ -0,0 +1,41 @@
+from django.db import models
+from menu.models import RestaurantModel
+
+
+class RestaurantDailyViewsModel(models.Model):
+    """
+    Number of menu views (QR-code scans) of a restaurant on one day.
+    Rows are upserted in batches by the view counter, never one per view.
+    """
+
+    restaurant = models.ForeignKey(
+        RestaurantModel,
+        on_delete=models.CASCADE,
+        related_name="daily_views",
+    )
+
+    date = models.DateField()
+    views = models.PositiveBigIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Meta class for the RestaurantDailyViewsModel.
+        """
+
+        verbose_name = "restaurant daily views"
+        verbose_name_plural = "restaurant daily views"
+        ordering = ("-date",)
+        constraints = [
+            # Target of the upserts made by the view counter
+            models.UniqueConstraint(
+                fields=["restaurant", "date"], name="restaurant_daily_views_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the daily views.
+        """
+        return f"{self.restaurant_id} {self.date}: {self.views}"
@@ -0,0 +1 @@
+from .view_counter_test_case import ViewCounterTestCase
@@ -0,0 +1,131 @@
+import uuid
+from decimal import Decimal
+from django.urls import reverse
+from django.test import TestCase, override_settings
+from django.core.cache import cache
+from users.models import UserModel
+from rest_framework.test import APIClient
+from analytics.utils import view_counter, get_today
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+from analytics.models import RestaurantDailyViewsModel, ProductDailyViewsModel
+
+
+class ViewCounterTestCase(TestCase):
+    """Test cases for the write-coalesced menu view counters"""
+
+    def setUp(self):
+        """Create a restaurant with one product and discard pending counts"""
+        cache.clear()
+        view_counter.take()
+
+        self.staff = UserModel.objects.create_superuser(
+            email="admin@example.com",
+            username="admin",
+            password="AdminPass123!",
+        )
+        self.restaurant = RestaurantModel.objects.create(owner=self.staff, name="Cafe")
+        self.product = ProductModel.objects.create(
+            category=CategoryModel.objects.create(
+                restaurant=self.restaurant, name="Drinks"
+            ),
+            name="Tea",
+            price=Decimal("10"),
+        )
+        self.client = APIClient()
+
+    def test_menu_views_are_counted_without_sql(self):
+        """Menu reads only touch memory, a flush writes one row per day"""
+        url = reverse("menu-document", args=[self.restaurant.id])
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            for _ in range(20):
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.assertEqual(view_counter.flush(), 1)
+        views = RestaurantDailyViewsModel.objects.get()
+        self.assertEqual(views.views, 21)
+        self.assertEqual(views.date, get_today())
+
+    def test_flushes_add_up(self):
+        """Later flushes increment the existing daily row"""
+        url = reverse("product-view-count", args=[self.product.id])
+
+        for _ in range(3):
+            self.assertEqual(self.client.post(url).status_code, 202)
+        view_counter.flush()
+
+        self.client.post(url)
+        with self.assertNumQueries(4):
+            # Savepoint, the product lookup, one upsert and the release
+            view_counter.flush()
+
+        views = ProductDailyViewsModel.objects.get()
+        self.assertEqual(views.views, 4)
+        self.assertEqual(views.restaurant_id, self.restaurant.id)
+
+    @override_settings(EDGE_CACHE_MAX_AGE=60)
+    def test_edge_cached_menus_are_counted_by_beacon(self):
+        """With edge caching, menu reads are counted by the posted beacon only"""
+        self.client.get(reverse("menu-document", args=[self.restaurant.id]))
+
+        url = reverse("restaurant-view-count", args=[self.restaurant.id])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.post(url).status_code, 202)
+
+        missing = reverse("restaurant-view-count", args=[uuid.uuid4()])
+        self.assertEqual(self.client.post(missing).status_code, 404)
+
+        self.assertEqual(view_counter.flush(), 1)
+        self.assertEqual(RestaurantDailyViewsModel.objects.get().views, 1)
+
+    def test_unknown_ids_are_dropped(self):
+        """Views of missing products take no pending counter"""
+        url = reverse("product-view-count", args=[uuid.uuid4()])
+        self.assertEqual(self.client.post(url).status_code, 404)
+
+        self.assertEqual(view_counter.take(), {})
+        self.assertFalse(ProductDailyViewsModel.objects.exists())
+
+    @override_settings(ANALYTICS_MAX_PENDING=1)
+    def test_kinds_have_their_own_budget(self):
+        """Product views filling their counters never drop menu views"""
+        other = ProductModel.objects.create(
+            category=self.product.category, name="Coffee", price=Decimal("12")
+        )
+        with self.assertLogs("analytics.utils.view_counter_utils", "WARNING"):
+            for product in (self.product, other):
+                self.client.post(reverse("product-view-count", args=[product.id]))
+        self.client.get(reverse("menu-document", args=[self.restaurant.id]))
+
+        self.assertEqual(view_counter.flush(), 2)
+        self.assertEqual(ProductDailyViewsModel.objects.get().product, self.product)
+        self.assertTrue(RestaurantDailyViewsModel.objects.exists())
+
+    def test_staff_reports(self):
+        """Staff get the top restaurants and per-restaurant daily reports"""
+        for _ in range(2):
+            self.client.get(reverse("menu-document", args=[self.restaurant.id]))
+        self.client.post(reverse("product-view-count", args=[self.product.id]))
+        view_counter.flush()
+
+        self.assertEqual(
+            self.client.get(reverse("restaurant-analytics-list")).status_code, 401
+        )
+
+        self.client.force_authenticate(self.staff)
+        response = self.client.get(reverse("restaurant-analytics-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["views"], 2)
+
+        response = self.client.get(
+            reverse("restaurant-analytics", args=[self.restaurant.id])
+        )
+        self.assertEqual(response.data["views"], 2)
+        self.assertEqual(response.data["daily"], [{"date": get_today(), "views": 2}])
+        self.assertEqual(response.data["products"][0]["id"], self.product.id)
+
+        response = self.client.get(
+            reverse("restaurant-analytics-list"), {"from": "not-a-date"}
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,30 @@
+from django.urls import path
+from analytics.views import (
+    ProductViewCountView,
+    RestaurantViewCountView,
+    RestaurantAnalyticsView,
+    RestaurantAnalyticsListView,
+)
+
+urlpatterns = [
+    path(
+        "products/<uuid:product_id>/views/",
+        ProductViewCountView.as_view(),
+        name="product-view-count",
+    ),
+    path(
+        "restaurants/<uuid:restaurant_id>/views/",
+        RestaurantViewCountView.as_view(),
+        name="restaurant-view-count",
+    ),
+    path(
+        "restaurants/",
+        RestaurantAnalyticsListView.as_view(),
+        name="restaurant-analytics-list",
+    ),
+    path(
+        "restaurants/<uuid:restaurant_id>/",
+        RestaurantAnalyticsView.as_view(),
+        name="restaurant-analytics",
+    ),
+]
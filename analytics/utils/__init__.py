@@ -0,0 +1,8 @@
+from .view_counter_utils import (
+    ViewCounter,
+    get_today,
+    view_counter,
+    count_product_view,
+    count_restaurant_view,
+)
+from .analytics_utils import get_date_range, get_restaurant_report, get_top_restaurants
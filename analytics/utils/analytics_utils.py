@@ -0,0 +1,78 @@
+from datetime import timedelta
+from django.db.models import Sum
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+from analytics.utils.view_counter_utils import get_today
+from analytics.models import RestaurantDailyViewsModel, ProductDailyViewsModel
+
+# Reports cover the last 30 days unless `from`/`to` are given
+DEFAULT_REPORT_DAYS = 30
+MAX_REPORT_ROWS = 50
+
+
+def get_date_range(query_params):
+    """Returns the (from, to) dates of a report from the query parameters."""
+    dates = {}
+
+    for name in ("from", "to"):
+        value = query_params.get(name)
+        try:
+            dates[name] = parse_date(value) if value else None
+        except ValueError:
+            dates[name] = None
+
+        if value and dates[name] is None:
+            raise ValidationError({name: ["تاریخ نامعتبر است."]})
+
+    end = dates["to"] or get_today()
+    start = dates["from"] or end - timedelta(days=DEFAULT_REPORT_DAYS - 1)
+
+    if start > end:
+        raise ValidationError({"from": ["تاریخ شروع باید قبل از تاریخ پایان باشد."]})
+
+    return start, end
+
+
+def get_top_restaurants(start, end):
+    """Returns the most viewed restaurants between two dates (inclusive)."""
+    rows = (
+        RestaurantDailyViewsModel.objects.filter(date__range=(start, end))
+        .values("restaurant_id", "restaurant__name")
+        .annotate(total=Sum("views"))
+        .order_by("-total")[:MAX_REPORT_ROWS]
+    )
+
+    return [
+        {"id": row["restaurant_id"], "name": row["restaurant__name"], "views": row["total"]}
+        for row in rows
+    ]
+
+
+def get_restaurant_report(restaurant, start, end):
+    """Returns the daily views and the most viewed products of a restaurant."""
+    daily = list(
+        RestaurantDailyViewsModel.objects.filter(
+            restaurant=restaurant, date__range=(start, end)
+        )
+        .order_by("date")
+        .values("date", "views")
+    )
+    products = (
+        ProductDailyViewsModel.objects.filter(
+            restaurant=restaurant, date__range=(start, end)
+        )
+        .values("product_id", "product__name")
+        .annotate(total=Sum("views"))
+        .order_by("-total")[:MAX_REPORT_ROWS]
+    )
+
+    return {
+        "id": restaurant.id,
+        "name": restaurant.name,
+        "views": sum(row["views"] for row in daily),
+        "daily": daily,
+        "products": [
+            {"id": row["product_id"], "name": row["product__name"], "views": row["total"]}
+            for row in products
+        ],
+    }
@@ -0,0 +1,237 @@
+import os
+import atexit
+import logging
+import threading
+from datetime import date
+from collections import Counter
+from django.conf import settings
+from django.utils import timezone
+from django.core.cache import cache
+from django.db import DatabaseError, connection, transaction, close_old_connections
+from menu.models import RestaurantModel, ProductModel
+from analytics.models import RestaurantDailyViewsModel, ProductDailyViewsModel
+
+logger = logging.getLogger(__name__)
+
+RESTAURANT = "restaurant"
+PRODUCT = "product"
+
+# Products known to exist, so their views are counted without SQL
+KNOWN_PRODUCT_CACHE_KEY = "analytics:products:{product_id}"
+KNOWN_PRODUCT_TIMEOUT = 60 * 60
+
+# Adds the batched increments to the existing daily rows (SQLite 3.24+ and PostgreSQL)
+UPSERT_QUERY = """
+    INSERT INTO {table} ({columns}, date, views, updated_at)
+    VALUES ({placeholders}, %s, %s, %s)
+    ON CONFLICT ({conflict}, date)
+    DO UPDATE SET views = {table}.views + excluded.views, updated_at = excluded.updated_at
+"""
+
+
+def get_today():
+    """Returns the current date in the TIME_ZONE."""
+    return timezone.localdate() if settings.USE_TZ else date.today()
+
+
+class ViewCounter:
+    """
+    Aggregates view increments in process memory and flushes them as one
+    batched upsert per rollup table, every ANALYTICS_FLUSH_INTERVAL seconds
+    and when the process exits.
+
+    Counting a view is a dict update, it never touches the database. A
+    worker killed without running its exit handlers loses at most one
+    interval of views; counts of a failed flush are kept for the next one.
+    Each kind keeps up to ANALYTICS_MAX_PENDING distinct counters, so
+    product views cannot crowd out menu views.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.sizes = Counter()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.pid = None
+
+    def increment(self, kind, object_id, amount=1):
+        key = (kind, object_id, get_today())
+
+        with self.lock:
+            if key not in self.counts:
+                if self.sizes[kind] >= settings.ANALYTICS_MAX_PENDING:
+                    logger.warning("Dropped a %s view, too many pending counters", kind)
+                    return
+
+                self.sizes[kind] += 1
+
+            self.counts[key] += amount
+
+        # Threads do not survive a fork (e.g. gunicorn --preload)
+        if self.pid is not None and self.pid != os.getpid():
+            self.start()
+
+    def start(self):
+        """
+        Starts flushing in a background thread and at exit. Called by the
+        WSGI/ASGI entry points, so only server processes flush: in other
+        processes (tests, shells, commands) counts stay in memory.
+        """
+        with self.lock:
+            if self.pid == os.getpid() or not settings.ANALYTICS_FLUSH_INTERVAL:
+                return
+
+            if self.pid is None:
+                atexit.register(self.stop)
+
+            self.pid = os.getpid()
+            self.stopped = threading.Event()
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        if self.thread is not None:
+            self.stopped.set()
+            self.thread.join()
+            self.thread = None
+
+        self.flush()
+
+    def run(self):
+        while not self.stopped.wait(settings.ANALYTICS_FLUSH_INTERVAL):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush the view counters")
+            finally:
+                close_old_connections()
+
+    def take(self):
+        """Returns and resets the pending counts."""
+        with self.lock:
+            counts, self.counts = self.counts, Counter()
+            self.sizes = Counter()
+
+        return counts
+
+    def restore(self, counts):
+        """Puts back the counts of a failed flush, within ANALYTICS_MAX_PENDING."""
+        with self.lock:
+            for key, amount in counts.items():
+                if key in self.counts:
+                    self.counts[key] += amount
+                elif self.sizes[key[0]] < settings.ANALYTICS_MAX_PENDING:
+                    self.sizes[key[0]] += 1
+                    self.counts[key] = amount
+
+    def flush(self):
+        """Writes the pending counts to the rollup tables. Returns the number of rows."""
+        counts = self.take()
+        if not counts:
+            return 0
+
+        try:
+            with transaction.atomic():
+                return self.write(counts)
+        except DatabaseError:
+            logger.exception("Failed to flush %d view counters", len(counts))
+            self.restore(counts)
+            return 0
+
+    def write(self, counts):
+        now = timezone.now()
+        restaurant_counts = {}
+        product_counts = {}
+
+        for (kind, object_id, date), amount in counts.items():
+            target = restaurant_counts if kind == RESTAURANT else product_counts
+            target[object_id, date] = amount
+
+        # Views of deleted (or made up) restaurants and products are dropped
+        restaurant_ids = set(
+            RestaurantModel.objects.filter(
+                pk__in={object_id for object_id, _ in restaurant_counts}
+            )
+            .order_by()
+            .values_list("pk", flat=True)
+        )
+        product_restaurants = dict(
+            ProductModel.objects.filter(
+                pk__in={object_id for object_id, _ in product_counts}
+            )
+            .order_by()
+            .values_list("pk", "restaurant_id")
+        )
+
+        restaurant_rows = [
+            (restaurant_id, date, amount)
+            for (restaurant_id, date), amount in restaurant_counts.items()
+            if restaurant_id in restaurant_ids
+        ]
+        product_rows = [
+            (product_id, product_restaurants[product_id], date, amount)
+            for (product_id, date), amount in product_counts.items()
+            if product_id in product_restaurants
+        ]
+
+        self.upsert(RestaurantDailyViewsModel, ["restaurant"], restaurant_rows, now)
+        self.upsert(ProductDailyViewsModel, ["product", "restaurant"], product_rows, now)
+
+        return len(restaurant_rows) + len(product_rows)
+
+    def upsert(self, model, fields, rows, now):
+        if not rows:
+            return
+
+        fields = [model._meta.get_field(name) for name in fields]
+        date_field = model._meta.get_field("date")
+        updated_at_field = model._meta.get_field("updated_at")
+
+        query = UPSERT_QUERY.format(
+            table=model._meta.db_table,
+            columns=", ".join(field.column for field in fields),
+            placeholders=", ".join(["%s"] * len(fields)),
+            conflict=fields[0].column,
+        )
+        params = [
+            [
+                *(
+                    field.get_db_prep_value(value, connection)
+                    for field, value in zip(fields, row)
+                ),
+                date_field.get_db_prep_value(row[-2], connection),
+                row[-1],
+                updated_at_field.get_db_prep_value(now, connection),
+            ]
+            for row in rows
+        ]
+
+        with connection.cursor() as cursor:
+            cursor.executemany(query, params)
+
+
+view_counter = ViewCounter()
+
+
+def count_restaurant_view(restaurant_id):
+    """Counts a menu view of a restaurant (in memory, flushed in batches)."""
+    view_counter.increment(RESTAURANT, restaurant_id)
+
+
+def count_product_view(product_id):
+    """
+    Counts a detail view of a product (in memory, flushed in batches).
+    Returns False, counting nothing, if the product does not exist: the
+    first view of a product per KNOWN_PRODUCT_TIMEOUT looks it up, so made
+    up ids never take a pending counter.
+    """
+    key = KNOWN_PRODUCT_CACHE_KEY.format(product_id=product_id)
+
+    if not cache.get(key):
+        if not ProductModel.objects.filter(pk=product_id).exists():
+            return False
+
+        cache.set(key, True, KNOWN_PRODUCT_TIMEOUT)
+
+    view_counter.increment(PRODUCT, product_id)
+    return True
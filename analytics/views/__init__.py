@@ -0,0 +1,6 @@
+from .analytics_views import (
+    ProductViewCountView,
+    RestaurantViewCountView,
+    RestaurantAnalyticsView,
+    RestaurantAnalyticsListView,
+)
@@ -0,0 +1,113 @@
+from rest_framework import status
+from menu.utils import get_menu_document
+from rest_framework.views import APIView
+from menu.models import RestaurantModel
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework.permissions import AllowAny, IsAdminUser
+from analytics.utils import (
+    get_date_range,
+    count_product_view,
+    get_top_restaurants,
+    count_restaurant_view,
+    get_restaurant_report,
+)
+
+
+class ProductViewCountView(APIView):
+    """
+    Public API endpoint counting a detail view of a product.
+    Only increments an in-memory counter, no SQL runs per view once the
+    product is known to exist.
+    """
+
+    http_method_names = ["post"]
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    throttle_scope = "menu"
+    throttle_classes = [ScopedRateThrottle]
+
+    def post(self, request: Request, product_id):
+        if not count_product_view(product_id):
+            return Response(
+                data={"message": "محصول یافت نشد."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(status=status.HTTP_202_ACCEPTED)
+
+
+class RestaurantViewCountView(APIView):
+    """
+    Public API endpoint counting a menu view of a restaurant, posted by
+    clients when edge caching is on (EDGE_CACHE_MAX_AGE): menus served by
+    the reverse proxy never reach the workers to be counted. Checks the
+    menu against the cached menu document, no SQL runs per view.
+    """
+
+    http_method_names = ["post"]
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    throttle_scope = "menu"
+    throttle_classes = [ScopedRateThrottle]
+
+    def post(self, request: Request, restaurant_id):
+        if get_menu_document(restaurant_id) is None:
+            return Response(
+                data={"message": "منو یافت نشد."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        count_restaurant_view(restaurant_id)
+
+        return Response(status=status.HTTP_202_ACCEPTED)
+
+
+class RestaurantAnalyticsListView(APIView):
+    """
+    Staff-only API endpoint listing the most viewed restaurants over a
+    date range (`from` and `to`, the last 30 days by default).
+    """
+
+    http_method_names = ["get"]
+    permission_classes = [IsAdminUser]
+
+    throttle_scope = "user"
+    throttle_classes = [ScopedRateThrottle]
+
+    def get(self, request: Request):
+        start, end = get_date_range(request.query_params)
+
+        return Response(
+            {"from": start, "to": end, "results": get_top_restaurants(start, end)}
+        )
+
+
+class RestaurantAnalyticsView(APIView):
+    """
+    Staff-only API endpoint returning the daily menu views and the most
+    viewed products of a restaurant over a date range.
+    """
+
+    http_method_names = ["get"]
+    permission_classes = [IsAdminUser]
+
+    throttle_scope = "user"
+    throttle_classes = [ScopedRateThrottle]
+
+    def get(self, request: Request, restaurant_id):
+        start, end = get_date_range(request.query_params)
+        restaurant = RestaurantModel.objects.filter(pk=restaurant_id).first()
+
+        if restaurant is None:
+            return Response(
+                data={"message": "رستوران یافت نشد."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(
+            {"from": start, "to": end, **get_restaurant_report(restaurant, start, end)}
+        )
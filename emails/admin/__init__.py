@@ -0,0 +1 @@
+from .outbox_email_admin import OutboxEmailAdmin
@@ -0,0 +1,41 @@
+from django.contrib import admin
+from django.utils.timezone import now
+from emails.models import OutboxEmailModel
+
+
+@admin.register(OutboxEmailModel)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    model = OutboxEmailModel
+
+    list_display = [
+        "id",
+        "from_email",
+        "recipients",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+        "created_at",
+    ]
+    list_filter = ["status"]
+    exclude = ["message"]
+    readonly_fields = [
+        "from_email",
+        "recipients",
+        "status",
+        "attempts",
+        "last_error",
+        "refused_recipients",
+        "next_attempt_at",
+        "sent_at",
+        "created_at",
+    ]
+
+    actions = ["retry_emails"]
+
+    @admin.action(description="Retry selected emails")
+    def retry_emails(self, request, queryset):
+        updated_count = queryset.exclude(status=OutboxEmailModel.Status.SENT).update(
+            status=OutboxEmailModel.Status.PENDING, next_attempt_at=now()
+        )
+        self.message_user(request, f"{updated_count} email(s) queued for retry.")
@@ -0,0 +1 @@
+from .outbox_backend import OutboxEmailBackend
@@ -0,0 +1,30 @@
+from emails.models import OutboxEmailModel
+from django.core.mail.backends.base import BaseEmailBackend
+
+
+class OutboxEmailBackend(BaseEmailBackend):
+    """
+    Email backend that stores messages in the outbox table instead of
+    sending them, so `send_mail` returns without any network round-trip.
+    The `send_outbox` command delivers them in batches.
+    """
+
+    def send_messages(self, email_messages):
+        rows = [
+            OutboxEmailModel(
+                from_email=message.from_email or "",
+                recipients=message.recipients(),
+                message=message.message().as_bytes(),
+            )
+            for message in email_messages
+            if message.recipients()
+        ]
+
+        try:
+            OutboxEmailModel.objects.bulk_create(rows)
+        except Exception:
+            if not self.fail_silently:
+                raise
+            return 0
+
+        return len(rows)
@@ -0,0 +1,40 @@
+import time
+from logging import getLogger
+from django.conf import settings
+from emails.utils import drain_outbox
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+
+logger = getLogger("email_v1")
+
+
+class Command(BaseCommand):
+    help = "Delivers the emails queued in the outbox over one SMTP connection."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running and poll the outbox every --interval seconds.",
+        )
+        parser.add_argument("--interval", type=float, default=5)
+        parser.add_argument("--batch-size", type=int, default=settings.OUTBOX_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        connection = get_connection(settings.OUTBOX_DELIVERY_BACKEND)
+
+        while True:
+            try:
+                sent = drain_outbox(connection, options["batch_size"])
+            except Exception:
+                # Connection failures are retried on the next poll
+                logger.exception("Outbox delivery failed")
+                sent = 0
+
+            if sent and options["verbosity"]:
+                self.stdout.write(f"Sent {sent} email(s).")
+
+            if not options["loop"]:
+                break
+
+            time.sleep(options["interval"])
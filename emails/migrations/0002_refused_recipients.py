@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-19 18:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emails', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboxemailmodel',
+            name='refused_recipients',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1 @@
+from .outbox_email_model import OutboxEmailModel
@@ -0,0 +1,54 @@
+from django.db import models
+from django.utils.timezone import now
+
+
+class OutboxEmailModel(models.Model):
+    """
+    An email queued by the outbox email backend, waiting to be delivered
+    by the `send_outbox` worker command.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    # Envelope sender and recipients (to, cc and bcc)
+    from_email = models.CharField(max_length=254)
+    recipients = models.JSONField(default=list)
+
+    # The fully rendered MIME message, as produced by EmailMessage.message()
+    message = models.BinaryField()
+
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+
+    # Recipients the server rejected permanently (5xx), never retried
+    refused_recipients = models.JSONField(default=list, blank=True)
+
+    # The worker picks up pending emails whose next attempt is due
+    next_attempt_at = models.DateTimeField(default=now)
+
+    sent_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Meta class for the OutboxEmailModel.
+        """
+
+        verbose_name = "outbox email"
+        verbose_name_plural = "outbox emails"
+        ordering = ("id",)
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due_idx"),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the outbox email.
+        """
+        return f"{self.from_email} -> {', '.join(self.recipients)} ({self.status})"
@@ -0,0 +1 @@
+from .outbox_test_case import OutboxTestCase
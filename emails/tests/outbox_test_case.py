@@ -0,0 +1,179 @@
+import threading
+import socketserver
+from email import message_from_bytes
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from emails.models import OutboxEmailModel
+from emails.utils import drain_outbox
+
+OUTBOX_BACKEND = "emails.backends.OutboxEmailBackend"
+SMTP_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP server session, standing in for a debugging SMTP server"""
+
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        self.server.connections += 1
+        self.reply("220 sink ready")
+        recipients = []
+
+        while line := self.rfile.readline():
+            command = line.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb in ("EHLO", "HELO"):
+                self.reply("250 sink")
+            elif verb == "MAIL":
+                recipients = []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                if "bounce" in command:
+                    self.reply("451 try again later")
+                elif "unknown" in command:
+                    self.reply("550 no such user")
+                else:
+                    recipients.append(command)
+                    self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 end with .")
+                data = b""
+                while (chunk := self.rfile.readline()) != b".\r\n":
+                    data += chunk
+                self.server.messages.append(message_from_bytes(data))
+                self.reply("250 queued")
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPSinkHandler)
+        self.connections = 0
+        self.messages = []
+
+
+@override_settings(EMAIL_BACKEND=OUTBOX_BACKEND, OUTBOX_DELIVERY_BACKEND=SMTP_BACKEND)
+class OutboxTestCase(TestCase):
+    """Test cases for the outbox email backend and its delivery worker"""
+
+    def setUp(self):
+        """Start a local SMTP sink for each test"""
+        self.sink = SMTPSink()
+        threading.Thread(target=self.sink.serve_forever, daemon=True).start()
+        self.addCleanup(self.sink.server_close)
+        self.addCleanup(self.sink.shutdown)
+
+        smtp_settings = override_settings(
+            EMAIL_HOST="127.0.0.1",
+            EMAIL_PORT=self.sink.server_address[1],
+            EMAIL_USE_TLS=False,
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD="",
+        )
+        smtp_settings.enable()
+        self.addCleanup(smtp_settings.disable)
+
+    def test_send_mail_only_enqueues(self):
+        """send_mail stores the message and opens no SMTP connection"""
+        mail.send_mail(
+            "سلام", "متن پیام", "no-reply@example.com", ["user@example.com"]
+        )
+
+        email = OutboxEmailModel.objects.get()
+        self.assertEqual(email.status, OutboxEmailModel.Status.PENDING)
+        self.assertEqual(email.recipients, ["user@example.com"])
+        self.assertEqual(self.sink.connections, 0)
+
+    def test_drain_reuses_one_connection(self):
+        """A whole backlog is delivered over a single SMTP session"""
+        for index in range(7):
+            mail.send_mail(
+                f"Subject {index}",
+                "Body",
+                "no-reply@example.com",
+                [f"user{index}@example.com"],
+            )
+
+        self.assertEqual(drain_outbox(batch_size=3), 7)
+
+        self.assertEqual(self.sink.connections, 1)
+        self.assertEqual(len(self.sink.messages), 7)
+        self.assertEqual(self.sink.messages[0]["Subject"], "Subject 0")
+        self.assertFalse(
+            OutboxEmailModel.objects.exclude(status=OutboxEmailModel.Status.SENT).exists()
+        )
+
+    def test_failures_are_retried_with_backoff(self):
+        """Rejected emails are rescheduled, then marked as failed"""
+        mail.send_mail("Hi", "Body", "no-reply@example.com", ["bounce@example.com"])
+        mail.send_mail("Hi", "Body", "no-reply@example.com", ["ok@example.com"])
+
+        with self.assertLogs("email_v1", level="WARNING"):
+            self.assertEqual(drain_outbox(), 1)
+
+        email = OutboxEmailModel.objects.get(recipients=["bounce@example.com"])
+        self.assertEqual(email.status, OutboxEmailModel.Status.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn("451", email.last_error)
+        self.assertGreater(email.next_attempt_at, email.created_at)
+
+        # Not due yet, nothing is sent
+        self.assertEqual(drain_outbox(), 0)
+
+        with override_settings(OUTBOX_MAX_ATTEMPTS=2), self.assertLogs(
+            "email_v1", level="ERROR"
+        ):
+            OutboxEmailModel.objects.filter(pk=email.pk).update(
+                next_attempt_at=email.created_at
+            )
+            drain_outbox()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmailModel.Status.FAILED)
+
+    def test_refused_recipients_are_recorded(self):
+        """Partially refused emails retry only the temporarily refused recipients"""
+        mail.send_mail(
+            "Hi",
+            "Body",
+            "no-reply@example.com",
+            ["ok@example.com", "bounce@example.com", "unknown@example.com"],
+        )
+
+        with self.assertLogs("email_v1", level="WARNING"):
+            self.assertEqual(drain_outbox(), 0)
+
+        email = OutboxEmailModel.objects.get()
+        self.assertEqual(len(self.sink.messages), 1)
+        self.assertEqual(email.status, OutboxEmailModel.Status.PENDING)
+        self.assertEqual(email.recipients, ["bounce@example.com"])
+        self.assertEqual(email.refused_recipients, ["unknown@example.com"])
+        self.assertIn("550", email.last_error)
+
+        OutboxEmailModel.objects.filter(pk=email.pk).update(
+            recipients=["unknown@example.com"], next_attempt_at=email.created_at
+        )
+        with self.assertLogs("email_v1", level="ERROR"):
+            drain_outbox()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmailModel.Status.FAILED)
+
+    def test_worker_command(self):
+        """The send_outbox command drains the queue once"""
+        mail.send_mail("Hi", "Body", "no-reply@example.com", ["user@example.com"])
+
+        call_command("send_outbox", verbosity=0)
+
+        self.assertEqual(len(self.sink.messages), 1)
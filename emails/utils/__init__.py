@@ -0,0 +1,7 @@
+from .outbox_utils import (
+    drain_outbox,
+    deliver_batch,
+    claim_due_emails,
+    get_retry_delay,
+    OutboxEmailMessage,
+)
@@ -0,0 +1,215 @@
+import smtplib
+from datetime import timedelta
+from logging import getLogger
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+from emails.models import OutboxEmailModel
+from django.core.mail.message import sanitize_address
+from django.core.mail import EmailMessage, get_connection
+
+logger = getLogger("email_v1")
+
+# How long a claimed email stays invisible to other workers while being sent
+CLAIM_LEASE = timedelta(minutes=5)
+
+
+class RawMessage:
+    """
+    Stands in for the MIME object returned by EmailMessage.message(),
+    replaying the bytes stored in the outbox unchanged.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def as_bytes(self, unixfrom=False, linesep="\n"):
+        return self.raw.replace(b"\r\n", b"\n").replace(b"\n", linesep.encode())
+
+    def as_string(self, unixfrom=False, linesep="\n"):
+        return self.as_bytes(linesep=linesep).decode("utf-8", "replace")
+
+
+class OutboxEmailMessage(EmailMessage):
+    """An already rendered email loaded back from the outbox."""
+
+    def __init__(self, outbox_email):
+        super().__init__(
+            from_email=outbox_email.from_email, to=list(outbox_email.recipients)
+        )
+        self.raw = bytes(outbox_email.message)
+
+    def message(self):
+        return RawMessage(self.raw)
+
+
+def get_retry_delay(attempts):
+    """Exponential backoff: 1, 2, 4, 8... minutes, capped at OUTBOX_MAX_RETRY_DELAY."""
+    seconds = settings.OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.OUTBOX_MAX_RETRY_DELAY))
+
+
+def claim_due_emails(batch_size):
+    """
+    Claims up to `batch_size` due emails by pushing their next attempt past
+    the lease, so concurrent workers never pick the same rows.
+    """
+    with transaction.atomic():
+        emails = list(
+            OutboxEmailModel.objects.select_for_update(skip_locked=True)
+            .filter(
+                status=OutboxEmailModel.Status.PENDING, next_attempt_at__lte=now()
+            )
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        OutboxEmailModel.objects.filter(pk__in=[email.pk for email in emails]).update(
+            next_attempt_at=now() + CLAIM_LEASE
+        )
+
+    return emails
+
+
+def send_outbox_email(connection, email):
+    """
+    Sends an outbox email and returns the recipients the server refused,
+    as a `{address: (code, message)}` dict.
+
+    Django's SMTP backend drops the refusals of a partially accepted
+    message, so SMTP sessions are driven directly; other backends either
+    accept every recipient or raise.
+    """
+    message = OutboxEmailMessage(email)
+    smtp = getattr(connection, "connection", None)
+
+    if not isinstance(smtp, smtplib.SMTP):
+        connection.send_messages([message])
+        return {}
+
+    encoding = message.encoding or settings.DEFAULT_CHARSET
+    addresses = {
+        sanitize_address(address, encoding): address for address in email.recipients
+    }
+
+    try:
+        refused = smtp.sendmail(
+            sanitize_address(email.from_email, encoding),
+            list(addresses),
+            message.message().as_bytes(linesep="\r\n"),
+        )
+    except smtplib.SMTPRecipientsRefused as error:
+        refused = error.recipients
+
+    return {addresses.get(address, address): reply for address, reply in refused.items()}
+
+
+def schedule_retry(email):
+    """Reschedules a failed email with backoff, or fails it after OUTBOX_MAX_ATTEMPTS."""
+    if email.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+        email.status = OutboxEmailModel.Status.FAILED
+        logger.error(
+            f"Email {email.pk} to {email.recipients} failed permanently "
+            f"after {email.attempts} attempts: {email.last_error}"
+        )
+    else:
+        email.next_attempt_at = now() + get_retry_delay(email.attempts)
+        logger.warning(
+            f"Email {email.pk} to {email.recipients} failed "
+            f"(attempt {email.attempts}), retrying at "
+            f"{email.next_attempt_at}: {email.last_error}"
+        )
+
+
+def deliver_batch(connection, emails):
+    """
+    Sends a batch of outbox emails over an already open connection and
+    records the outcome of each one. Returns the number of emails sent.
+
+    Recipients refused temporarily (4xx) are retried on their own, those
+    refused permanently (5xx) are recorded in `refused_recipients`.
+    """
+    sent = []
+    failed = []
+
+    try:
+        for email in emails:
+            email.attempts += 1
+
+            try:
+                refused = send_outbox_email(connection, email)
+            except Exception as error:
+                email.last_error = f"{type(error).__name__}: {error}"
+                schedule_retry(email)
+                failed.append(email)
+
+                # The SMTP session may be unusable after an error, start a fresh one
+                connection.close()
+                connection.open()
+                continue
+
+            retried = [address for address, (code, _) in refused.items() if code < 500]
+            email.refused_recipients += [
+                address for address in refused if address not in retried
+            ]
+
+            if refused:
+                email.last_error = "Refused recipients: " + ", ".join(
+                    f"{address} ({code} {reply!r})"
+                    for address, (code, reply) in refused.items()
+                )
+
+            if retried:
+                email.recipients = retried
+                schedule_retry(email)
+                failed.append(email)
+            elif len(refused) == len(email.recipients):
+                email.status = OutboxEmailModel.Status.FAILED
+                logger.error(f"Email {email.pk}: {email.last_error}")
+                failed.append(email)
+            else:
+                email.status = OutboxEmailModel.Status.SENT
+                email.sent_at = now()
+                sent.append(email)
+    finally:
+        # Emails left unattempted keep their lease and are retried once it expires
+        OutboxEmailModel.objects.bulk_update(
+            sent + failed,
+            [
+                "status",
+                "recipients",
+                "attempts",
+                "last_error",
+                "refused_recipients",
+                "next_attempt_at",
+                "sent_at",
+            ],
+        )
+
+    if sent:
+        logger.info(f"Sent {len(sent)} email(s) from the outbox")
+
+    return len(sent)
+
+
+def drain_outbox(connection=None, batch_size=None):
+    """
+    Delivers every due outbox email in batches over a single connection.
+    Returns the number of emails sent.
+    """
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    connection = connection or get_connection(settings.OUTBOX_DELIVERY_BACKEND)
+    total = 0
+
+    emails = claim_due_emails(batch_size)
+
+    if not emails:
+        return 0
+
+    connection.open()
+    try:
+        while emails:
+            total += deliver_batch(connection, emails)
+            emails = claim_due_emails(batch_size)
+    finally:
+        connection.close()
+
+    return total
@@ -0,0 +1 @@
+from .menu_admin import RestaurantAdmin, CategoryAdmin, ProductAdmin
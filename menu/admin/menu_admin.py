@@ -0,0 +1,49 @@
+from django.contrib import admin
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+
+
+@admin.register(RestaurantModel)
+class RestaurantAdmin(admin.ModelAdmin):
+    model = RestaurantModel
+
+    list_display = ["name", "owner", "is_active", "updated_at", "created_at"]
+    list_filter = ["is_active"]
+    search_fields = ["name", "owner__username"]
+    list_select_related = ["owner"]
+    raw_id_fields = ["owner"]
+
+    readonly_fields = ["id", "updated_at", "created_at"]
+
+
+@admin.register(CategoryModel)
+class CategoryAdmin(admin.ModelAdmin):
+    model = CategoryModel
+
+    list_display = ["name", "restaurant", "position", "is_active", "updated_at"]
+    list_filter = ["is_active"]
+    search_fields = ["name", "restaurant__name"]
+    list_select_related = ["restaurant"]
+    raw_id_fields = ["restaurant"]
+
+    readonly_fields = ["id", "updated_at", "created_at"]
+
+
+@admin.register(ProductModel)
+class ProductAdmin(admin.ModelAdmin):
+    model = ProductModel
+
+    list_display = [
+        "name",
+        "category",
+        "restaurant",
+        "price",
+        "position",
+        "is_available",
+        "updated_at",
+    ]
+    list_filter = ["is_available"]
+    search_fields = ["name", "category__name", "restaurant__name"]
+    list_select_related = ["category", "restaurant"]
+    raw_id_fields = ["category"]
+
+    readonly_fields = ["id", "restaurant", "updated_at", "created_at"]
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class MenuConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'menu'
+
+    def ready(self):
+        # Connect the signal handlers that keep the menu documents fresh
+        from menu import signals  # noqa: F401
@@ -0,0 +1,86 @@
+import json
+import time
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.core.management.base import BaseCommand
+from utils.middleware import CompressionMiddleware
+from utils.compression import build_compressed_payload, compressed_payload_response
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the CPU time per request of serving a menu document "
+        "compressed on every request versus from a pre-compressed cached payload."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--categories", type=int, default=10)
+        parser.add_argument("--products", type=int, default=20, help="Per category")
+        parser.add_argument("--requests", type=int, default=2000)
+
+    def build_body(self, categories, products):
+        """Builds a synthetic menu document shaped like the real one."""
+        document = {
+            "id": "00000000-0000-0000-0000-000000000000",
+            "name": "کافه نمونه",
+            "description": "منوی آزمایشی برای سنجش فشرده‌سازی",
+            "categories": [
+                {
+                    "id": f"category-{c}",
+                    "name": f"دسته‌بندی {c}",
+                    "description": "نوشیدنی‌های گرم و سرد",
+                    "products": [
+                        {
+                            "id": f"product-{c}-{p}",
+                            "name": f"محصول {p}",
+                            "description": "توضیحات کوتاه محصول با مواد اولیه تازه",
+                            "price": f"{(p + 1) * 15000}.00",
+                            "image": f"/media/products/photo-{c}-{p}.jpg",
+                            "imageSrcset": None,
+                            "isAvailable": p % 7 != 0,
+                        }
+                        for p in range(products)
+                    ],
+                }
+                for c in range(categories)
+            ],
+        }
+        return json.dumps(document, ensure_ascii=False).encode("utf-8")
+
+    def measure(self, handler, request, count):
+        """Returns the CPU microseconds per request and the response size."""
+        response = handler(request)
+        start = time.process_time()
+        for _ in range(count):
+            handler(request)
+        elapsed = time.process_time() - start
+        return elapsed / count * 1_000_000, len(response.content)
+
+    def handle(self, *args, **options):
+        body = self.build_body(options["categories"], options["products"])
+        payload = build_compressed_payload(body)
+
+        on_the_fly = CompressionMiddleware(
+            lambda request: HttpResponse(body, content_type="application/json")
+        )
+        precompressed = CompressionMiddleware(
+            lambda request: compressed_payload_response(request, payload)
+        )
+
+        factory = RequestFactory()
+        identity_request = factory.get("/")
+        gzip_request = factory.get("/", HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+
+        scenarios = [
+            ("identity (no gzip)", on_the_fly, identity_request),
+            ("gzip on every request", on_the_fly, gzip_request),
+            ("pre-compressed cache", precompressed, gzip_request),
+        ]
+
+        self.stdout.write(
+            f"Document: {len(body)} bytes, {options['requests']} requests per scenario"
+        )
+
+        for name, handler, request in scenarios:
+            cpu, size = self.measure(handler, request, options["requests"])
+            self.stdout.write(f"{name:<24} {cpu:>10.1f} µs/request {size:>10} bytes")
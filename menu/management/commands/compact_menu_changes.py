@@ -0,0 +1,23 @@
+from django.conf import settings
+from menu.utils import compact_menu_changes
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Drops the old tombstones of the menu change log. Clients that last "
+        "synced before them get a full menu snapshot on their next sync."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.MENU_CHANGES_RETENTION,
+            help="Keep the tombstones of the last DAYS days.",
+        )
+
+    def handle(self, *args, **options):
+        count = compact_menu_changes(options["days"])
+
+        self.stdout.write(f"Dropped {count} tombstones.")
@@ -0,0 +1,28 @@
+import time
+from menu.utils import rebuild_search_index
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the menu search entries from the categories and products, "
+        "e.g. after bulk imports that bypassed the model signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--restaurant",
+            action="append",
+            dest="restaurants",
+            help="Restaurant id to reindex (repeatable, all restaurants by default).",
+        )
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        count = rebuild_search_index(options["restaurants"], options["batch_size"])
+
+        self.stdout.write(
+            f"Indexed {count} categories and products "
+            f"in {time.perf_counter() - started:.1f}s."
+        )
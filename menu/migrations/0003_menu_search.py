@@ -0,0 +1,101 @@
+# Generated by Django 5.1.7 on 2026-10-19 17:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE menu_search_fts USING fts5(
+        name, description, restaurant_id,
+        content='menu_menusearchentrymodel', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='1 2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER menu_search_fts_insert AFTER INSERT ON menu_menusearchentrymodel BEGIN
+        INSERT INTO menu_search_fts(rowid, name, description, restaurant_id)
+        VALUES (new.id, new.name, new.description, new.restaurant_id);
+    END
+    """,
+    """
+    CREATE TRIGGER menu_search_fts_delete AFTER DELETE ON menu_menusearchentrymodel BEGIN
+        INSERT INTO menu_search_fts(menu_search_fts, rowid, name, description, restaurant_id)
+        VALUES ('delete', old.id, old.name, old.description, old.restaurant_id);
+    END
+    """,
+    """
+    CREATE TRIGGER menu_search_fts_update AFTER UPDATE OF name, description, restaurant_id
+    ON menu_menusearchentrymodel BEGIN
+        INSERT INTO menu_search_fts(menu_search_fts, rowid, name, description, restaurant_id)
+        VALUES ('delete', old.id, old.name, old.description, old.restaurant_id);
+        INSERT INTO menu_search_fts(rowid, name, description, restaurant_id)
+        VALUES (new.id, new.name, new.description, new.restaurant_id);
+    END
+    """,
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER menu_search_fts_update",
+    "DROP TRIGGER menu_search_fts_delete",
+    "DROP TRIGGER menu_search_fts_insert",
+    "DROP TABLE menu_search_fts",
+]
+
+POSTGRESQL_FORWARD = [
+    """
+    ALTER TABLE menu_menusearchentrymodel ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', name), 'A')
+        || setweight(to_tsvector('simple', description), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX menu_search_vector_idx ON menu_menusearchentrymodel
+    USING GIN (search_vector)
+    """,
+]
+POSTGRESQL_BACKWARD = [
+    "DROP INDEX menu_search_vector_idx",
+    "ALTER TABLE menu_menusearchentrymodel DROP COLUMN search_vector",
+]
+
+
+def run_vendor_sql(statements):
+    """Runs the statements of the current database vendor, if any."""
+
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0002_product_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MenuSearchEntryModel',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('category', 'Category'), ('product', 'Product')], max_length=10)),
+                ('object_id', models.UUIDField(unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True, default='')),
+                ('is_visible', models.BooleanField(default=True)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_entries', to='menu.categorymodel')),
+                ('restaurant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_entries', to='menu.restaurantmodel')),
+            ],
+            options={
+                'verbose_name': 'menu search entry',
+                'verbose_name_plural': 'menu search entries',
+            },
+        ),
+        # Other databases fall back to unindexed lookups (see search_menu)
+        migrations.RunPython(
+            run_vendor_sql({"sqlite": SQLITE_FORWARD, "postgresql": POSTGRESQL_FORWARD}),
+            run_vendor_sql({"sqlite": SQLITE_BACKWARD, "postgresql": POSTGRESQL_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.7 on 2026-10-19 18:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0003_menu_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='categorymodel',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='productmodel',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='restaurantmodel',
+            name='menu_compacted_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='restaurantmodel',
+            name='menu_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.CreateModel(
+            name='MenuChangeModel',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('restaurant', 'Restaurant'), ('category', 'Category'), ('product', 'Product')], max_length=10)),
+                ('object_id', models.UUIDField(unique=True)),
+                ('version', models.PositiveBigIntegerField()),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('changed_at', models.DateTimeField(auto_now=True)),
+                ('restaurant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='menu_changes', to='menu.restaurantmodel')),
+            ],
+            options={
+                'verbose_name': 'menu change',
+                'verbose_name_plural': 'menu changes',
+                'indexes': [models.Index(fields=['restaurant', 'version'], name='menu_change_version_idx')],
+            },
+        ),
+    ]
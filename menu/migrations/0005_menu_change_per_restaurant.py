@@ -0,0 +1,22 @@
+# Generated by Django 5.1.7 on 2026-10-19 19:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0004_menu_changes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='menuchangemodel',
+            name='object_id',
+            field=models.UUIDField(),
+        ),
+        migrations.AddConstraint(
+            model_name='menuchangemodel',
+            constraint=models.UniqueConstraint(fields=('restaurant', 'object_id'), name='menu_change_object_uniq'),
+        ),
+    ]
@@ -0,0 +1,5 @@
+from .restaurant_model import RestaurantModel
+from .category_model import CategoryModel
+from .product_model import ProductModel
+from .menu_search_entry_model import MenuSearchEntryModel
+from .menu_change_model import MenuChangeModel
@@ -0,0 +1,98 @@
+import uuid
+from django.db import models, transaction
+from menu.models.restaurant_model import RestaurantModel
+
+
+class CategoryModel(models.Model):
+    """
+    A menu category (e.g. "Hot Drinks") grouping the products of a restaurant.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    restaurant = models.ForeignKey(
+        RestaurantModel,
+        on_delete=models.CASCADE,
+        related_name="categories",
+    )
+
+    name = models.CharField(max_length=100)
+    description = models.TextField(blank=True, default="")
+
+    # Display order inside the restaurant menu (lower comes first)
+    position = models.PositiveIntegerField(default=0)
+
+    # Inactive categories (and their products) are hidden from the public menu
+    is_active = models.BooleanField(default=True)
+
+    # Menu version of the restaurant at the last change (see MenuChangeModel)
+    version = models.PositiveBigIntegerField(default=0, editable=False)
+
+    # Timestamps for category creation and last update
+    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Meta class for the CategoryModel.
+        """
+
+        verbose_name = "category"
+        verbose_name_plural = "categories"
+        ordering = ("position", "created_at")
+
+    def __str__(self):
+        """
+        String representation of the category.
+        """
+        return self.name
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Restaurant and state the category was loaded with, to detect moves
+        # and (de)activations on save
+        instance._loaded_restaurant_id = instance.__dict__.get("restaurant_id")
+        instance._loaded_is_active = instance.__dict__.get("is_active")
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Give the change the next menu version of the restaurant. A category
+        moved to another restaurant takes its products along, and keeps the
+        restaurant it left in `previous_restaurant_id` during the save signals.
+        Likewise, `previous_is_active` holds the state of a category being
+        activated or deactivated.
+        """
+        update_fields = kwargs.get("update_fields")
+        loaded_restaurant_id = getattr(self, "_loaded_restaurant_id", None)
+        loaded_is_active = getattr(self, "_loaded_is_active", None)
+
+        self.previous_restaurant_id = None
+        if loaded_restaurant_id not in (None, self.restaurant_id) and (
+            update_fields is None or "restaurant" in update_fields
+        ):
+            self.previous_restaurant_id = loaded_restaurant_id
+
+        self.previous_is_active = None
+        if loaded_is_active not in (None, self.is_active) and (
+            update_fields is None or "is_active" in update_fields
+        ):
+            self.previous_is_active = loaded_is_active
+
+        with transaction.atomic():
+            if update_fields is None or update_fields:
+                self.version = RestaurantModel.next_menu_version(self.restaurant_id)
+            if update_fields:
+                kwargs["update_fields"] = {*update_fields, "version"}
+
+            # Moved before the save signals, which see the products in place
+            if self.previous_restaurant_id is not None:
+                self.products.update(restaurant_id=self.restaurant_id, version=self.version)
+
+            super().save(*args, **kwargs)
+
+        self._loaded_restaurant_id = self.restaurant_id
+        self._loaded_is_active = self.is_active
+        self.previous_restaurant_id = None
+        self.previous_is_active = None
@@ -0,0 +1,62 @@
+from django.db import models
+from menu.models.restaurant_model import RestaurantModel
+
+
+class MenuChangeModel(models.Model):
+    """
+    Change log of the restaurant menus, read by the delta sync endpoint.
+
+    Holds the last change of every restaurant, category and product per
+    restaurant: an upsert, or a tombstone once the object is deleted or
+    moved to another restaurant. Tombstones are kept until compacted (see
+    `compact_menu_changes`).
+    """
+
+    class Kind(models.TextChoices):
+        RESTAURANT = "restaurant", "Restaurant"
+        CATEGORY = "category", "Category"
+        PRODUCT = "product", "Product"
+
+    id = models.BigAutoField(primary_key=True)
+
+    restaurant = models.ForeignKey(
+        RestaurantModel,
+        on_delete=models.CASCADE,
+        related_name="menu_changes",
+    )
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    object_id = models.UUIDField()
+
+    # Menu version of the restaurant when the object last changed
+    version = models.PositiveBigIntegerField()
+
+    # Tombstone of a deleted category or product
+    is_deleted = models.BooleanField(default=False)
+
+    changed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Meta class for the MenuChangeModel.
+        """
+
+        verbose_name = "menu change"
+        verbose_name_plural = "menu changes"
+        indexes = [
+            models.Index(
+                fields=["restaurant", "version"], name="menu_change_version_idx"
+            ),
+        ]
+        constraints = [
+            # Target of the upserts made by record_menu_changes
+            models.UniqueConstraint(
+                fields=["restaurant", "object_id"], name="menu_change_object_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the menu change.
+        """
+        return f"{self.kind} {self.object_id} @ {self.version}"
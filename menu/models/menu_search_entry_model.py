@@ -0,0 +1,57 @@
+from django.db import models
+from menu.models.category_model import CategoryModel
+from menu.models.restaurant_model import RestaurantModel
+
+
+class MenuSearchEntryModel(models.Model):
+    """
+    Normalized searchable text of a category or product.
+
+    The full-text index itself is maintained by the database: an FTS5
+    table fed by triggers on SQLite, a generated tsvector column with a GIN
+    index on PostgreSQL (see the 0003_menu_search migration).
+    """
+
+    class Kind(models.TextChoices):
+        CATEGORY = "category", "Category"
+        PRODUCT = "product", "Product"
+
+    # Integer key, doubles as the FTS5 rowid
+    id = models.BigAutoField(primary_key=True)
+
+    restaurant = models.ForeignKey(
+        RestaurantModel,
+        on_delete=models.CASCADE,
+        related_name="search_entries",
+    )
+
+    # The category itself, or the category of the product
+    category = models.ForeignKey(
+        CategoryModel,
+        on_delete=models.CASCADE,
+        related_name="search_entries",
+    )
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    object_id = models.UUIDField(unique=True)
+
+    # Normalized with normalize_persian_text
+    name = models.CharField(max_length=100)
+    description = models.TextField(blank=True, default="")
+
+    # False while the category is inactive (hidden from the public menu)
+    is_visible = models.BooleanField(default=True)
+
+    class Meta:
+        """
+        Meta class for the MenuSearchEntryModel.
+        """
+
+        verbose_name = "menu search entry"
+        verbose_name_plural = "menu search entries"
+
+    def __str__(self):
+        """
+        String representation of the search entry.
+        """
+        return f"{self.kind}: {self.name}"
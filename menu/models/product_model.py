@@ -0,0 +1,101 @@
+import uuid
+from django.db import models, transaction
+from django_cleanup import cleanup
+from menu.models.category_model import CategoryModel
+from menu.models.restaurant_model import RestaurantModel
+
+
+@cleanup.select
+class ProductModel(models.Model):
+    """
+    A product (dish, drink, ...) listed under a menu category.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    category = models.ForeignKey(
+        CategoryModel,
+        on_delete=models.CASCADE,
+        related_name="products",
+    )
+
+    # Denormalized from the category so restaurant-wide lookups need no join
+    restaurant = models.ForeignKey(
+        RestaurantModel,
+        on_delete=models.CASCADE,
+        related_name="products",
+        editable=False,
+    )
+
+    name = models.CharField(max_length=100)
+    description = models.TextField(blank=True, default="")
+    price = models.DecimalField(max_digits=12, decimal_places=2)
+    image = models.ImageField(upload_to="products/", blank=True, null=True)
+
+    # Resized WebP/JPEG copies of the image, generated in the background
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+
+    # Display order inside the category (lower comes first)
+    position = models.PositiveIntegerField(default=0)
+
+    # Unavailable products stay on the menu but are flagged as sold out
+    is_available = models.BooleanField(default=True)
+
+    # Menu version of the restaurant at the last change (see MenuChangeModel)
+    version = models.PositiveBigIntegerField(default=0, editable=False)
+
+    # Timestamps for product creation and last update
+    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Meta class for the ProductModel.
+        """
+
+        verbose_name = "product"
+        verbose_name_plural = "products"
+        ordering = ("position", "created_at")
+
+    def __str__(self):
+        """
+        String representation of the product.
+        """
+        return self.name
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Restaurant the product was loaded with, to detect moves on save
+        instance._loaded_restaurant_id = instance.__dict__.get("restaurant_id")
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Keep the denormalized restaurant in sync with the category, and
+        version the change. A product moved to a category of another
+        restaurant keeps the restaurant it left in `previous_restaurant_id`
+        during the save signals.
+        """
+        update_fields = kwargs.get("update_fields")
+        loaded_restaurant_id = getattr(self, "_loaded_restaurant_id", None)
+
+        if update_fields is None or "category" in update_fields:
+            self.restaurant_id = self.category.restaurant_id
+            if update_fields:
+                update_fields = {*update_fields, "restaurant"}
+
+        self.previous_restaurant_id = None
+        if loaded_restaurant_id not in (None, self.restaurant_id):
+            self.previous_restaurant_id = loaded_restaurant_id
+
+        with transaction.atomic():
+            if update_fields is None or update_fields:
+                self.version = RestaurantModel.next_menu_version(self.restaurant_id)
+            if update_fields:
+                kwargs["update_fields"] = {*update_fields, "version"}
+
+            super().save(*args, **kwargs)
+
+        self._loaded_restaurant_id = self.restaurant_id
+        self.previous_restaurant_id = None
@@ -0,0 +1,78 @@
+import uuid
+from django.db import models
+from django.conf import settings
+from django.db.models import F
+
+# Only ever advanced with atomic updates, never written by save()
+MENU_VERSION_FIELDS = {"menu_version", "menu_compacted_version"}
+
+
+class RestaurantModel(models.Model):
+    """
+    A restaurant or coffee shop whose menu is published through the API.
+    Every restaurant belongs to a single owner (a UserModel instance).
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    # The user who manages this restaurant's menu
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="restaurants",
+    )
+
+    name = models.CharField(max_length=100)
+    description = models.TextField(blank=True, default="")
+
+    # Inactive restaurants are hidden from the public menu endpoint
+    is_active = models.BooleanField(default=True)
+
+    # Last version given to a change of this menu (see MenuChangeModel)
+    menu_version = models.PositiveBigIntegerField(default=0, editable=False)
+
+    # Tombstones up to this version were compacted away from the change log
+    menu_compacted_version = models.PositiveBigIntegerField(default=0, editable=False)
+
+    # Timestamps for restaurant creation and last update
+    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Meta class for the RestaurantModel.
+        """
+
+        verbose_name = "restaurant"
+        verbose_name_plural = "restaurants"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        """
+        String representation of the restaurant.
+        """
+        return self.name
+
+    def save(self, *args, **kwargs):
+        """Never overwrite the menu versions with the (possibly stale) loaded values."""
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in MENU_VERSION_FIELDS
+            ]
+
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def next_menu_version(cls, restaurant_id):
+        """
+        Allocates the next menu version of a restaurant.
+
+        Must run in the transaction writing the change: the row lock taken
+        by the update makes concurrent writers of a menu commit in version
+        order, so clients never skip a version committed late.
+        """
+        cls.objects.filter(pk=restaurant_id).update(menu_version=F("menu_version") + 1)
+
+        return cls.objects.values_list("menu_version", flat=True).get(pk=restaurant_id)
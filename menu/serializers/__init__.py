@@ -0,0 +1,4 @@
+from .restaurant_serializer import RestaurantSerializer
+from .category_serializer import CategorySerializer
+from .product_serializer import ProductSerializer
+from .product_bulk_update_serializer import ProductChangeSerializer, ProductBulkUpdateSerializer
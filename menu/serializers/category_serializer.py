@@ -0,0 +1,39 @@
+from rest_framework import serializers
+from menu.models import CategoryModel, RestaurantModel
+
+
+class CategorySerializer(serializers.ModelSerializer):
+    """Serializer for managing the menu categories of the authenticated owner."""
+
+    restaurant = serializers.PrimaryKeyRelatedField(
+        queryset=RestaurantModel.objects.all()
+    )
+
+    isActive = serializers.BooleanField(source="is_active", required=False)
+
+    updatedAt = serializers.DateTimeField(source="updated_at", read_only=True)
+    createdAt = serializers.DateTimeField(source="created_at", read_only=True)
+
+    class Meta:
+        model = CategoryModel
+        fields = [
+            "id",
+            "restaurant",
+            "name",
+            "description",
+            "position",
+            "isActive",
+            "createdAt",
+            "updatedAt",
+        ]
+
+        read_only_fields = ["id"]
+
+    def validate_restaurant(self, restaurant):
+        """Owners can only add categories to their own restaurants."""
+        request = self.context.get("request")
+
+        if request is None or restaurant.owner_id != request.user.pk:
+            raise serializers.ValidationError("رستوران مورد نظر یافت نشد.")
+
+        return restaurant
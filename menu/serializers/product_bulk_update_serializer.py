@@ -0,0 +1,65 @@
+from django.conf import settings
+from rest_framework import serializers
+
+
+class ProductChangeSerializer(serializers.Serializer):
+    """Serializer for one product change of a bulk update."""
+
+    id = serializers.UUIDField()
+
+    name = serializers.CharField(max_length=100, required=False)
+    description = serializers.CharField(allow_blank=True, required=False)
+    price = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    position = serializers.IntegerField(min_value=0, required=False)
+
+    isAvailable = serializers.BooleanField(source="is_available", required=False)
+
+    def validate_price(self, price):
+        """Prices cannot be negative."""
+        if price < 0:
+            raise serializers.ValidationError("قیمت نمی‌تواند منفی باشد.")
+
+        return price
+
+    def validate(self, attrs):
+        """Every change must update at least one field."""
+        if len(attrs) < 2:
+            raise serializers.ValidationError("حداقل یک فیلد را برای ویرایش وارد کنید.")
+
+        return attrs
+
+
+class ProductBulkUpdateSerializer(serializers.Serializer):
+    """
+    Serializer for a batch of product changes, capped at
+    MENU_BULK_UPDATE_MAX items. Errors are reported per item, in order.
+    """
+
+    products = ProductChangeSerializer(
+        many=True, allow_empty=False, max_length=settings.MENU_BULK_UPDATE_MAX
+    )
+
+    def validate_products(self, products):
+        """Owners can only update their own products, each one once."""
+        # Only checks access: bulk_update_products reads the rows again, locked
+        found = self.context["queryset"].in_bulk([change["id"] for change in products])
+        errors = []
+        seen = set()
+
+        for change in products:
+            if change["id"] in seen:
+                errors.append({"id": ["این محصول بیش از یک بار تکرار شده است."]})
+            elif change["id"] not in found:
+                errors.append({"id": ["محصول مورد نظر یافت نشد."]})
+            else:
+                errors.append({})
+
+            seen.add(change["id"])
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        return [
+            (found[change["id"]], {k: v for k, v in change.items() if k != "id"})
+            for change in products
+        ]
@@ -0,0 +1,58 @@
+from rest_framework import serializers
+from menu.utils import get_image_srcset
+from menu.models import ProductModel, CategoryModel
+
+
+class ProductSerializer(serializers.ModelSerializer):
+    """Serializer for managing the menu products of the authenticated owner."""
+
+    category = serializers.PrimaryKeyRelatedField(
+        queryset=CategoryModel.objects.all()
+    )
+    restaurant = serializers.PrimaryKeyRelatedField(read_only=True)
+
+    isAvailable = serializers.BooleanField(source="is_available", required=False)
+
+    # Responsive image URLs, null until the background resizing has finished
+    imageSrcset = serializers.SerializerMethodField()
+
+    updatedAt = serializers.DateTimeField(source="updated_at", read_only=True)
+    createdAt = serializers.DateTimeField(source="created_at", read_only=True)
+
+    class Meta:
+        model = ProductModel
+        fields = [
+            "id",
+            "category",
+            "restaurant",
+            "name",
+            "description",
+            "price",
+            "image",
+            "imageSrcset",
+            "position",
+            "isAvailable",
+            "createdAt",
+            "updatedAt",
+        ]
+
+        read_only_fields = ["id"]
+
+    def get_imageSrcset(self, product):
+        return get_image_srcset(product)
+
+    def validate_category(self, category):
+        """Owners can only add products to their own categories."""
+        request = self.context.get("request")
+
+        if request is None or category.restaurant.owner_id != request.user.pk:
+            raise serializers.ValidationError("دسته‌بندی مورد نظر یافت نشد.")
+
+        return category
+
+    def validate_price(self, price):
+        """Prices cannot be negative."""
+        if price < 0:
+            raise serializers.ValidationError("قیمت نمی‌تواند منفی باشد.")
+
+        return price
@@ -0,0 +1,24 @@
+from rest_framework import serializers
+from menu.models import RestaurantModel
+
+
+class RestaurantSerializer(serializers.ModelSerializer):
+    """Serializer for managing the restaurants of the authenticated owner."""
+
+    isActive = serializers.BooleanField(source="is_active", required=False)
+
+    updatedAt = serializers.DateTimeField(source="updated_at", read_only=True)
+    createdAt = serializers.DateTimeField(source="created_at", read_only=True)
+
+    class Meta:
+        model = RestaurantModel
+        fields = [
+            "id",
+            "name",
+            "description",
+            "isActive",
+            "createdAt",
+            "updatedAt",
+        ]
+
+        read_only_fields = ["id"]
@@ -0,0 +1,6 @@
+from .menu_document_signals import restaurant_changed, menu_item_changed
+from .image_pipeline_signals import product_image_saved, product_image_deleted
+from .menu_search_signals import menu_item_indexed, product_unindexed
+from .menu_push_signals import product_loaded, product_pushed, restaurant_pushed, menu_item_pushed
+from .menu_changes_signals import restaurant_versioned, menu_item_versioned, menu_item_deleted
+from .menu_purge_signals import restaurant_purged, category_purged, product_purged, product_image_purged
@@ -0,0 +1,22 @@
+from django.dispatch import receiver
+from menu.models import ProductModel
+from django.db.models.signals import post_save
+from django_cleanup.signals import cleanup_post_delete
+from menu.utils import schedule_product_image_processing, delete_image_variants
+
+
+@receiver(post_save, sender=ProductModel)
+def product_image_saved(sender, instance, raw=False, **kwargs):
+    """Generate the image variants when a product gets a new image."""
+    if raw or not instance.image:
+        return
+
+    if (instance.image_variants or {}).get("source") != instance.image.name:
+        schedule_product_image_processing(instance.pk, instance.image.name)
+
+
+@receiver(cleanup_post_delete, sender=ProductModel)
+def product_image_deleted(sender, instance, file_name, file, success, **kwargs):
+    """Delete the image variants along with the original image."""
+    if success:
+        delete_image_variants(instance, file_name, file.storage)
@@ -0,0 +1,76 @@
+from django.dispatch import receiver
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from menu.utils import (
+    record_menu_move,
+    record_menu_change,
+    record_menu_changes,
+    record_menu_deletion,
+)
+from menu.models import RestaurantModel, CategoryModel, ProductModel, MenuChangeModel
+
+KINDS = {
+    CategoryModel: MenuChangeModel.Kind.CATEGORY,
+    ProductModel: MenuChangeModel.Kind.PRODUCT,
+}
+
+
+@receiver(post_save, sender=RestaurantModel)
+def restaurant_versioned(sender, instance, raw=False, **kwargs):
+    """Log a change of the restaurant details with a new menu version."""
+    if raw:
+        return
+
+    with transaction.atomic():
+        instance.menu_version = RestaurantModel.next_menu_version(instance.pk)
+        record_menu_change(
+            instance.pk,
+            MenuChangeModel.Kind.RESTAURANT,
+            instance.pk,
+            instance.menu_version,
+        )
+
+
+@receiver(post_save, sender=CategoryModel)
+@receiver(post_save, sender=ProductModel)
+def menu_item_versioned(sender, instance, raw=False, **kwargs):
+    """
+    Log the change of a category or product, versioned by its save(), and
+    a tombstone in the restaurant it moved out of. The products of a moved,
+    activated or deactivated category change along with it.
+    """
+    if raw:
+        return
+
+    record_menu_change(instance.restaurant_id, KINDS[sender], instance.pk, instance.version)
+
+    previous_restaurant_id = getattr(instance, "previous_restaurant_id", None)
+    product_ids = []
+
+    if sender is CategoryModel and (
+        previous_restaurant_id is not None
+        or getattr(instance, "previous_is_active", None) is not None
+    ):
+        product_ids = list(instance.products.values_list("pk", flat=True))
+        record_menu_changes(
+            instance.restaurant_id,
+            MenuChangeModel.Kind.PRODUCT,
+            product_ids,
+            instance.version,
+        )
+
+    if previous_restaurant_id is not None:
+        record_menu_move(previous_restaurant_id, KINDS[sender], instance.pk, product_ids)
+
+
+@receiver(post_delete, sender=CategoryModel)
+@receiver(post_delete, sender=ProductModel)
+def menu_item_deleted(sender, instance, origin=None, **kwargs):
+    """Log a tombstone for a deleted category or product."""
+    # Deleting a restaurant (or its owner) deletes its change log, tombstones included
+    if not isinstance(origin, (CategoryModel, ProductModel)) and getattr(
+        origin, "model", None
+    ) not in KINDS:
+        return
+
+    record_menu_deletion(instance.restaurant_id, KINDS[sender], instance.pk)
@@ -0,0 +1,25 @@
+from django.dispatch import receiver
+from menu.utils import schedule_menu_document_rebuild
+from django.db.models.signals import post_save, post_delete
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+
+
+@receiver(post_save, sender=RestaurantModel)
+@receiver(post_delete, sender=RestaurantModel)
+def restaurant_changed(sender, instance, **kwargs):
+    """Rebuild the menu document when a restaurant is saved or deleted."""
+    schedule_menu_document_rebuild(instance.pk)
+
+
+@receiver(post_save, sender=CategoryModel)
+@receiver(post_delete, sender=CategoryModel)
+@receiver(post_save, sender=ProductModel)
+@receiver(post_delete, sender=ProductModel)
+def menu_item_changed(sender, instance, **kwargs):
+    """Rebuild the menu document when a category or product changes."""
+    schedule_menu_document_rebuild(instance.restaurant_id)
+
+    # The menu an item was moved out of is rebuilt as well
+    previous_restaurant_id = getattr(instance, "previous_restaurant_id", None)
+    if previous_restaurant_id is not None:
+        schedule_menu_document_rebuild(previous_restaurant_id)
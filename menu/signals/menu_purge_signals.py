@@ -0,0 +1,49 @@
+from django.dispatch import receiver
+from utils.purge import schedule_purge, get_media_tag
+from django.db.models.signals import post_save, post_delete
+from django_cleanup.signals import cleanup_post_delete
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+from menu.utils import schedule_menu_purge, get_image_variant_names
+
+
+@receiver(post_save, sender=RestaurantModel)
+@receiver(post_delete, sender=RestaurantModel)
+def restaurant_purged(sender, instance, **kwargs):
+    """Purge the cached menu responses when a restaurant is saved or deleted."""
+    schedule_menu_purge(instance.pk)
+
+
+@receiver(post_save, sender=CategoryModel)
+@receiver(post_delete, sender=CategoryModel)
+def category_purged(sender, instance, **kwargs):
+    """
+    Purge the cached responses showing a category when it changes, and
+    the menu of a restaurant it moved out of.
+    """
+    schedule_menu_purge(instance.restaurant_id, category_ids=[instance.pk])
+
+    previous_restaurant_id = getattr(instance, "previous_restaurant_id", None)
+    if previous_restaurant_id is not None:
+        schedule_menu_purge(previous_restaurant_id)
+
+
+@receiver(post_save, sender=ProductModel)
+@receiver(post_delete, sender=ProductModel)
+def product_purged(sender, instance, **kwargs):
+    """
+    Purge the cached responses showing a product when it changes, and the
+    menu of a restaurant it moved out of.
+    """
+    schedule_menu_purge(instance.restaurant_id, product_ids=[instance.pk])
+
+    previous_restaurant_id = getattr(instance, "previous_restaurant_id", None)
+    if previous_restaurant_id is not None:
+        schedule_menu_purge(previous_restaurant_id)
+
+
+@receiver(cleanup_post_delete, sender=ProductModel)
+def product_image_purged(sender, instance, file_name, success, **kwargs):
+    """Purge a deleted product image, and its variants, from the edge cache."""
+    if success:
+        names = [file_name, *get_image_variant_names(instance, file_name)]
+        schedule_purge(*(get_media_tag(name) for name in names))
@@ -0,0 +1,45 @@
+from django.dispatch import receiver
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+from django.db.models.signals import post_init, post_save, post_delete
+from menu.utils import get_product_delta, schedule_menu_event, remember_tracked_values
+
+
+@receiver(post_init, sender=ProductModel)
+def product_loaded(sender, instance, **kwargs):
+    """Remember the values a product was loaded with, to push what changes."""
+    remember_tracked_values(instance)
+
+
+@receiver(post_save, sender=ProductModel)
+def product_pushed(sender, instance, created, **kwargs):
+    """Push price and availability deltas, or a refetch for other changes."""
+    delta = get_product_delta(instance, created)
+    remember_tracked_values(instance)
+
+    if delta is None:
+        schedule_menu_event(instance.restaurant_id)
+    elif delta:
+        schedule_menu_event(instance.restaurant_id, instance.pk)
+
+    previous_restaurant_id = getattr(instance, "previous_restaurant_id", None)
+    if previous_restaurant_id is not None:
+        schedule_menu_event(previous_restaurant_id)
+
+
+@receiver(post_save, sender=RestaurantModel)
+@receiver(post_delete, sender=RestaurantModel)
+def restaurant_pushed(sender, instance, **kwargs):
+    """Ask the restaurant's live menus to refetch."""
+    schedule_menu_event(instance.pk)
+
+
+@receiver(post_save, sender=CategoryModel)
+@receiver(post_delete, sender=CategoryModel)
+@receiver(post_delete, sender=ProductModel)
+def menu_item_pushed(sender, instance, **kwargs):
+    """Ask the restaurant's live menus (and those of a menu it left) to refetch."""
+    schedule_menu_event(instance.restaurant_id)
+
+    previous_restaurant_id = getattr(instance, "previous_restaurant_id", None)
+    if previous_restaurant_id is not None:
+        schedule_menu_event(previous_restaurant_id)
@@ -0,0 +1,23 @@
+from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
+from menu.models import CategoryModel, ProductModel
+from menu.utils import index_menu_item, unindex_menu_items
+
+# Fields affecting the search entries, saves touching none of them are skipped
+SEARCHABLE_FIELDS = {"name", "description", "is_active", "category", "restaurant"}
+
+
+@receiver(post_save, sender=CategoryModel)
+@receiver(post_save, sender=ProductModel)
+def menu_item_indexed(sender, instance, update_fields=None, **kwargs):
+    """Keep the search entry of a category or product in sync on save."""
+    if update_fields and not SEARCHABLE_FIELDS.intersection(update_fields):
+        return
+
+    index_menu_item(instance)
+
+
+@receiver(post_delete, sender=ProductModel)
+def product_unindexed(sender, instance, **kwargs):
+    """Remove the search entry of a deleted product (categories cascade)."""
+    unindex_menu_items(instance.pk)
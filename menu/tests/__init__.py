@@ -0,0 +1,7 @@
+from .menu_document_test_case import MenuDocumentTestCase
+from .image_pipeline_test_case import ImagePipelineTestCase
+from .menu_search_test_case import MenuSearchTestCase
+from .menu_events_test_case import MenuEventsTestCase, PubSubTestCase
+from .menu_changes_test_case import MenuChangesTestCase
+from .product_bulk_update_test_case import ProductBulkUpdateTestCase
+from .menu_cache_tags_test_case import MenuCacheTagsTestCase
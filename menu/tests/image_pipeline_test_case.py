@@ -0,0 +1,131 @@
+import shutil
+import tempfile
+from io import BytesIO
+from PIL import Image
+from decimal import Decimal
+from django.test import TestCase, override_settings
+from users.models import UserModel
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_image(name="photo.png", size=(2000, 1500), mode="RGBA"):
+    """Returns an uploaded image file of the given size"""
+    buffer = BytesIO()
+    Image.new(mode, size, (200, 100, 50, 255)).save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, IMAGE_PIPELINE_WORKERS=0)
+class ImagePipelineTestCase(TestCase):
+    """Test cases for the product image resizing pipeline"""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        """Create a category to attach products to"""
+        owner = UserModel.objects.create_user(
+            email="owner@example.com",
+            username="owner",
+            password="OwnerPass123!",
+        )
+        restaurant = RestaurantModel.objects.create(owner=owner, name="Cafe")
+        self.category = CategoryModel.objects.create(
+            restaurant=restaurant, name="Cakes"
+        )
+
+    def create_product(self, image):
+        with self.captureOnCommitCallbacks(execute=True):
+            product = ProductModel.objects.create(
+                category=self.category, name="Cake", price=Decimal("10"), image=image
+            )
+        product.refresh_from_db()
+        return product
+
+    def test_variants_are_generated(self):
+        """Every size is generated in WebP and JPEG with content-hashed names"""
+        product = self.create_product(make_image())
+        variants = product.image_variants["variants"]
+
+        self.assertEqual(product.image_variants["source"], product.image.name)
+        self.assertEqual(set(variants), {"thumbnail", "card", "full"})
+
+        for name, width in (("thumbnail", 160), ("card", 480), ("full", 1280)):
+            self.assertEqual(variants[name]["width"], width)
+            for file_format in ("webp", "jpeg"):
+                path = variants[name][file_format]
+                self.assertRegex(path, rf"^products/variants/[0-9a-f]{{16}}-{name}\.")
+                self.assertTrue(default_storage.exists(path))
+
+            with default_storage.open(variants[name]["jpeg"]) as file:
+                self.assertEqual(Image.open(file).size[0], width)
+
+    def test_variant_names_follow_the_configuration(self):
+        """Changing a variant width yields new names instead of reusing stale files"""
+        first = self.create_product(make_image(name="a.png"))
+
+        with override_settings(MENU_IMAGE_VARIANTS={"thumbnail": 160, "card": 640}):
+            second = self.create_product(make_image(name="b.png"))
+
+        first, second = first.image_variants, second.image_variants
+        self.assertEqual(first["digest"], second["digest"])
+        self.assertEqual(
+            first["variants"]["thumbnail"]["webp"], second["variants"]["thumbnail"]["webp"]
+        )
+        self.assertNotEqual(
+            first["variants"]["card"]["webp"], second["variants"]["card"]["webp"]
+        )
+        self.assertEqual(second["variants"]["card"]["width"], 640)
+
+    def test_small_images_are_not_upscaled(self):
+        """Images narrower than a variant keep their original width"""
+        product = self.create_product(make_image(size=(300, 200)))
+        variants = product.image_variants["variants"]
+
+        self.assertEqual(variants["thumbnail"]["width"], 160)
+        self.assertEqual(variants["card"]["width"], 300)
+        self.assertEqual(variants["full"]["width"], 300)
+
+    def test_srcset_is_exposed(self):
+        """The product serializer exposes srcset strings per format"""
+        from menu.serializers import ProductSerializer
+
+        product = self.create_product(make_image())
+        srcset = ProductSerializer(product).data["imageSrcset"]
+
+        self.assertIn("160w", srcset["webp"])
+        self.assertIn("1280w", srcset["jpeg"])
+        self.assertTrue(srcset["src"].endswith("-card.jpeg"))
+
+    def test_variants_are_deleted_with_product(self):
+        """Deleting the product removes the original and every variant"""
+        product = self.create_product(make_image())
+        paths = [
+            variant[file_format]
+            for variant in product.image_variants["variants"].values()
+            for file_format in ("webp", "jpeg")
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            product.delete()
+
+        for path in paths:
+            self.assertFalse(default_storage.exists(path))
+
+    def test_shared_variants_are_kept(self):
+        """Variants shared by identical uploads survive one product's deletion"""
+        first = self.create_product(make_image(name="a.png"))
+        second = self.create_product(make_image(name="b.png"))
+        self.assertEqual(first.image_variants["digest"], second.image_variants["digest"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+
+        path = second.image_variants["variants"]["card"]["webp"]
+        self.assertTrue(default_storage.exists(path))
@@ -0,0 +1,191 @@
+from decimal import Decimal
+from django.urls import reverse
+from django.test import TestCase
+from django.core.cache import cache
+from users.models import UserModel
+from rest_framework.test import APIClient
+from utils.purge import PurgeServer, reset_purger
+from menu.utils import bulk_update_products
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+
+
+class MenuCacheTagsTestCase(TestCase):
+    """Test cases for the edge cache tags of public menus and their purging"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = PurgeServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        """Create a restaurant with a small menu, purged through the local stand-in"""
+        cache.clear()
+
+        self.enterContext(
+            self.settings(
+                CACHE_PURGER="utils.purge.HTTPPurger",
+                CACHE_PURGE_URLS=[self.server.url],
+                CACHE_PURGE_WORKERS=0,
+                EDGE_CACHE_MAX_AGE=86400,
+                EDGE_CACHE_STALE_WHILE_REVALIDATE=30,
+            )
+        )
+        # The purger is created from the settings on first use
+        reset_purger()
+        self.addCleanup(reset_purger)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            owner = UserModel.objects.create_user(
+                email="owner@example.com",
+                username="owner",
+                password="OwnerPass123!",
+            )
+            self.restaurant = RestaurantModel.objects.create(owner=owner, name="Cafe")
+            self.drinks = CategoryModel.objects.create(
+                restaurant=self.restaurant, name="Drinks"
+            )
+            self.tea = ProductModel.objects.create(
+                category=self.drinks, name="Tea", price=Decimal("10")
+            )
+            self.coffee = ProductModel.objects.create(
+                category=self.drinks, name="Coffee", price=Decimal("20")
+            )
+
+        self.restaurant_tag = f"restaurant-{self.restaurant.id}"
+        self.client = APIClient()
+        self.server.purged.clear()
+
+    def test_menu_responses_are_tagged(self):
+        """Menus, deltas and their 304s are cacheable under the restaurant tag"""
+        for name in ("menu-document", "menu-changes"):
+            response = self.client.get(reverse(name, args=[self.restaurant.id]))
+
+            self.assertEqual(response["Surrogate-Key"], self.restaurant_tag)
+            self.assertEqual(response["Cache-Tag"], self.restaurant_tag)
+            self.assertEqual(
+                response["Cache-Control"],
+                "public, max-age=0, s-maxage=86400, stale-while-revalidate=30",
+            )
+
+        url = reverse("menu-document", args=[self.restaurant.id])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=self.client.get(url)["ETag"])
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["Surrogate-Key"], self.restaurant_tag)
+
+    def test_search_results_are_tagged(self):
+        """Search responses are tagged with every category and product they show"""
+        response = self.client.get(
+            reverse("menu-search", args=[self.restaurant.id]), {"q": "tea"}
+        )
+
+        self.assertEqual(
+            response["Surrogate-Key"].split(),
+            [self.restaurant_tag, f"product-{self.tea.id}"],
+        )
+
+    def test_missing_menus_are_not_cached(self):
+        """Errors carry no edge caching headers"""
+        url = reverse("menu-document", args=[self.restaurant.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.restaurant.delete()
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("Surrogate-Key", response)
+        self.assertNotIn("Cache-Control", response)
+
+    def test_saves_purge_exactly_their_tags(self):
+        """A change purges its restaurant and the changed item, once committed"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tea.price = Decimal("12")
+            self.tea.save()
+            self.assertEqual(self.server.purged, [])
+
+        self.assertEqual(
+            self.server.purged, [sorted([self.restaurant_tag, f"product-{self.tea.id}"])]
+        )
+
+        self.server.purged.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.drinks.name = "Hot drinks"
+            self.drinks.save()
+
+        self.assertEqual(
+            self.server.purged,
+            [sorted([self.restaurant_tag, f"category-{self.drinks.id}"])],
+        )
+
+        self.server.purged.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.restaurant.name = "Coffee Shop"
+            self.restaurant.save()
+
+        self.assertEqual(self.server.purged, [[self.restaurant_tag]])
+
+    def test_moves_purge_both_menus(self):
+        """A product moved to another restaurant is purged from both menus"""
+        with self.captureOnCommitCallbacks(execute=True):
+            bakery = RestaurantModel.objects.create(
+                owner=self.restaurant.owner, name="Bakery"
+            )
+            cakes = CategoryModel.objects.create(restaurant=bakery, name="Cakes")
+        self.server.purged.clear()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tea = ProductModel.objects.get(pk=self.tea.pk)
+            tea.category = cakes
+            tea.save()
+
+        self.assertEqual(
+            self.server.purged,
+            [
+                sorted(
+                    [
+                        self.restaurant_tag,
+                        f"restaurant-{bakery.id}",
+                        f"product-{tea.id}",
+                    ]
+                )
+            ],
+        )
+
+    def test_deletions_purge_their_tags(self):
+        """Deleting a product purges it along with its menu"""
+        product_id = self.coffee.id
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.coffee.delete()
+
+        self.assertEqual(
+            self.server.purged, [sorted([self.restaurant_tag, f"product-{product_id}"])]
+        )
+
+    def test_bulk_updates_purge_once(self):
+        """A bulk update sends one purge for all the changed products"""
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_update_products(
+                [
+                    (self.tea, {"price": Decimal("11")}),
+                    (self.coffee, {"is_available": False}),
+                ]
+            )
+
+        self.assertEqual(
+            self.server.purged,
+            [
+                sorted(
+                    [
+                        self.restaurant_tag,
+                        f"product-{self.tea.id}",
+                        f"product-{self.coffee.id}",
+                    ]
+                )
+            ],
+        )
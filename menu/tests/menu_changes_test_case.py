@@ -0,0 +1,208 @@
+from decimal import Decimal
+from datetime import timedelta
+from django.urls import reverse
+from django.test import TestCase
+from django.utils import timezone
+from django.core.cache import cache
+from django.test import override_settings
+from users.models import UserModel
+from rest_framework.test import APIClient
+from menu.utils import compact_menu_changes
+from menu.models import RestaurantModel, CategoryModel, ProductModel, MenuChangeModel
+
+
+class MenuChangesTestCase(TestCase):
+    """Test cases for the versioned menu change log and delta sync"""
+
+    def setUp(self):
+        """Create a restaurant with a small menu before each test"""
+        cache.clear()
+
+        self.owner = UserModel.objects.create_user(
+            email="owner@example.com",
+            username="owner",
+            password="OwnerPass123!",
+        )
+        self.restaurant = RestaurantModel.objects.create(
+            owner=self.owner, name="Cafe"
+        )
+        self.drinks = CategoryModel.objects.create(
+            restaurant=self.restaurant, name="Drinks"
+        )
+        self.tea = ProductModel.objects.create(
+            category=self.drinks, name="Tea", price=Decimal("10")
+        )
+        self.coffee = ProductModel.objects.create(
+            category=self.drinks, name="Coffee", price=Decimal("20")
+        )
+
+        self.url = reverse("menu-changes", args=[self.restaurant.id])
+        self.client = APIClient()
+
+    def get_version(self):
+        self.restaurant.refresh_from_db()
+        return self.restaurant.menu_version
+
+    def test_versions_increase_per_restaurant(self):
+        """Every change takes the next version of its own restaurant"""
+        self.assertEqual(
+            [self.drinks.version, self.tea.version, self.coffee.version], [2, 3, 4]
+        )
+
+        self.tea.price = Decimal("12")
+        self.tea.save(update_fields=["price"])
+        self.tea.refresh_from_db()
+
+        self.assertEqual(self.tea.version, 5)
+        self.assertEqual(self.get_version(), 5)
+
+        other = RestaurantModel.objects.create(owner=self.owner, name="Bakery")
+        other.refresh_from_db()
+        self.assertEqual(other.menu_version, 1)
+
+    def test_restaurant_save_keeps_the_version(self):
+        """Saving a stale restaurant instance never moves its version back"""
+        stale = RestaurantModel.objects.get(pk=self.restaurant.pk)
+        self.tea.save()
+
+        stale.name = "Cafe Tea"
+        stale.save()
+
+        self.assertEqual(self.get_version(), 6)
+        self.assertEqual(stale.menu_version, 6)
+
+    def test_delta_since_version(self):
+        """Only the objects changed after `since` are returned"""
+        since = self.get_version()
+
+        self.tea.is_available = False
+        self.tea.save()
+        coffee_id = self.coffee.id
+        self.coffee.delete()
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {"since": since})
+
+        data = response.json()
+        self.assertFalse(data["snapshot"])
+        self.assertEqual(data["version"], since + 2)
+        self.assertEqual(data["categories"], [])
+        self.assertEqual([item["id"] for item in data["products"]], [str(self.tea.id)])
+        self.assertFalse(data["products"][0]["isAvailable"])
+        self.assertEqual(data["products"][0]["categoryId"], str(self.drinks.id))
+        self.assertEqual(data["deleted"]["products"], [str(coffee_id)])
+        self.assertNotIn("restaurant", data)
+
+        # Up to date clients get an empty delta
+        data = self.client.get(self.url, {"since": data["version"]}).json()
+        self.assertEqual(data["products"], [])
+        self.assertEqual(data["deleted"]["products"], [])
+
+    def test_moves_leave_tombstones(self):
+        """Objects moved to another restaurant are deleted from the old menu"""
+        bakery = RestaurantModel.objects.create(owner=self.owner, name="Bakery")
+        cakes = CategoryModel.objects.create(restaurant=bakery, name="Cakes")
+        bakery_url = reverse("menu-changes", args=[bakery.id])
+        since, bakery_since = self.get_version(), 0
+
+        tea = ProductModel.objects.get(pk=self.tea.pk)
+        tea.category = cakes
+        tea.save()
+
+        data = self.client.get(self.url, {"since": since}).json()
+        self.assertEqual(data["products"], [])
+        self.assertEqual(data["deleted"]["products"], [str(tea.id)])
+
+        data = self.client.get(bakery_url, {"since": bakery_since}).json()
+        self.assertIn(str(tea.id), [item["id"] for item in data["products"]])
+
+        # A moved category takes its products along
+        since, bakery_since = self.get_version(), data["version"]
+        drinks = CategoryModel.objects.get(pk=self.drinks.pk)
+        drinks.restaurant = bakery
+        drinks.save()
+
+        data = self.client.get(self.url, {"since": since}).json()
+        self.assertEqual(data["deleted"]["categories"], [str(drinks.id)])
+        self.assertEqual(data["deleted"]["products"], [str(self.coffee.id)])
+
+        data = self.client.get(bakery_url, {"since": bakery_since}).json()
+        self.assertEqual([item["id"] for item in data["categories"]], [str(drinks.id)])
+        self.assertEqual(
+            [item["id"] for item in data["products"]], [str(self.coffee.id)]
+        )
+
+    def test_category_activation_changes_its_products(self):
+        """Products of an inactive category leave the menu, and come back"""
+        since = self.get_version()
+        drinks = CategoryModel.objects.get(pk=self.drinks.pk)
+        drinks.is_active = False
+        drinks.save()
+
+        data = self.client.get(self.url, {"since": since}).json()
+        self.assertEqual(data["categories"], [])
+        self.assertEqual(data["products"], [])
+        self.assertEqual(data["deleted"]["categories"], [str(drinks.id)])
+        self.assertEqual(
+            sorted(data["deleted"]["products"]),
+            sorted([str(self.tea.id), str(self.coffee.id)]),
+        )
+
+        since = data["version"]
+        drinks.is_active = True
+        drinks.save()
+
+        data = self.client.get(self.url, {"since": since}).json()
+        self.assertEqual([item["id"] for item in data["categories"]], [str(drinks.id)])
+        self.assertEqual(len(data["products"]), 2)
+        self.assertEqual(data["deleted"], {"categories": [], "products": []})
+
+    def test_restaurant_deletion_drops_the_log(self):
+        """Deleting a restaurant deletes its change log, without tombstones"""
+        self.restaurant.delete()
+
+        self.assertFalse(MenuChangeModel.objects.exists())
+
+    def test_snapshot_without_version(self):
+        """New clients get the full menu along with its version"""
+        data = self.client.get(self.url).json()
+
+        self.assertTrue(data["snapshot"])
+        self.assertEqual(data["version"], self.get_version())
+        self.assertEqual(data["menu"]["version"], self.get_version())
+        self.assertEqual(len(data["menu"]["categories"][0]["products"]), 2)
+
+    @override_settings(MENU_CHANGES_MAX=1)
+    def test_snapshot_when_too_far_behind(self):
+        """Clients more than MENU_CHANGES_MAX changes behind get a snapshot"""
+        self.assertTrue(self.client.get(self.url, {"since": 0}).json()["snapshot"])
+
+        since = self.get_version()
+        self.tea.save()
+        self.assertFalse(self.client.get(self.url, {"since": since}).json()["snapshot"])
+
+    def test_compaction_raises_the_floor(self):
+        """Clients that synced before compacted tombstones get a snapshot"""
+        since = self.get_version()
+        coffee_id = self.coffee.id
+        self.coffee.delete()
+        MenuChangeModel.objects.filter(object_id=coffee_id).update(
+            changed_at=timezone.now() - timedelta(days=31)
+        )
+
+        self.assertEqual(compact_menu_changes(days=30), 1)
+        self.restaurant.refresh_from_db()
+        self.assertEqual(self.restaurant.menu_compacted_version, since + 1)
+
+        self.assertTrue(self.client.get(self.url, {"since": since}).json()["snapshot"])
+        self.assertFalse(
+            self.client.get(self.url, {"since": since + 1}).json()["snapshot"]
+        )
+
+    def test_invalid_requests(self):
+        """Bad versions and unknown restaurants are rejected"""
+        self.assertEqual(self.client.get(self.url, {"since": "x"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"since": -1}).status_code, 400)
+
+        url = reverse("menu-changes", args=[self.owner.id])
+        self.assertEqual(self.client.get(url).status_code, 404)
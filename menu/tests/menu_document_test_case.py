@@ -0,0 +1,200 @@
+import gzip
+import json
+from unittest import mock
+from decimal import Decimal
+from django.urls import reverse
+from django.test import TestCase
+from django.core.cache import cache
+from users.models import UserModel
+from rest_framework.test import APIClient
+from menu.utils import menu_document_utils
+from menu.utils import build_menu_document, get_menu_document_cache_key
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+
+
+class MenuDocumentTestCase(TestCase):
+    """Test cases for the precomputed restaurant menu document"""
+
+    def setUp(self):
+        """Create a restaurant with a small menu before each test"""
+        cache.clear()
+
+        self.owner = UserModel.objects.create_user(
+            email="owner@example.com",
+            username="owner",
+            password="OwnerPass123!",
+        )
+        self.restaurant = RestaurantModel.objects.create(
+            owner=self.owner, name="Cafe"
+        )
+        self.drinks = CategoryModel.objects.create(
+            restaurant=self.restaurant, name="Drinks", position=1
+        )
+        self.cakes = CategoryModel.objects.create(
+            restaurant=self.restaurant, name="Cakes", position=2
+        )
+        for index in range(3):
+            ProductModel.objects.create(
+                category=self.drinks, name=f"Drink {index}", price=Decimal("10")
+            )
+            ProductModel.objects.create(
+                category=self.cakes, name=f"Cake {index}", price=Decimal("20")
+            )
+
+        self.url = reverse("menu-document", args=[self.restaurant.id])
+        self.client = APIClient()
+
+    def test_build_runs_bounded_queries(self):
+        """Building a menu costs one query per level, whatever its size"""
+        with self.assertNumQueries(3):
+            document = build_menu_document(self.restaurant.id)
+
+        self.assertEqual(
+            [category["name"] for category in document["categories"]],
+            ["Drinks", "Cakes"],
+        )
+        self.assertEqual(len(document["categories"][0]["products"]), 3)
+
+    def test_warm_read_runs_no_sql(self):
+        """Once cached, the menu is served without touching the database"""
+        self.client.get(self.url)  # Warm the cache
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["name"], "Cafe")
+
+    def test_warm_gzip_read_is_precompressed(self):
+        """Gzip clients get the cached compressed bytes and can revalidate"""
+        self.client.get(self.url)  # Warm the cache
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(response.content))["name"], "Cafe")
+
+        response = self.client.get(
+            self.url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_product_change_rebuilds_document(self):
+        """Saving a product rebuilds the cached document on commit"""
+        self.client.get(self.url)  # Warm the cache
+
+        product = self.drinks.products.first()
+        product.is_available = False
+        with mock.patch.object(
+            menu_document_utils,
+            "rebuild_menu_document",
+            wraps=menu_document_utils.rebuild_menu_document,
+        ) as rebuild:
+            with self.captureOnCommitCallbacks(execute=True):
+                product.save()
+                product.save()
+
+        rebuild.assert_called_once_with(product.restaurant_id)
+
+        with self.assertNumQueries(0):
+            document = self.client.get(self.url).json()
+
+        products = {item["id"]: item for item in document["categories"][0]["products"]}
+        self.assertFalse(products[str(product.id)]["isAvailable"])
+
+    def test_inactive_category_is_hidden(self):
+        """Inactive categories do not appear on the public menu"""
+        self.cakes.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cakes.save()
+
+        document = self.client.get(self.url).json()
+        self.assertEqual([c["name"] for c in document["categories"]], ["Drinks"])
+
+    def test_missing_restaurant_returns_404(self):
+        """Inactive restaurants have no public menu"""
+        self.restaurant.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.restaurant.save()
+
+        self.assertEqual(
+            cache.get(get_menu_document_cache_key(self.restaurant.id)), b""
+        )
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_owner_api_updates_document(self):
+        """Products created through the owner API show up on the menu"""
+        self.client.force_authenticate(self.owner)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("product-list"),
+                {"category": str(self.cakes.id), "name": "Tart", "price": "35"},
+            )
+
+        self.assertEqual(response.status_code, 201)
+
+        self.client.force_authenticate(None)
+        payload = json.loads(self.client.get(self.url).content)
+        self.assertIn("Tart", [p["name"] for p in payload["categories"][1]["products"]])
+
+    def test_owner_cannot_use_foreign_category(self):
+        """Owners cannot add products to another owner's categories"""
+        stranger = UserModel.objects.create_user(
+            email="stranger@example.com",
+            username="stranger",
+            password="StrangerPass123!",
+        )
+        self.client.force_authenticate(stranger)
+
+        response = self.client.post(
+            reverse("product-list"),
+            {"category": str(self.cakes.id), "name": "Tart", "price": "35"},
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_moving_a_category_updates_both_menus(self):
+        """A category moved to another restaurant takes its products along"""
+        other = RestaurantModel.objects.create(owner=self.owner, name="Bakery")
+        other_url = reverse("menu-document", args=[other.id])
+        self.client.get(self.url)  # Warm the caches
+        self.client.get(other_url)
+
+        self.client.force_authenticate(self.owner)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse("category-detail", args=[self.cakes.id]),
+                {"restaurant": str(other.id)},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        restaurant_ids = ProductModel.objects.filter(category=self.cakes).values_list(
+            "restaurant_id", flat=True
+        )
+        self.assertEqual(set(restaurant_ids), {other.id})
+
+        self.client.force_authenticate(None)
+        menu = self.client.get(self.url).json()
+        other_menu = self.client.get(other_url).json()
+        self.assertEqual([c["name"] for c in menu["categories"]], ["Drinks"])
+        self.assertEqual([c["name"] for c in other_menu["categories"]], ["Cakes"])
+        self.assertEqual(len(other_menu["categories"][0]["products"]), 3)
+
+    def test_moving_a_product_updates_both_menus(self):
+        """A product moved to another restaurant's category leaves its old menu"""
+        other = RestaurantModel.objects.create(owner=self.owner, name="Bakery")
+        breads = CategoryModel.objects.create(restaurant=other, name="Breads")
+        self.client.get(self.url)  # Warm the cache
+
+        product = ProductModel.objects.get(name="Cake 0")
+        product.category = breads
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save(update_fields=["category"])
+
+        product.refresh_from_db()
+        self.assertEqual(product.restaurant_id, other.id)
+
+        menu = self.client.get(self.url).json()
+        self.assertNotIn("Cake 0", [p["name"] for p in menu["categories"][1]["products"]])
@@ -0,0 +1,234 @@
+import time
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+from decimal import Decimal
+from django.urls import reverse
+from django.conf import settings
+from django.core.cache import cache
+from users.models import UserModel
+from menu.utils import get_menu_channel
+from django.test import TestCase, SimpleTestCase, override_settings
+from utils.pubsub import (
+    Hub,
+    LocalBroker,
+    SQLiteBroker,
+    get_hub,
+    get_broker,
+    reset_pubsub,
+)
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+
+
+@override_settings(PUBSUB_BROKER="utils.pubsub.LocalBroker")
+class MenuEventsTestCase(TestCase):
+    """Test cases for the live menu events"""
+
+    def setUp(self):
+        """Create a restaurant with one product"""
+        cache.clear()
+        # The broker is created from the settings on first use
+        reset_pubsub()
+        self.addCleanup(reset_pubsub)
+
+        owner = UserModel.objects.create_user(
+            email="owner@example.com",
+            username="owner",
+            password="OwnerPass123!",
+        )
+        # Commit the setup so its own events are published (to no one)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.restaurant = RestaurantModel.objects.create(owner=owner, name="Cafe")
+            self.category = CategoryModel.objects.create(
+                restaurant=self.restaurant, name="Drinks"
+            )
+            self.product = ProductModel.objects.create(
+                category=self.category, name="Tea", price=Decimal("10.00")
+            )
+
+        self.channel = get_menu_channel(self.restaurant.id)
+        self.url = reverse("menu-events", args=[self.restaurant.id])
+
+    def record_events(self):
+        """Starts the broker with a callback collecting the published frames"""
+        events = []
+        get_broker().start(lambda channel, message: events.append((channel, message)))
+        return events
+
+    def test_price_and_availability_deltas(self):
+        """Changes of one product in a transaction are merged into one delta"""
+        events = self.record_events()
+        product = ProductModel.objects.get(pk=self.product.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            product.price = Decimal("12.50")
+            product.save()
+            product.is_available = False
+            product.save()
+
+        self.assertEqual(len(events), 1)
+        channel, frame = events[0]
+        self.assertEqual(channel, self.channel)
+        self.assertTrue(frame.startswith("event: product\n"))
+        self.assertIn('"price": "12.50"', frame)
+        self.assertIn('"isAvailable": false', frame)
+
+    def test_other_changes_ask_for_a_refetch(self):
+        """Renames and category changes push a single menu event"""
+        events = self.record_events()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.product.name = "Green Tea"
+            self.product.price = Decimal("11")
+            self.product.save()
+            self.category.save()
+
+        self.assertEqual(len(events), 1)
+        self.assertTrue(events[0][1].startswith("event: menu\n"))
+
+        # Saving without changes pushes nothing
+        with self.captureOnCommitCallbacks(execute=True):
+            self.product.save()
+        self.assertEqual(len(events), 1)
+
+    async def test_event_stream(self):
+        """Clients receive published frames and heartbeats"""
+        with override_settings(MENU_EVENTS_HEARTBEAT=0.05):
+            response = await self.async_client.get(self.url)
+            stream = aiter(response.streaming_content)
+
+            self.assertEqual(response["Content-Type"], "text/event-stream")
+            self.assertIn(b": connected", await anext(stream))
+            self.assertEqual(get_hub().count(self.channel), 1)
+
+            # Published from another thread, like a request or broker thread
+            frame = "event: product\ndata: {}\n\n"
+            thread = threading.Thread(target=get_hub().deliver, args=(self.channel, frame))
+            thread.start()
+            thread.join()
+
+            self.assertEqual(await anext(stream), frame.encode())
+            self.assertEqual(await anext(stream), b": heartbeat\n\n")
+
+            # ASGI servers cancel the pending read when the client disconnects
+            read = asyncio.ensure_future(anext(stream))
+            await asyncio.sleep(0.01)
+            read.cancel()
+            await asyncio.gather(read, return_exceptions=True)
+            self.assertEqual(get_hub().count(self.channel), 0)
+
+    def test_wsgi_requests_are_refused(self):
+        """Streams would hold a WSGI worker thread, they need an ASGI server"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 501)
+
+    async def test_streams_per_client_are_capped(self):
+        """A client address may only hold MENU_EVENTS_MAX_CONNECTIONS streams"""
+        with override_settings(MENU_EVENTS_MAX_CONNECTIONS=1):
+            response = await self.async_client.get(self.url)
+            stream = aiter(response.streaming_content)
+            self.assertIn(b": connected", await anext(stream))
+
+            response = await self.async_client.get(self.url)
+            self.assertEqual(response.status_code, 429)
+
+            # A disconnected client frees its slot
+            read = asyncio.ensure_future(anext(stream))
+            await asyncio.sleep(0.01)
+            read.cancel()
+            await asyncio.gather(read, return_exceptions=True)
+
+            response = await self.async_client.get(self.url)
+            self.assertEqual(response.status_code, 200)
+
+    async def test_clients_behind_a_proxy_are_told_apart(self):
+        """Behind NUM_PROXIES proxies, clients are capped by their forwarded address"""
+        rest_framework = {**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}
+
+        with override_settings(MENU_EVENTS_MAX_CONNECTIONS=1, REST_FRAMEWORK=rest_framework):
+            first = await self.async_client.get(
+                self.url, headers={"x-forwarded-for": "203.0.113.1"}
+            )
+            stream = aiter(first.streaming_content)
+            self.assertIn(b": connected", await anext(stream))
+
+            response = await self.async_client.get(
+                self.url, headers={"x-forwarded-for": "203.0.113.2"}
+            )
+            self.assertEqual(response.status_code, 200)
+
+            response = await self.async_client.get(
+                self.url, headers={"x-forwarded-for": "198.51.100.7, 203.0.113.1"}
+            )
+            self.assertEqual(response.status_code, 429)
+
+            read = asyncio.ensure_future(anext(stream))
+            await asyncio.sleep(0.01)
+            read.cancel()
+            await asyncio.gather(read, return_exceptions=True)
+
+    async def test_unknown_restaurant(self):
+        """Streams are only opened for public menus"""
+        url = reverse("menu-events", args=["00000000-0000-0000-0000-000000000000"])
+        response = await self.async_client.get(url)
+
+        self.assertEqual(response.status_code, 404)
+
+
+class PubSubTestCase(SimpleTestCase):
+    """Test cases for the pub/sub fan-out and brokers"""
+
+    def test_fan_out_to_many_subscribers(self):
+        """One delivery reaches every idle subscriber of the channel"""
+
+        async def run():
+            hub = Hub(LocalBroker())
+            subscriptions = [hub.subscribe("menu:1") for _ in range(2000)]
+            other = hub.subscribe("menu:2")
+
+            thread = threading.Thread(target=hub.broker.publish, args=("menu:1", "hi"))
+            thread.start()
+            thread.join()
+
+            messages = await asyncio.gather(*(s.get() for s in subscriptions))
+            self.assertEqual(set(messages), {"hi"})
+            self.assertTrue(other.queue.empty())
+
+        asyncio.run(run())
+
+    def test_slow_subscribers_are_dropped(self):
+        """A subscriber falling behind is closed instead of buffering forever"""
+
+        async def run():
+            hub = Hub(LocalBroker())
+            subscription = hub.subscribe("menu:1", max_size=2)
+
+            for index in range(5):
+                hub.deliver("menu:1", str(index))
+            await asyncio.sleep(0)
+
+            self.assertEqual(
+                [await subscription.get() for _ in range(3)], ["0", "1", None]
+            )
+            self.assertTrue(subscription.queue.empty())
+
+        asyncio.run(run())
+
+    def test_sqlite_broker_crosses_processes(self):
+        """Messages published through the file reach other broker instances"""
+        path = Path(tempfile.mkdtemp()) / "pubsub.sqlite3"
+        received = []
+
+        subscriber = SQLiteBroker(path, interval=0.01)
+        subscriber.start(lambda channel, message: received.append((channel, message)))
+        self.addCleanup(subscriber.stop)
+
+        SQLiteBroker(path).publish("menu:1", "hello")
+
+        deadline = time.monotonic() + 5
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(received, [("menu:1", "hello")])
@@ -0,0 +1,124 @@
+from decimal import Decimal
+from django.urls import reverse
+from django.test import TestCase
+from django.core.cache import cache
+from users.models import UserModel
+from rest_framework.test import APIClient
+from menu.utils import search_menu, rebuild_search_index
+from menu.models import (
+    RestaurantModel,
+    CategoryModel,
+    ProductModel,
+    MenuSearchEntryModel,
+)
+
+
+class MenuSearchTestCase(TestCase):
+    """Test cases for the full-text menu search"""
+
+    def setUp(self):
+        """Create two restaurants with Persian menus"""
+        cache.clear()
+
+        owner = UserModel.objects.create_user(
+            email="owner@example.com",
+            username="owner",
+            password="OwnerPass123!",
+        )
+        self.restaurant = RestaurantModel.objects.create(owner=owner, name="کافه")
+        self.drinks = CategoryModel.objects.create(
+            restaurant=self.restaurant, name="نوشیدنی‌های گرم"
+        )
+        self.tea = ProductModel.objects.create(
+            category=self.drinks, name="چای سبز", price=Decimal("50000")
+        )
+        self.latte = ProductModel.objects.create(
+            category=self.drinks,
+            name="کافه لاته",
+            description="شیر و اسپرسو، کمی چای ماسالا",
+            price=Decimal("90000"),
+        )
+        self.cake = ProductModel.objects.create(
+            category=self.drinks, name="كيك شكلاتي ۲ نفره", price=Decimal("120000")
+        )
+
+        # Another restaurant selling the same product
+        other = RestaurantModel.objects.create(owner=owner, name="دیگر")
+        ProductModel.objects.create(
+            category=CategoryModel.objects.create(restaurant=other, name="منو"),
+            name="چای سبز",
+            price=Decimal("1"),
+        )
+
+        self.url = reverse("menu-search", args=[self.restaurant.id])
+        self.client = APIClient()
+
+    def search(self, query):
+        return [result["id"] for result in search_menu(self.restaurant.id, query)]
+
+    def test_prefix_matching_and_ranking(self):
+        """Word prefixes match, and name matches rank above descriptions"""
+        self.assertEqual(self.search("چا"), [self.tea.id, self.latte.id])
+        self.assertEqual(self.search("چای سب"), [self.tea.id])
+
+    def test_persian_normalization(self):
+        """Arabic letters, ZWNJ and Persian digits match either way"""
+        self.assertEqual(self.search("کیک شکلاتی"), [self.cake.id])
+        self.assertEqual(self.search("كيك 2"), [self.cake.id])
+        self.assertEqual(self.search("نوشیدنیهای"), [self.drinks.id])
+
+    def test_index_follows_writes(self):
+        """Renames, hidden categories and deletions are reflected"""
+        self.tea.name = "دمنوش"
+        self.tea.save()
+        self.assertEqual(self.search("دمنو"), [self.tea.id])
+
+        self.drinks.is_active = False
+        self.drinks.save()
+        self.assertEqual(self.search("دمنوش"), [])
+
+        self.drinks.is_active = True
+        self.drinks.save()
+        self.latte.delete()
+        self.assertEqual(self.search("اسپرسو"), [])
+        self.assertEqual(self.search("دمنوش"), [self.tea.id])
+
+        self.drinks.delete()
+        self.assertFalse(
+            MenuSearchEntryModel.objects.filter(restaurant=self.restaurant).exists()
+        )
+
+    def test_rebuild_index(self):
+        """Bulk-inserted products become searchable after a rebuild"""
+        ProductModel.objects.bulk_create(
+            [
+                ProductModel(
+                    category=self.drinks,
+                    restaurant=self.restaurant,
+                    name="موهیتو",
+                    price=Decimal("1"),
+                )
+            ]
+        )
+        self.assertEqual(self.search("موهیتو"), [])
+
+        self.assertEqual(rebuild_search_index([self.restaurant.id]), 5)
+        self.assertEqual(len(self.search("موهیتو")), 1)
+
+    def test_search_endpoint(self):
+        """The endpoint returns menu-shaped results and validates its input"""
+        response = self.client.get(self.url, {"q": "چای"})
+
+        self.assertEqual(response.status_code, 200)
+        result = response.json()["results"][0]
+        self.assertEqual(result["type"], "product")
+        self.assertEqual(result["name"], "چای سبز")
+        self.assertEqual(result["price"], "50000.00")
+        self.assertEqual(result["categoryId"], str(self.drinks.id))
+
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+
+        self.restaurant.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.restaurant.save()
+        self.assertEqual(self.client.get(self.url, {"q": "چای"}).status_code, 404)
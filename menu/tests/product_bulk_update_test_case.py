@@ -0,0 +1,197 @@
+from unittest import mock
+from decimal import Decimal
+from django.urls import reverse
+from django.db import connection
+from django.core.cache import cache
+from users.models import UserModel
+from rest_framework.test import APIClient
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from utils.pubsub import get_broker, reset_pubsub
+from menu.utils import menu_document_utils
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+from menu.utils import search_menu, get_menu_changes, bulk_update_products
+
+
+@override_settings(PUBSUB_BROKER="utils.pubsub.LocalBroker")
+class ProductBulkUpdateTestCase(TestCase):
+    """Test cases for the transactional bulk product update"""
+
+    def setUp(self):
+        """Create two restaurants of one owner and a restaurant of another owner"""
+        cache.clear()
+        # The broker is created from the settings on first use
+        reset_pubsub()
+        self.addCleanup(reset_pubsub)
+
+        self.owner = UserModel.objects.create_user(
+            email="owner@example.com",
+            username="owner",
+            password="OwnerPass123!",
+        )
+        other = UserModel.objects.create_user(
+            email="other@example.com",
+            username="other",
+            password="OtherPass123!",
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.products = []
+            for name in ("Cafe", "Bakery"):
+                restaurant = RestaurantModel.objects.create(owner=self.owner, name=name)
+                category = CategoryModel.objects.create(
+                    restaurant=restaurant, name="Menu"
+                )
+                for index in range(6):
+                    self.products.append(
+                        ProductModel.objects.create(
+                            category=category, name=f"Item {index}", price=Decimal("10")
+                        )
+                    )
+
+            restaurant = RestaurantModel.objects.create(owner=other, name="Other")
+            category = CategoryModel.objects.create(restaurant=restaurant, name="Menu")
+            self.foreign = ProductModel.objects.create(
+                category=category, name="Foreign", price=Decimal("10")
+            )
+
+        self.url = reverse("product-bulk")
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def patch(self, changes):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.patch(self.url, {"products": changes}, format="json")
+
+        return response, callbacks
+
+    def test_bulk_update(self):
+        """Changes are applied at once, with one rebuild per restaurant"""
+        cafe = self.products[0]
+        self.client.get(reverse("menu-document", args=[cafe.restaurant_id]))
+        events = []
+        get_broker().start(lambda channel, message: events.append(message))
+
+        with mock.patch.object(
+            menu_document_utils,
+            "rebuild_menu_document",
+            wraps=menu_document_utils.rebuild_menu_document,
+        ) as rebuild:
+            response, _ = self.patch(
+                [
+                    {"id": str(cafe.id), "price": "12.50", "isAvailable": False},
+                    {"id": str(self.products[1].id), "name": "Espresso"},
+                    {"id": str(self.products[6].id), "position": 3},
+                ]
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [product["price"] for product in response.json()["products"]],
+            ["12.50", "10.00", "10.00"],
+        )
+
+        # One document rebuild per restaurant
+        self.assertEqual(rebuild.call_count, 2)
+
+        cafe.refresh_from_db()
+        self.assertEqual(cafe.price, Decimal("12.50"))
+        self.assertFalse(cafe.is_available)
+        # Both products of a restaurant took its single new version
+        self.products[1].refresh_from_db()
+        self.assertEqual(cafe.version, self.products[1].version)
+        self.assertEqual(
+            cafe.version,
+            RestaurantModel.objects.get(pk=cafe.restaurant_id).menu_version,
+        )
+
+        document = self.client.get(reverse("menu-document", args=[cafe.restaurant_id]))
+        products = document.json()["categories"][0]["products"]
+        self.assertEqual(products[0]["price"], "12.50")
+        self.assertEqual(products[1]["name"], "Espresso")
+
+        # The renamed product was refetched, the others were pushed as deltas
+        self.assertEqual(len(events), 2)
+        self.assertTrue(any(message.startswith("event: menu") for message in events))
+
+        self.assertEqual(
+            search_menu(cafe.restaurant_id, "espresso")[0]["id"], self.products[1].id
+        )
+        changes = get_menu_changes(cafe.restaurant_id, cafe.version - 1)
+        self.assertEqual(len(changes["products"]), 2)
+
+    def test_untouched_fields_are_preserved(self):
+        """Rows only get the fields of their own change, concurrent writes are kept"""
+        first, second = ProductModel.objects.filter(
+            pk__in=[self.products[0].pk, self.products[1].pk]
+        ).order_by("position", "name")
+        # Written by another request after the batch was validated
+        ProductModel.objects.filter(pk=first.pk).update(name="Latte")
+        ProductModel.objects.filter(pk=second.pk).update(price=Decimal("20"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_update_products(
+                [(first, {"price": Decimal("12")}), (second, {"name": "Mocha"})]
+            )
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.name, first.price), ("Latte", Decimal("12")))
+        self.assertEqual((second.name, second.price), ("Mocha", Decimal("20")))
+
+    def test_queries_do_not_grow_with_the_batch(self):
+        """The number of queries only depends on the affected restaurants"""
+        counts = []
+
+        for products in (self.products[:2] + self.products[6:8], self.products):
+            with CaptureQueriesContext(connection) as queries:
+                response, _ = self.patch(
+                    [{"id": str(product.id), "price": "15"} for product in products]
+                )
+
+            self.assertEqual(response.status_code, 200)
+            counts.append(len(queries))
+
+        self.assertEqual(counts[0], counts[1])
+
+    def test_errors_are_reported_per_item(self):
+        """Invalid items are reported in order and nothing is applied"""
+        response, _ = self.patch(
+            [
+                {"id": str(self.products[0].id), "price": "11"},
+                {"id": str(self.products[1].id), "price": "-1"},
+                {"id": str(self.foreign.id), "price": "11"},
+                {"id": str(self.products[0].id), "price": "11"},
+                {"id": str(self.products[2].id)},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["products"]
+        self.assertEqual(len(errors), 5)
+        self.assertEqual(errors[0], {})
+        self.assertIn("price", errors[1])
+
+        # Item-level errors are reported once the fields are valid
+        response, _ = self.patch(
+            [
+                {"id": str(self.products[0].id), "price": "11"},
+                {"id": str(self.foreign.id), "price": "11"},
+                {"id": str(self.products[0].id), "price": "11"},
+            ]
+        )
+        errors = response.json()["products"]
+        self.assertEqual([bool(error) for error in errors], [False, True, True])
+        self.assertIn("id", errors[1])
+
+        self.products[0].refresh_from_db()
+        self.assertEqual(self.products[0].price, Decimal("10"))
+
+    def test_payloads_are_capped(self):
+        """Batches are limited to MENU_BULK_UPDATE_MAX items"""
+        changes = [{"id": str(self.products[0].id), "price": "1"}] * 101
+        response, _ = self.patch(changes)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("products", response.json())
+        self.assertEqual(self.patch([])[0].status_code, 400)
@@ -0,0 +1,9 @@
+from django.urls import path
+from menu.views import MenuDocumentView, MenuSearchView, MenuEventsView, MenuChangesView
+
+urlpatterns = [
+    path("<uuid:restaurant_id>/", MenuDocumentView.as_view(), name="menu-document"),
+    path("<uuid:restaurant_id>/search/", MenuSearchView.as_view(), name="menu-search"),
+    path("<uuid:restaurant_id>/events/", MenuEventsView.as_view(), name="menu-events"),
+    path("<uuid:restaurant_id>/changes/", MenuChangesView.as_view(), name="menu-changes"),
+]
@@ -0,0 +1,46 @@
+from .menu_document_utils import (
+    get_menu_document,
+    get_product_document,
+    build_menu_document,
+    rebuild_menu_document,
+    schedule_menu_document_rebuild,
+    get_menu_document_cache_key,
+)
+from .image_pipeline_utils import (
+    get_image_srcset,
+    delete_image_variants,
+    get_image_variant_names,
+    generate_image_variants,
+    process_product_image,
+    schedule_product_image_processing,
+)
+from .menu_search_utils import (
+    search_menu,
+    index_menu_item,
+    reindex_products,
+    unindex_menu_items,
+    rebuild_search_index,
+)
+from .menu_push_utils import (
+    format_event,
+    get_menu_channel,
+    get_product_delta,
+    schedule_menu_event,
+    remember_tracked_values,
+)
+from .menu_changes_utils import (
+    get_menu_changes,
+    record_menu_move,
+    record_menu_change,
+    record_menu_changes,
+    compact_menu_changes,
+    record_menu_deletion,
+)
+from .product_bulk_update_utils import BULK_UPDATE_FIELDS, bulk_update_products
+from .menu_cache_tags_utils import (
+    get_product_tag,
+    get_category_tag,
+    get_restaurant_tag,
+    schedule_menu_purge,
+    get_search_result_tags,
+)
@@ -0,0 +1,257 @@
+import hashlib
+import threading
+from io import BytesIO
+from logging import getLogger
+from PIL import Image, ImageOps
+from django.conf import settings
+from menu.models import ProductModel, RestaurantModel, MenuChangeModel
+from utils.transaction import on_commit_once
+from django.db import transaction, close_old_connections
+from django.core.files.base import ContentFile
+from concurrent.futures import ThreadPoolExecutor
+
+logger = getLogger(__name__)
+
+# ----------------------------------
+# Variant configuration
+# ----------------------------------
+
+# Variant name -> maximum width in pixels (images are never upscaled)
+DEFAULT_IMAGE_VARIANTS = {"thumbnail": 160, "card": 480, "full": 1280}
+
+# Output formats in order of preference, with their Pillow encoder options
+IMAGE_FORMATS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+
+VARIANTS_UPLOAD_TO = "products/variants/"
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_image_variants():
+    """Returns the configured variant widths, keyed by variant name."""
+    return getattr(settings, "MENU_IMAGE_VARIANTS", DEFAULT_IMAGE_VARIANTS)
+
+
+def _get_executor():
+    """Lazily creates the process-wide image worker pool."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.IMAGE_PIPELINE_WORKERS,
+                thread_name_prefix="image-pipeline",
+            )
+
+    return _executor
+
+
+def _encode_variant(image, width, file_format):
+    """Resizes an image to the given width and encodes it in the given format."""
+    variant = image.copy()
+
+    if variant.width > width:
+        height = round(variant.height * width / variant.width)
+        variant = variant.resize((width, height), Image.Resampling.LANCZOS)
+
+    if file_format == "jpeg" and variant.mode != "RGB":
+        # JPEG has no alpha channel, flatten transparent images on white
+        background = Image.new("RGB", variant.size, (255, 255, 255))
+        rgba = variant.convert("RGBA")
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        variant = background
+    elif variant.mode not in ("RGB", "RGBA"):
+        variant = variant.convert("RGBA")
+
+    buffer = BytesIO()
+    variant.save(buffer, **IMAGE_FORMATS[file_format])
+
+    return buffer.getvalue()
+
+
+def get_variant_digest(digest, max_width, file_format):
+    """
+    Returns the name digest of a variant: the SHA-256 of the original
+    content digest and of the variant width, format and encoder options.
+    """
+    options = sorted(IMAGE_FORMATS[file_format].items())
+    key = f"{digest}:{max_width}:{file_format}:{options}"
+
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def generate_image_variants(field_file):
+    """
+    Generates every configured size and format of an uploaded image.
+
+    Variant names are derived from the original content and the variant
+    configuration (see `get_variant_digest`), so a given name always refers
+    to the same bytes and can be cached forever: changing a width or an
+    encoder option yields new names. Returns the variant map stored on the
+    product.
+    """
+    storage = field_file.storage
+
+    with storage.open(field_file.name, "rb") as source:
+        content = source.read()
+
+    digest = hashlib.sha256(content).hexdigest()[:16]
+
+    with Image.open(BytesIO(content)) as original:
+        image = ImageOps.exif_transpose(original)
+        image.load()
+
+    variants = {}
+
+    for name, max_width in get_image_variants().items():
+        variants[name] = {}
+
+        for file_format in IMAGE_FORMATS:
+            variant_digest = get_variant_digest(digest, max_width, file_format)
+            path = f"{VARIANTS_UPLOAD_TO}{variant_digest}-{name}.{file_format}"
+
+            # Identical uploads share their variants
+            if not storage.exists(path):
+                data = _encode_variant(image, max_width, file_format)
+                path = storage.save(path, ContentFile(data))
+
+            variants[name][file_format] = path
+            # Images are never upscaled
+            variants[name]["width"] = min(image.width, max_width)
+
+    return {"source": field_file.name, "digest": digest, "variants": variants}
+
+
+def process_product_image(product_id, image_name):
+    """
+    Generates the variants of a product image and stores them on the product.
+
+    Does nothing if the product was deleted or its image replaced meanwhile.
+    """
+    # Imported lazily to avoid a circular import with the menu document
+    from menu.utils.menu_push_utils import schedule_menu_event
+    from menu.utils.menu_changes_utils import record_menu_change
+    from menu.utils.menu_document_utils import rebuild_menu_document
+    from menu.utils.menu_cache_tags_utils import schedule_menu_purge
+
+    try:
+        product = ProductModel.objects.filter(pk=product_id, image=image_name).first()
+
+        if product is None:
+            return
+
+        image_variants = generate_image_variants(product.image)
+
+        # Only store the result if the image was not replaced during resizing
+        with transaction.atomic():
+            version = RestaurantModel.next_menu_version(product.restaurant_id)
+            updated = ProductModel.objects.filter(
+                pk=product_id, image=image_name
+            ).update(image_variants=image_variants, version=version)
+
+            if updated:
+                # Synced clients pick up the new image sources
+                record_menu_change(
+                    product.restaurant_id,
+                    MenuChangeModel.Kind.PRODUCT,
+                    product_id,
+                    version,
+                )
+
+        if updated:
+            rebuild_menu_document(product.restaurant_id)
+            # Live menus refetch to pick up the new image sources
+            schedule_menu_event(product.restaurant_id)
+            schedule_menu_purge(product.restaurant_id, product_ids=[product_id])
+    except Exception:
+        logger.exception("Failed to process the image of product %s", product_id)
+    finally:
+        close_old_connections()
+
+
+def schedule_product_image_processing(product_id, image_name):
+    """
+    Processes a product image in the background worker pool once the current
+    transaction commits. Runs inline when IMAGE_PIPELINE_WORKERS is 0.
+    Several saves of a product in one transaction are processed together,
+    images replaced meanwhile are skipped by process_product_image.
+    """
+
+    def process(image_names):
+        for image_name in sorted(image_names):
+            if settings.IMAGE_PIPELINE_WORKERS > 0:
+                _get_executor().submit(process_product_image, product_id, image_name)
+            else:
+                process_product_image(product_id, image_name)
+
+    on_commit_once(("product-image", product_id), process, [image_name])
+
+
+def get_image_srcset(product):
+    """
+    Returns the `srcset` strings of a product image per format, or None if
+    its variants are not generated yet.
+    """
+    image_variants = product.image_variants or {}
+
+    if not product.image or image_variants.get("source") != product.image.name:
+        return None
+
+    storage = product.image.storage
+    variants = image_variants["variants"]
+
+    srcset = {
+        file_format: ", ".join(
+            f"{storage.url(variant[file_format])} {variant['width']}w"
+            for variant in variants.values()
+        )
+        for file_format in IMAGE_FORMATS
+    }
+
+    # Fallback `src` for clients without srcset support
+    fallback = variants.get("card") or list(variants.values())[-1]
+    srcset["src"] = storage.url(fallback["jpeg"])
+
+    return srcset
+
+
+def get_image_variant_names(product, file_name):
+    """Returns the file names of the variants generated from `file_name`."""
+    image_variants = product.image_variants or {}
+
+    if image_variants.get("source") != file_name:
+        return []
+
+    return [
+        variant[file_format]
+        for variant in image_variants["variants"].values()
+        for file_format in IMAGE_FORMATS
+    ]
+
+
+def delete_image_variants(product, file_name, storage):
+    """
+    Deletes the variants generated from `file_name`, unless another product
+    uploaded the same content and still uses them.
+    """
+    names = get_image_variant_names(product, file_name)
+
+    if not names:
+        return
+
+    digest = product.image_variants["digest"]
+    shared = (
+        ProductModel.objects.filter(image_variants__digest=digest)
+        .exclude(pk=product.pk)
+        .exists()
+    )
+
+    if shared:
+        return
+
+    for name in names:
+        storage.delete(name)
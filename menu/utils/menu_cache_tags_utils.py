@@ -0,0 +1,46 @@
+from utils.purge import schedule_purge
+from menu.models import MenuSearchEntryModel
+
+RESTAURANT_TAG = "restaurant-{id}"
+CATEGORY_TAG = "category-{id}"
+PRODUCT_TAG = "product-{id}"
+
+
+def get_restaurant_tag(restaurant_id):
+    """Returns the edge cache tag of everything served for a restaurant menu."""
+    return RESTAURANT_TAG.format(id=restaurant_id)
+
+
+def get_category_tag(category_id):
+    """Returns the edge cache tag of a category."""
+    return CATEGORY_TAG.format(id=category_id)
+
+
+def get_product_tag(product_id):
+    """Returns the edge cache tag of a product."""
+    return PRODUCT_TAG.format(id=product_id)
+
+
+def get_search_result_tags(restaurant_id, results):
+    """Returns the tags of a search response: its restaurant and every result."""
+    tags = [get_restaurant_tag(restaurant_id)]
+
+    for result in results:
+        if result["type"] == MenuSearchEntryModel.Kind.CATEGORY:
+            tags.append(get_category_tag(result["id"]))
+        else:
+            tags.append(get_product_tag(result["id"]))
+
+    return tags
+
+
+def schedule_menu_purge(restaurant_id, category_ids=(), product_ids=()):
+    """
+    Purges the edge cache entries of a restaurant menu, and of the given
+    categories and products, once the current transaction commits.
+    """
+    schedule_purge(
+        get_restaurant_tag(restaurant_id),
+        *(get_category_tag(category_id) for category_id in category_ids),
+        *(get_product_tag(product_id) for product_id in product_ids),
+    )
@@ -0,0 +1,223 @@
+import json
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from django.db import transaction
+from django.db.models import Max
+from django.db.models.functions import Greatest
+from menu.utils.menu_document_utils import (
+    PRODUCT_DOCUMENT_FIELDS,
+    get_menu_document,
+    get_product_document,
+)
+from menu.models import (
+    RestaurantModel,
+    CategoryModel,
+    ProductModel,
+    MenuChangeModel,
+)
+
+# ----------------------------------
+# Recording
+# ----------------------------------
+
+
+def record_menu_change(restaurant_id, kind, object_id, version, is_deleted=False):
+    """Stores the last change of a restaurant, category or product (one query)."""
+    record_menu_changes(restaurant_id, kind, [object_id], version, is_deleted)
+
+
+def record_menu_changes(restaurant_id, kind, object_ids, version, is_deleted=False):
+    """Stores a change of several objects of one kind, made at the same version."""
+    MenuChangeModel.objects.bulk_create(
+        [
+            MenuChangeModel(
+                restaurant_id=restaurant_id,
+                kind=kind,
+                object_id=object_id,
+                version=version,
+                is_deleted=is_deleted,
+            )
+            for object_id in object_ids
+        ],
+        update_conflicts=True,
+        unique_fields=["restaurant", "object_id"],
+        update_fields=["version", "is_deleted", "changed_at"],
+    )
+
+
+def record_menu_deletion(restaurant_id, kind, object_id):
+    """Stores the tombstone of a deleted category or product, with a new version."""
+    with transaction.atomic():
+        version = RestaurantModel.next_menu_version(restaurant_id)
+        record_menu_change(restaurant_id, kind, object_id, version, is_deleted=True)
+
+
+def record_menu_move(restaurant_id, kind, object_id, product_ids=()):
+    """
+    Stores the tombstones a category or product leaves in the change log of
+    the restaurant it moved out of (along with the products of a category),
+    with a new version of that restaurant.
+    """
+    version = RestaurantModel.next_menu_version(restaurant_id)
+    record_menu_change(restaurant_id, kind, object_id, version, is_deleted=True)
+    record_menu_changes(
+        restaurant_id, MenuChangeModel.Kind.PRODUCT, product_ids, version, is_deleted=True
+    )
+
+
+def compact_menu_changes(days=None):
+    """
+    Drops the tombstones older than `days` (MENU_CHANGES_RETENTION by
+    default) and raises the compaction floor of their restaurants, so
+    clients that synced before them fall back to a full snapshot.
+    Returns the number of dropped tombstones.
+    """
+    if days is None:
+        days = settings.MENU_CHANGES_RETENTION
+
+    tombstones = MenuChangeModel.objects.filter(
+        is_deleted=True, changed_at__lt=timezone.now() - timedelta(days=days)
+    )
+
+    with transaction.atomic():
+        floors = (
+            tombstones.order_by()
+            .values("restaurant_id")
+            .annotate(floor=Max("version"))
+            .values_list("restaurant_id", "floor")
+        )
+        for restaurant_id, floor in floors:
+            RestaurantModel.objects.filter(pk=restaurant_id).update(
+                menu_compacted_version=Greatest("menu_compacted_version", floor)
+            )
+
+        count, _ = tombstones.delete()
+
+    return count
+
+
+# ----------------------------------
+# Syncing
+# ----------------------------------
+
+
+def get_menu_snapshot(restaurant_id):
+    """Returns the full (cached) menu document as a sync response, or None."""
+    payload = get_menu_document(restaurant_id)
+
+    if payload is None:
+        return None
+
+    document = json.loads(payload["body"])
+
+    return {"version": document["version"], "snapshot": True, "menu": document}
+
+
+def get_menu_changes(restaurant_id, since=None):
+    """
+    Returns what changed in the public menu of a restaurant after the
+    `since` version: the categories and products upserted (with their
+    current values) and the ids of the deleted ones, along with the version
+    to sync from next time. Inactive categories and their products are
+    deleted from the public menu, like those moved to another restaurant.
+
+    Falls back to the full menu document (`"snapshot": true`) for clients
+    without a version, behind the compaction floor or more than
+    MENU_CHANGES_MAX changes behind. Returns None if the restaurant has
+    no public menu.
+    """
+    restaurant = (
+        RestaurantModel.objects.filter(pk=restaurant_id, is_active=True)
+        .only("id", "name", "description", "menu_version", "menu_compacted_version")
+        .first()
+    )
+
+    if restaurant is None:
+        return None
+
+    version = restaurant.menu_version
+
+    if since is None or not restaurant.menu_compacted_version <= since <= version:
+        return get_menu_snapshot(restaurant_id)
+
+    # Changes committed after the restaurant was read are left for the next sync
+    changes = list(
+        MenuChangeModel.objects.filter(
+            restaurant_id=restaurant_id, version__gt=since, version__lte=version
+        )
+        .order_by("version")
+        .values_list("kind", "object_id", "is_deleted")[: settings.MENU_CHANGES_MAX + 1]
+    )
+
+    if len(changes) > settings.MENU_CHANGES_MAX:
+        return get_menu_snapshot(restaurant_id)
+
+    ids = {kind: [] for kind in MenuChangeModel.Kind.values}
+    deleted = {"categories": [], "products": []}
+
+    for kind, object_id, is_deleted in changes:
+        if not is_deleted:
+            ids[kind].append(object_id)
+        elif kind == MenuChangeModel.Kind.CATEGORY:
+            deleted["categories"].append(object_id)
+        else:
+            deleted["products"].append(object_id)
+
+    categories = (
+        CategoryModel.objects.filter(restaurant_id=restaurant_id, is_active=True)
+        .only("id", "name", "description", "position", "is_active", "version")
+        .in_bulk(ids[MenuChangeModel.Kind.CATEGORY])
+    )
+    products = (
+        ProductModel.objects.filter(
+            restaurant_id=restaurant_id, category__is_active=True
+        )
+        .only(*PRODUCT_DOCUMENT_FIELDS, "version")
+        .in_bulk(ids[MenuChangeModel.Kind.PRODUCT])
+    )
+
+    # Objects no longer on the public menu (hidden, moved or deleted since
+    # the change log was read) are deleted from it
+    for object_id in ids[MenuChangeModel.Kind.CATEGORY]:
+        if object_id not in categories:
+            deleted["categories"].append(object_id)
+    for object_id in ids[MenuChangeModel.Kind.PRODUCT]:
+        if object_id not in products:
+            deleted["products"].append(object_id)
+
+    response = {
+        "version": version,
+        "snapshot": False,
+        "categories": [
+            {
+                "id": category.id,
+                "name": category.name,
+                "description": category.description,
+                "position": category.position,
+                "isActive": category.is_active,
+                "version": category.version,
+            }
+            for category in map(categories.get, ids[MenuChangeModel.Kind.CATEGORY])
+            if category is not None
+        ],
+        "products": [
+            {
+                **get_product_document(product),
+                "categoryId": product.category_id,
+                "position": product.position,
+                "version": product.version,
+            }
+            for product in map(products.get, ids[MenuChangeModel.Kind.PRODUCT])
+            if product is not None
+        ],
+        "deleted": deleted,
+    }
+
+    if ids[MenuChangeModel.Kind.RESTAURANT]:
+        response["restaurant"] = {
+            "name": restaurant.name,
+            "description": restaurant.description,
+        }
+
+    return response
@@ -0,0 +1,143 @@
+import json
+from django.db.models import Prefetch
+from django.core.cache import cache
+from utils.transaction import on_commit_once
+from utils.compression import build_compressed_payload
+from django.core.serializers.json import DjangoJSONEncoder
+from menu.utils.image_pipeline_utils import get_image_srcset
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+
+# ----------------------------------
+# Cache keys
+# ----------------------------------
+
+MENU_DOCUMENT_CACHE_KEY = "menu:document:{restaurant_id}"
+
+# Marker cached for unknown or inactive restaurants so repeated lookups
+# of a missing menu do not fall through to the database every time.
+MISSING_MENU_DOCUMENT = b""
+MISSING_MENU_DOCUMENT_TIMEOUT = 60
+
+# Product columns read by get_product_document (plus ordering and grouping)
+PRODUCT_DOCUMENT_FIELDS = (
+    "id",
+    "category_id",
+    "name",
+    "description",
+    "price",
+    "image",
+    "image_variants",
+    "position",
+    "is_available",
+    "created_at",
+)
+
+def get_menu_document_cache_key(restaurant_id):
+    """Returns the cache key holding the menu document of a restaurant."""
+    return MENU_DOCUMENT_CACHE_KEY.format(restaurant_id=restaurant_id)
+
+
+def get_product_document(product):
+    """Returns the public representation of a product, as listed in menus."""
+    return {
+        "id": product.id,
+        "name": product.name,
+        "description": product.description,
+        "price": product.price,
+        "image": product.image.url if product.image else None,
+        "imageSrcset": get_image_srcset(product),
+        "isAvailable": product.is_available,
+    }
+
+
+def build_menu_document(restaurant_id):
+    """
+    Builds the full public menu of a restaurant as a JSON-serializable dict.
+
+    Runs a bounded number of queries regardless of the menu size:
+    one for the restaurant, one for its categories and one for their products.
+    Returns None if the restaurant does not exist or is inactive.
+    """
+    products = ProductModel.objects.only(*PRODUCT_DOCUMENT_FIELDS)
+    categories = CategoryModel.objects.filter(is_active=True).prefetch_related(
+        Prefetch("products", queryset=products)
+    )
+    restaurant = (
+        RestaurantModel.objects.filter(pk=restaurant_id, is_active=True)
+        .prefetch_related(Prefetch("categories", queryset=categories))
+        .first()
+    )
+
+    if restaurant is None:
+        return None
+
+    return {
+        "id": restaurant.id,
+        "name": restaurant.name,
+        "description": restaurant.description,
+        # Clients sync the changes made after this version (see get_menu_changes)
+        "version": restaurant.menu_version,
+        "updatedAt": restaurant.updated_at,
+        "categories": [
+            {
+                "id": category.id,
+                "name": category.name,
+                "description": category.description,
+                "products": [
+                    get_product_document(product)
+                    for product in category.products.all()
+                ],
+            }
+            for category in restaurant.categories.all()
+        ],
+    }
+
+
+def rebuild_menu_document(restaurant_id):
+    """
+    Rebuilds the menu document of a restaurant and stores it in the cache
+    as ready-to-send JSON bytes, along with their gzip encoding.
+    Returns the stored payload.
+    """
+    document = build_menu_document(restaurant_id)
+    key = get_menu_document_cache_key(restaurant_id)
+
+    if document is None:
+        cache.set(key, MISSING_MENU_DOCUMENT, MISSING_MENU_DOCUMENT_TIMEOUT)
+        return MISSING_MENU_DOCUMENT
+
+    body = json.dumps(
+        document, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    payload = build_compressed_payload(body)
+
+    # Menu documents never expire, they are rebuilt whenever the menu changes
+    cache.set(key, payload, None)
+
+    return payload
+
+
+def get_menu_document(restaurant_id):
+    """
+    Returns the cached menu payload of a restaurant (see
+    `build_compressed_payload`), or None if the restaurant has no public menu.
+    Warm reads are a single cache hit.
+    """
+    payload = cache.get(get_menu_document_cache_key(restaurant_id))
+
+    if payload is None:
+        payload = rebuild_menu_document(restaurant_id)
+
+    return payload or None
+
+
+def schedule_menu_document_rebuild(restaurant_id):
+    """
+    Rebuilds the menu document of a restaurant once the current transaction
+    commits. Any number of writes to the same menu inside one transaction
+    results in a single rebuild.
+    """
+    on_commit_once(
+        ("menu-document", restaurant_id),
+        lambda _: rebuild_menu_document(restaurant_id),
+    )
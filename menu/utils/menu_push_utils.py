@@ -0,0 +1,115 @@
+import json
+from menu.models import ProductModel
+from utils.pubsub import publish
+from utils.transaction import on_commit_once
+from django.core.serializers.json import DjangoJSONEncoder
+
+MENU_CHANNEL = "menu:{restaurant_id}"
+
+# Product fields shown in the menu document, tracked to detect what a save changed
+TRACKED_PRODUCT_FIELDS = (
+    "category_id",
+    "name",
+    "description",
+    "price",
+    "image",
+    "position",
+    "is_available",
+)
+
+# Product fields pushed as deltas, any other change asks clients to refetch
+PUSHED_PRODUCT_FIELDS = {"price": "price", "is_available": "isAvailable"}
+
+
+def get_menu_channel(restaurant_id):
+    """Returns the pub/sub channel of a restaurant menu."""
+    return MENU_CHANNEL.format(restaurant_id=restaurant_id)
+
+
+def format_event(event, data):
+    """Formats a Server-Sent Events frame, once for all subscribers."""
+    data = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False)
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def get_tracked_values(product):
+    """Returns the loaded (non-deferred) tracked field values of a product."""
+    values = {}
+
+    for field in TRACKED_PRODUCT_FIELDS:
+        if field in product.__dict__:
+            value = product.__dict__[field]
+            # Image fields hold a file name or a FieldFile
+            values[field] = getattr(value, "name", value)
+
+    return values
+
+
+def remember_tracked_values(product):
+    """Stores the tracked values a product was loaded or saved with."""
+    product._tracked_values = get_tracked_values(product)
+
+
+def get_product_delta(product, created=False):
+    """
+    Returns the pushed fields changed by the last save of a product (possibly
+    empty), or None if other menu fields changed, or may have, and clients
+    should refetch the menu.
+    """
+    original = getattr(product, "_tracked_values", None)
+    if created or original is None or len(original) < len(TRACKED_PRODUCT_FIELDS):
+        return None
+
+    current = get_tracked_values(product)
+    changed = {
+        field for field in TRACKED_PRODUCT_FIELDS if original[field] != current.get(field)
+    }
+
+    if changed - PUSHED_PRODUCT_FIELDS.keys():
+        return None
+
+    return {PUSHED_PRODUCT_FIELDS[field]: current[field] for field in changed}
+
+
+def schedule_menu_event(restaurant_id, product_id=None):
+    """
+    Pushes a change of a restaurant menu once the current transaction commits.
+
+    Availability and price changes of products are pushed as `product`
+    deltas, carrying the committed values; any other change is pushed as
+    a single `menu` event telling clients to refetch the menu document.
+    Changes of one transaction are merged, a `menu` event supersedes all
+    deltas.
+    """
+    on_commit_once(
+        ("menu-events", restaurant_id),
+        lambda product_ids: publish_menu_events(restaurant_id, product_ids),
+        [product_id],
+    )
+
+
+def publish_menu_events(restaurant_id, product_ids):
+    """
+    Publishes the events of a committed change of a restaurant menu, where
+    a None product id stands for a change that needs a refetch.
+    """
+    channel = get_menu_channel(restaurant_id)
+
+    products = []
+    if None not in product_ids:
+        products = ProductModel.objects.filter(
+            pk__in=product_ids, restaurant_id=restaurant_id
+        ).values("id", "price", "is_available")
+
+    # Products deleted or moved meanwhile are gone from this menu
+    if len(products) < len(product_ids):
+        publish(channel, format_event("menu", {"restaurantId": restaurant_id}))
+        return
+
+    for product in sorted(products, key=lambda product: str(product["id"])):
+        data = {
+            "id": product["id"],
+            "price": product["price"],
+            "isAvailable": product["is_available"],
+        }
+        publish(channel, format_event("product", data))
@@ -0,0 +1,256 @@
+from django.db import connection
+from django.db.models import Q
+from utils.text import normalize_persian_text, split_persian_words
+from menu.utils.menu_document_utils import (
+    PRODUCT_DOCUMENT_FIELDS,
+    get_product_document,
+)
+from menu.models import (
+    ProductModel,
+    CategoryModel,
+    MenuSearchEntryModel,
+)
+
+# Longer queries are truncated, every extra term makes the match costlier
+MAX_SEARCH_TERMS = 8
+
+SQLITE_SEARCH_QUERY = """
+    SELECT entry.id, entry.kind, entry.object_id
+    FROM menu_search_fts
+    JOIN menu_menusearchentrymodel AS entry ON entry.id = menu_search_fts.rowid
+    WHERE menu_search_fts MATCH %s AND entry.is_visible
+    ORDER BY bm25(menu_search_fts, 10.0, 1.0, 0.0)
+    LIMIT %s
+"""
+
+POSTGRESQL_SEARCH_QUERY = """
+    SELECT id, kind, object_id
+    FROM menu_menusearchentrymodel, to_tsquery('simple', %s) AS query
+    WHERE restaurant_id = %s AND is_visible AND search_vector @@ query
+    ORDER BY ts_rank(search_vector, query) DESC
+    LIMIT %s
+"""
+
+# ----------------------------------
+# Indexing
+# ----------------------------------
+
+
+def get_search_entry(kind, instance, category_id, is_visible):
+    return MenuSearchEntryModel(
+        kind=kind,
+        object_id=instance.id,
+        restaurant_id=instance.restaurant_id,
+        category_id=category_id,
+        name=normalize_persian_text(instance.name),
+        description=normalize_persian_text(instance.description),
+        is_visible=is_visible,
+    )
+
+
+def index_menu_item(instance):
+    """
+    Creates or updates the search entry of a category or product. Indexing a
+    category also updates the visibility (and restaurant) of its products.
+    """
+    if isinstance(instance, CategoryModel):
+        entry = get_search_entry(
+            MenuSearchEntryModel.Kind.CATEGORY, instance, instance.id, instance.is_active
+        )
+        MenuSearchEntryModel.objects.filter(
+            category_id=instance.id, kind=MenuSearchEntryModel.Kind.PRODUCT
+        ).exclude(
+            is_visible=instance.is_active, restaurant_id=instance.restaurant_id
+        ).update(
+            is_visible=instance.is_active, restaurant_id=instance.restaurant_id
+        )
+    else:
+        entry = get_search_entry(
+            MenuSearchEntryModel.Kind.PRODUCT,
+            instance,
+            instance.category_id,
+            instance.category.is_active,
+        )
+
+    MenuSearchEntryModel.objects.update_or_create(
+        object_id=entry.object_id,
+        defaults={
+            field: getattr(entry, field)
+            for field in (
+                "kind",
+                "restaurant_id",
+                "category_id",
+                "name",
+                "description",
+                "is_visible",
+            )
+        },
+    )
+
+
+def reindex_products(products):
+    """
+    Updates the indexed names and descriptions of the given products with
+    a single bulk update (products never indexed are indexed one by one).
+    """
+    entries = MenuSearchEntryModel.objects.in_bulk(
+        [product.id for product in products], field_name="object_id"
+    )
+
+    for product in products:
+        entry = entries.get(product.id)
+
+        if entry is None:
+            index_menu_item(product)
+        else:
+            entry.name = normalize_persian_text(product.name)
+            entry.description = normalize_persian_text(product.description)
+
+    MenuSearchEntryModel.objects.bulk_update(entries.values(), ["name", "description"])
+
+
+def unindex_menu_items(*object_ids):
+    """Removes the search entries of the given categories or products."""
+    MenuSearchEntryModel.objects.filter(object_id__in=object_ids).delete()
+
+
+def rebuild_search_index(restaurant_ids=None, batch_size=2000):
+    """
+    Rebuilds the search entries of the given restaurants (all by default),
+    e.g. after bulk inserts that bypassed the signals. Returns the number
+    of indexed categories and products.
+    """
+    entries = MenuSearchEntryModel.objects.all()
+    categories = CategoryModel.objects.only(
+        "id", "restaurant_id", "name", "description", "is_active"
+    )
+    products = ProductModel.objects.select_related("category").only(
+        "id",
+        "restaurant_id",
+        "category_id",
+        "name",
+        "description",
+        "category__is_active",
+    )
+
+    if restaurant_ids is not None:
+        entries = entries.filter(restaurant_id__in=restaurant_ids)
+        categories = categories.filter(restaurant_id__in=restaurant_ids)
+        products = products.filter(restaurant_id__in=restaurant_ids)
+
+    entries.delete()
+
+    def generate_entries():
+        for category in categories.iterator(chunk_size=batch_size):
+            yield get_search_entry(
+                MenuSearchEntryModel.Kind.CATEGORY,
+                category,
+                category.id,
+                category.is_active,
+            )
+        for product in products.iterator(chunk_size=batch_size):
+            yield get_search_entry(
+                MenuSearchEntryModel.Kind.PRODUCT,
+                product,
+                product.category_id,
+                product.category.is_active,
+            )
+
+    count = 0
+    batch = []
+    for entry in generate_entries():
+        batch.append(entry)
+        if len(batch) == batch_size:
+            MenuSearchEntryModel.objects.bulk_create(batch)
+            count += len(batch)
+            batch = []
+
+    MenuSearchEntryModel.objects.bulk_create(batch)
+    return count + len(batch)
+
+
+# ----------------------------------
+# Searching
+# ----------------------------------
+
+
+def find_search_entries(restaurant_id, terms, limit):
+    """Returns the best matching visible entries of a restaurant, best first."""
+    if connection.vendor == "sqlite":
+        # Every term is a prefix, the restaurant id is an exact token
+        expression = "restaurant_id:\"%s\" AND {name description}: (%s)" % (
+            restaurant_id.hex,
+            " ".join('"%s"*' % term for term in terms),
+        )
+        return list(
+            MenuSearchEntryModel.objects.raw(SQLITE_SEARCH_QUERY, [expression, limit])
+        )
+
+    if connection.vendor == "postgresql":
+        expression = " & ".join("%s:*" % term for term in terms)
+        return list(
+            MenuSearchEntryModel.objects.raw(
+                POSTGRESQL_SEARCH_QUERY, [expression, restaurant_id, limit]
+            )
+        )
+
+    # Databases without a full-text index scan the restaurant's entries
+    condition = Q()
+    for term in terms:
+        condition &= Q(name__contains=term) | Q(description__contains=term)
+
+    return list(
+        MenuSearchEntryModel.objects.filter(
+            condition, restaurant_id=restaurant_id, is_visible=True
+        ).order_by("name")[:limit]
+    )
+
+
+def search_menu(restaurant_id, query, limit=20):
+    """
+    Searches the categories and products of a restaurant's public menu.
+
+    The query is normalized like the indexed text, each of its words is
+    matched as a prefix, and results are ranked by relevance (name matches
+    first). Returns a list of category and product dicts, best first.
+    """
+    terms = split_persian_words(query)[:MAX_SEARCH_TERMS]
+    if not terms:
+        return []
+
+    entries = find_search_entries(restaurant_id, terms, limit)
+
+    ids = {
+        kind: [entry.object_id for entry in entries if entry.kind == kind]
+        for kind in MenuSearchEntryModel.Kind.values
+    }
+    categories = CategoryModel.objects.only("id", "name", "description").in_bulk(
+        ids[MenuSearchEntryModel.Kind.CATEGORY]
+    )
+    products = ProductModel.objects.only(*PRODUCT_DOCUMENT_FIELDS).in_bulk(
+        ids[MenuSearchEntryModel.Kind.PRODUCT]
+    )
+
+    results = []
+    for entry in entries:
+        if entry.kind == MenuSearchEntryModel.Kind.CATEGORY:
+            category = categories.get(entry.object_id)
+            if category is not None:
+                results.append(
+                    {
+                        "type": entry.kind,
+                        "id": category.id,
+                        "name": category.name,
+                        "description": category.description,
+                    }
+                )
+        elif (product := products.get(entry.object_id)) is not None:
+            results.append(
+                {
+                    "type": entry.kind,
+                    "categoryId": product.category_id,
+                    **get_product_document(product),
+                }
+            )
+
+    return results
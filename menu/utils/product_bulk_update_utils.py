@@ -0,0 +1,111 @@
+from django.utils import timezone
+from django.db import transaction
+from menu.models import RestaurantModel, ProductModel, MenuChangeModel
+from menu.utils.menu_search_utils import reindex_products
+from menu.utils.menu_changes_utils import record_menu_changes
+from menu.utils.menu_cache_tags_utils import schedule_menu_purge
+from menu.utils.menu_document_utils import schedule_menu_document_rebuild
+from menu.utils.menu_push_utils import (
+    get_product_delta,
+    schedule_menu_event,
+    remember_tracked_values,
+)
+
+# Product fields a bulk update may change
+BULK_UPDATE_FIELDS = ("name", "description", "price", "position", "is_available")
+
+# Fields of the search entries
+SEARCHABLE_FIELDS = {"name", "description"}
+
+
+def bulk_update_products(changes):
+    """
+    Applies `(product, values)` changes, `values` being a dict of
+    BULK_UPDATE_FIELDS, in one transaction and with one bulk_update per
+    set of changed fields.
+
+    The products are read again, locked, inside the transaction: each row
+    only gets the fields of its own change, so concurrent writes to other
+    fields are kept. Products deleted meanwhile are skipped.
+
+    Bypasses save() and its signals: every affected restaurant gets one
+    menu version, one menu document rebuild, one push of live events and
+    one edge cache purge, and the search entries are updated in bulk.
+    Returns the products.
+    """
+    now = timezone.now()
+    restaurant_ids = sorted({product.restaurant_id for product, _ in changes})
+
+    with transaction.atomic():
+        # Restaurants are locked before their products, in a fixed order, as
+        # saves do: concurrent batches and saves cannot deadlock
+        list(
+            RestaurantModel.objects.select_for_update()
+            .filter(pk__in=restaurant_ids)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        found = ProductModel.objects.select_for_update().in_bulk(
+            [product.pk for product, _ in changes]
+        )
+
+        products = []
+        groups = {}
+        restaurants = {}
+
+        for product, values in changes:
+            product = found.get(product.pk)
+            if product is None:
+                continue
+
+            for field, value in values.items():
+                setattr(product, field, value)
+
+            product.updated_at = now
+            products.append(product)
+            groups.setdefault(frozenset(values), []).append(product)
+            restaurants.setdefault(product.restaurant_id, []).append(product)
+
+        for restaurant_id in sorted(restaurants):
+            version = RestaurantModel.next_menu_version(restaurant_id)
+
+            for product in restaurants[restaurant_id]:
+                product.version = version
+
+            record_menu_changes(
+                restaurant_id,
+                MenuChangeModel.Kind.PRODUCT,
+                [product.id for product in restaurants[restaurant_id]],
+                version,
+            )
+
+        for fields, group in groups.items():
+            ProductModel.objects.bulk_update(
+                group, [*sorted(fields), "version", "updated_at"]
+            )
+
+        searchable = [
+            product
+            for fields, group in groups.items()
+            if SEARCHABLE_FIELDS.intersection(fields)
+            for product in group
+        ]
+        if searchable:
+            reindex_products(searchable)
+
+        for restaurant_id, group in restaurants.items():
+            schedule_menu_document_rebuild(restaurant_id)
+            schedule_menu_purge(
+                restaurant_id, product_ids=[product.pk for product in group]
+            )
+
+            for product in group:
+                delta = get_product_delta(product)
+                remember_tracked_values(product)
+
+                if delta is None:
+                    schedule_menu_event(restaurant_id)
+                elif delta:
+                    schedule_menu_event(restaurant_id, product.pk)
+
+    return products
@@ -0,0 +1,5 @@
+from .menu_document_view import MenuDocumentView
+from .menu_views import RestaurantViewSet, CategoryViewSet, ProductViewSet
+from .menu_search_view import MenuSearchView
+from .menu_events_view import MenuEventsView
+from .menu_changes_view import MenuChangesView
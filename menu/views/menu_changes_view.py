@@ -0,0 +1,56 @@
+from rest_framework import status
+from django.http import JsonResponse
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from menu.utils import get_menu_changes, get_restaurant_tag
+from utils.purge import add_cache_tags, patch_edge_cache_control
+from rest_framework.throttling import ScopedRateThrottle
+
+
+class MenuChangesView(APIView):
+    """
+    Public API endpoint returning what changed in a restaurant menu since
+    the version a client last synced, e.g. `menu/<id>/changes/?since=42`.
+
+    Clients keep the returned `version` for their next sync. Without a
+    `since`, or when too far behind, the response is a full snapshot of
+    the menu (`"snapshot": true`) instead of a delta.
+    """
+
+    http_method_names = ["get"]
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    throttle_scope = "menu"
+    throttle_classes = [ScopedRateThrottle]
+
+    def get(self, request: Request, restaurant_id):
+        since = request.query_params.get("since")
+
+        if since is not None:
+            try:
+                since = int(since)
+            except ValueError:
+                since = -1
+
+            if since < 0:
+                return Response(
+                    data={"since": ["نسخه منو نامعتبر است."]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        changes = get_menu_changes(restaurant_id, since)
+
+        if changes is None:
+            return Response(
+                data={"message": "منو یافت نشد."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # Same JSON encoding as the menu document (prices as strings)
+        response = JsonResponse(changes, json_dumps_params={"ensure_ascii": False})
+        add_cache_tags(response, [get_restaurant_tag(restaurant_id)])
+
+        return patch_edge_cache_control(response)
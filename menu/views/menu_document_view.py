@@ -0,0 +1,48 @@
+from rest_framework import status
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from menu.utils import get_menu_document, get_restaurant_tag
+from analytics.utils import count_restaurant_view
+from utils.compression import compressed_payload_response
+from utils.purge import add_cache_tags, patch_edge_cache_control
+from rest_framework.throttling import ScopedRateThrottle
+
+
+class MenuDocumentView(APIView):
+    """
+    Public API endpoint returning the full menu of a restaurant.
+
+    The menu is served from a precomputed JSON document kept in the cache,
+    so a warm request runs no SQL, no serializers and no compression.
+    Responses are cached at the edge under the restaurant tag, purged on
+    any change of the menu.
+    """
+
+    http_method_names = ["get"]
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    throttle_scope = "menu"
+    throttle_classes = [ScopedRateThrottle]
+
+    def get(self, request: Request, restaurant_id):
+        payload = get_menu_document(restaurant_id)
+
+        if payload is None:
+            return Response(
+                data={"message": "منو یافت نشد."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # Counted in memory, flushed to the daily rollups in batches. Menus
+        # cached at the edge are counted by the clients' view beacon instead
+        if not settings.EDGE_CACHE_MAX_AGE:
+            count_restaurant_view(restaurant_id)
+
+        response = compressed_payload_response(request, payload)
+        add_cache_tags(response, [get_restaurant_tag(restaurant_id)])
+
+        return patch_edge_cache_control(response)
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+from collections import Counter
+from django.views import View
+from django.conf import settings
+from utils.pubsub import get_hub
+from asgiref.sync import sync_to_async
+from rest_framework.throttling import BaseThrottle
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from menu.utils import get_menu_document, get_menu_channel
+
+# Open streams per client, in this worker process
+_connections = Counter()
+_connections_lock = threading.Lock()
+
+
+def get_client_ident(request):
+    """
+    Identifies the client of a request as DRF throttling does: by the
+    X-Forwarded-For address set by the NUM_PROXIES reverse proxies, or
+    by REMOTE_ADDR when the app is not behind a proxy.
+    """
+    return BaseThrottle().get_ident(request)
+
+
+def count_connections(address):
+    """Returns the number of streams open to a client."""
+    with _connections_lock:
+        return _connections[address]
+
+
+def open_connection(address):
+    """Counts a new stream of a client, False if over the limit."""
+    with _connections_lock:
+        if _connections[address] >= settings.MENU_EVENTS_MAX_CONNECTIONS:
+            return False
+
+        _connections[address] += 1
+        return True
+
+
+def close_connection(address):
+    with _connections_lock:
+        _connections[address] -= 1
+        if _connections[address] <= 0:
+            del _connections[address]
+
+
+async def stream_menu_events(channel, address=None):
+    """
+    Yields the Server-Sent Events of a menu channel, with a comment line
+    every MENU_EVENTS_HEARTBEAT seconds to keep idle connections open
+    through proxies. Ends the stream if the client falls behind, browsers
+    then reconnect and refetch the menu.
+
+    Ends right away when the client already holds
+    MENU_EVENTS_MAX_CONNECTIONS streams.
+    """
+    if not open_connection(address):
+        yield f"retry: {settings.MENU_EVENTS_RETRY * 10}\n\n"
+        return
+
+    try:
+        subscription = get_hub().subscribe(channel)
+    except Exception:
+        close_connection(address)
+        raise
+
+    try:
+        yield f"retry: {settings.MENU_EVENTS_RETRY}\n: connected\n\n"
+
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    subscription.get(), settings.MENU_EVENTS_HEARTBEAT
+                )
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+
+            if message is None:
+                return
+
+            yield message
+    finally:
+        subscription.close()
+        close_connection(address)
+
+
+class MenuEventsView(View):
+    """
+    Public Server-Sent Events endpoint pushing the changes of a restaurant
+    menu: `product` events carry price/availability deltas, `menu` events
+    ask the client to refetch the menu document.
+
+    Served by an ASGI server only, where an idle connection costs a queue
+    on the worker's event loop rather than a thread: WSGI requests get a
+    501 instead of holding a worker for as long as the client listens.
+    Each client (see `get_client_ident`) may hold MENU_EVENTS_MAX_CONNECTIONS
+    streams.
+    """
+
+    http_method_names = ["get"]
+
+    async def get(self, request, restaurant_id):
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse(
+                {"message": "این سرویس فقط روی سرور ASGI در دسترس است."},
+                status=501,
+                json_dumps_params={"ensure_ascii": False},
+            )
+
+        address = get_client_ident(request)
+        if count_connections(address) >= settings.MENU_EVENTS_MAX_CONNECTIONS:
+            return JsonResponse(
+                {"message": "تعداد اتصال‌های باز بیش از حد مجاز است."},
+                status=429,
+                json_dumps_params={"ensure_ascii": False},
+            )
+
+        if await sync_to_async(get_menu_document)(restaurant_id) is None:
+            return JsonResponse(
+                {"message": "منو یافت نشد."},
+                status=404,
+                json_dumps_params={"ensure_ascii": False},
+            )
+
+        response = StreamingHttpResponse(
+            stream_menu_events(get_menu_channel(restaurant_id), address),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        # Stop nginx from buffering the stream
+        response["X-Accel-Buffering"] = "no"
+
+        return response
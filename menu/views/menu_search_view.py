@@ -0,0 +1,60 @@
+from rest_framework import status
+from django.http import JsonResponse
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from menu.utils import get_menu_document, search_menu, get_search_result_tags
+from utils.purge import add_cache_tags, patch_edge_cache_control
+from rest_framework.throttling import ScopedRateThrottle
+
+MAX_SEARCH_RESULTS = 50
+
+
+class MenuSearchView(APIView):
+    """
+    Public API endpoint searching the categories and products of a
+    restaurant menu, e.g. `menu/<id>/search/?q=چای`.
+
+    Queries go through the same Persian normalization as the indexed text
+    and are answered from the full-text index.
+    """
+
+    http_method_names = ["get"]
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    throttle_scope = "menu"
+    throttle_classes = [ScopedRateThrottle]
+
+    def get(self, request: Request, restaurant_id):
+        query = request.query_params.get("q", "").strip()
+
+        if not query:
+            return Response(
+                data={"q": ["عبارت جستجو را وارد کنید."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Unknown and inactive restaurants are answered from the cache
+        if get_menu_document(restaurant_id) is None:
+            return Response(
+                data={"message": "منو یافت نشد."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        try:
+            limit = min(int(request.query_params.get("limit", 20)), MAX_SEARCH_RESULTS)
+        except ValueError:
+            limit = 20
+
+        results = search_menu(restaurant_id, query, limit=max(limit, 1))
+
+        # Same JSON encoding as the menu document (prices as strings)
+        response = JsonResponse(
+            {"query": query, "results": results},
+            json_dumps_params={"ensure_ascii": False},
+        )
+        add_cache_tags(response, get_search_result_tags(restaurant_id, results))
+
+        return patch_edge_cache_control(response)
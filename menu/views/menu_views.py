@@ -0,0 +1,76 @@
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from menu.utils import bulk_update_products
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.throttling import ScopedRateThrottle
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+from menu.serializers import (
+    RestaurantSerializer,
+    CategorySerializer,
+    ProductSerializer,
+    ProductBulkUpdateSerializer,
+)
+
+
+class RestaurantViewSet(viewsets.ModelViewSet):
+    """
+    API endpoints for owners to manage their restaurants.
+    """
+
+    serializer_class = RestaurantSerializer
+    permission_classes = [IsAuthenticated]
+
+    throttle_scope = "user"
+    throttle_classes = [ScopedRateThrottle]
+
+    def get_queryset(self):
+        return RestaurantModel.objects.filter(owner=self.request.user)
+
+    def perform_create(self, serializer):
+        serializer.save(owner=self.request.user)
+
+
+class CategoryViewSet(viewsets.ModelViewSet):
+    """
+    API endpoints for owners to manage the categories of their restaurants.
+    """
+
+    serializer_class = CategorySerializer
+    permission_classes = [IsAuthenticated]
+
+    throttle_scope = "user"
+    throttle_classes = [ScopedRateThrottle]
+
+    def get_queryset(self):
+        return CategoryModel.objects.filter(restaurant__owner=self.request.user)
+
+
+class ProductViewSet(viewsets.ModelViewSet):
+    """
+    API endpoints for owners to manage the products of their restaurants.
+
+    `PATCH products/bulk/` updates up to MENU_BULK_UPDATE_MAX products in
+    one request and one transaction, e.g. to reprice or restock a menu.
+    """
+
+    serializer_class = ProductSerializer
+    permission_classes = [IsAuthenticated]
+
+    throttle_scope = "user"
+    throttle_classes = [ScopedRateThrottle]
+
+    def get_queryset(self):
+        return ProductModel.objects.filter(restaurant__owner=self.request.user)
+
+    @action(detail=False, methods=["patch"], url_path="bulk")
+    def bulk(self, request):
+        serializer = ProductBulkUpdateSerializer(
+            data=request.data,
+            context={"request": request, "queryset": self.get_queryset()},
+        )
+        serializer.is_valid(raise_exception=True)
+
+        products = bulk_update_products(serializer.validated_data["products"])
+
+        return Response({"products": self.get_serializer(products, many=True).data})
@@ -1 +1,2 @@
 from .user_admin import UserAdmin
+from .archived_user_admin import ArchivedUserAdmin
@@ -0,0 +1,17 @@
+from django.contrib import admin
+from users.models import ArchivedUserModel
+
+
+@admin.register(ArchivedUserModel)
+class ArchivedUserAdmin(admin.ModelAdmin):
+    model = ArchivedUserModel
+
+    list_display = ["username", "email", "phone_number", "archived_at"]
+    search_fields = ["username", "email", "phone_number"]
+
+    readonly_fields = ["id", "username", "email", "phone_number", "data", "archived_at"]
+    exclude = ["password"]
+
+    def has_add_permission(self, request):
+        # Users are archived by the archive_users command only
+        return False
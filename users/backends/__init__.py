@@ -1 +1,2 @@
 from .auth_backend import AuthBackend
+from .permission_backend import CachedPermissionBackend
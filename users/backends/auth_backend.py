@@ -1,6 +1,7 @@
 from logging import getLogger
 from django.db.models import Q
 from users.models import UserModel
+from users.utils import restore_archived_user
 from django.utils.timezone import now
 from django.contrib.auth.backends import BaseBackend
 
@@ -10,6 +11,7 @@ logger = getLogger("login_v1")
 class AuthBackend(BaseBackend):
     """
     Custom authentication backend that allows authentication using email, username, or phone number.
+    Archived users (see the archive_users command) are restored on their first successful login.
     """
 
     def authenticate(self, request, username=None, password=None, **kwargs):
@@ -21,7 +23,13 @@ class AuthBackend(BaseBackend):
             Q(email=username) | Q(username=username) | Q(phone_number=username)
         ).first()
 
-        if user and user.check_password(password):
+        if user is None:
+            # Long-inactive users are restored from the archive on a successful login
+            user = restore_archived_user(username, password)
+        elif not user.check_password(password):
+            user = None
+
+        if user:
             # Log successful login with timestamp
             message = (
                 f"Successful login! URL: {request.build_absolute_uri()}, "
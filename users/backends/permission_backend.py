@@ -0,0 +1,27 @@
+from django.contrib.auth.backends import ModelBackend
+from users.utils import get_cached_permissions, set_cached_permissions
+
+
+class CachedPermissionBackend(ModelBackend):
+    """
+    ModelBackend whose resolved permissions are shared across requests.
+
+    The group and permission JOINs run once per user; later `has_perm`,
+    `has_module_perms` and `get_all_permissions` calls are answered from
+    the cache until a signal invalidates the entry (see users.signals).
+    """
+
+    def get_all_permissions(self, user_obj, obj=None):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+
+        if not hasattr(user_obj, "_perm_cache"):
+            permissions, versions = get_cached_permissions(user_obj)
+
+            if permissions is None:
+                permissions = super().get_all_permissions(user_obj)
+                set_cached_permissions(user_obj, permissions, versions)
+
+            user_obj._perm_cache = permissions
+
+        return user_obj._perm_cache
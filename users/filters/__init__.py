@@ -0,0 +1 @@
+from .user_filters import UserFilter
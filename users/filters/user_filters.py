@@ -0,0 +1,40 @@
+import django_filters
+from django.db.models import Q
+from users.models import UserModel
+from users.utils import normalize_phone_number
+
+
+class UserFilter(django_filters.FilterSet):
+    """
+    Filters for the staff user directory.
+    """
+
+    isActive = django_filters.BooleanFilter(field_name="is_active")
+    isStaff = django_filters.BooleanFilter(field_name="is_staff")
+
+    createdAfter = django_filters.IsoDateTimeFilter(
+        field_name="created_at", lookup_expr="gte"
+    )
+    createdBefore = django_filters.IsoDateTimeFilter(
+        field_name="created_at", lookup_expr="lt"
+    )
+
+    # Prefix match on any login identifier (username, email or phone number)
+    identifier = django_filters.CharFilter(method="filter_identifier")
+
+    class Meta:
+        model = UserModel
+        fields = ["isActive", "isStaff", "createdAfter", "createdBefore", "identifier"]
+
+    def filter_identifier(self, queryset, name, value):
+        value = value.strip().lower()
+
+        if not value:
+            return queryset
+
+        return queryset.filter(
+            Q(username__startswith=value)
+            | Q(email__startswith=value)
+            | Q(phone_number__startswith=normalize_phone_number(value))
+            | Q(phone_number__startswith=value)
+        )
@@ -0,0 +1,65 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from users.models import UserModel, ArchivedUserModel
+from users.utils import archive_users, get_cold_users, get_table_sizes
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves users without a login for --days to the compact archive table, "
+        "in keyset chunks, and reports the size of the users table before and after. "
+        "Archived users are restored on their next successful login."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.USER_ARCHIVE_AFTER_DAYS,
+            help="Archive users without a login for more than DAYS days.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the users that would be archived.",
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            count = get_cold_users(options["days"]).count()
+            self.stdout.write(f"{count} users would be archived.")
+            return
+
+        before = get_table_sizes(UserModel, ArchivedUserModel)
+        started = time.perf_counter()
+        count = 0
+
+        for archived in archive_users(options["days"], options["batch_size"]):
+            count += archived
+            self.stdout.write(f"Archived {count} users...")
+
+        self.stdout.write(
+            f"Archived {count} users in {time.perf_counter() - started:.1f}s."
+        )
+
+        after = get_table_sizes(UserModel, ArchivedUserModel)
+        if before is None or after is None:
+            self.stdout.write("Table sizes are not available on this database.")
+            return
+
+        for table in before:
+            (table_before, index_before), (table_after, index_after) = (
+                before[table],
+                after[table],
+            )
+            self.stdout.write(
+                f"{table}: table {self.format_size(table_before)} -> "
+                f"{self.format_size(table_after)}, indexes "
+                f"{self.format_size(index_before)} -> {self.format_size(index_after)}"
+            )
+
+    @staticmethod
+    def format_size(size):
+        return f"{size / 1024:.0f} KiB"
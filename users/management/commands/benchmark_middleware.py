@@ -0,0 +1,87 @@
+import time
+import statistics
+from django.conf import settings
+from django.test import Client
+from django.db import transaction
+from users.models import UserModel
+from users.views import UserInfoView
+from django.test.utils import override_settings
+from django.core.management.base import BaseCommand
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the per-request cost of UserInfoView through the full request "
+        "handler with the legacy middleware stack versus the route-aware one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, help="Per round")
+        parser.add_argument("--rounds", type=int, default=10)
+
+    url = "/" + settings.BASE_URL + "users/user-info/"
+
+    def make_client(self, middleware, token):
+        """Returns a test client whose handler is built with the given middleware."""
+        with override_settings(MIDDLEWARE=middleware):
+            client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+            # The handler loads its middleware chain on the first request
+            response = client.get(self.url)
+
+        assert response.status_code == 200, response.status_code
+        return client
+
+    def measure(self, client, count):
+        """Returns the CPU microseconds per request of one round."""
+        start = time.process_time()
+        for _ in range(count):
+            client.get(self.url)
+        return (time.process_time() - start) / count * 1_000_000
+
+    def handle(self, *args, **options):
+        legacy = [
+            path
+            for path in settings.MIDDLEWARE
+            if path != "utils.middleware.SessionRouteMiddleware"
+        ] + settings.SESSION_MIDDLEWARE
+
+        # Throttling would reject most of the requests, it costs the same on both stacks
+        throttle_classes = UserInfoView.throttle_classes
+        UserInfoView.throttle_classes = []
+
+        try:
+            with override_settings(ALLOWED_HOSTS=["testserver"]), transaction.atomic():
+                user = UserModel.objects.create_user(
+                    email="benchmark@example.com",
+                    username="benchmark_middleware",
+                    password="BenchmarkPass123!",
+                )
+                token = str(AccessToken.for_user(user))
+
+                clients = {
+                    "full stack": self.make_client(legacy, token),
+                    "route-aware": self.make_client(settings.MIDDLEWARE, token),
+                }
+                timings = {name: [] for name in clients}
+
+                # Interleave the stacks so both see the same machine noise
+                for _ in range(options["rounds"]):
+                    for name, client in clients.items():
+                        timings[name].append(self.measure(client, options["requests"]))
+
+                # Leave no benchmark user behind
+                transaction.set_rollback(True)
+        finally:
+            UserInfoView.throttle_classes = throttle_classes
+
+        self.stdout.write(
+            f"{options['rounds']} rounds of {options['requests']} authenticated "
+            f"GET /users/user-info/ (median CPU per request)"
+        )
+        medians = {name: statistics.median(values) for name, values in timings.items()}
+        for name, median in medians.items():
+            self.stdout.write(f"{name:<12} {median:>8.1f} µs")
+
+        saved = medians["full stack"] - medians["route-aware"]
+        self.stdout.write(f"Saved {saved:.1f} µs per request")
@@ -0,0 +1,217 @@
+import time
+import uuid
+import random
+import hashlib
+from decimal import Decimal
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from django.conf import settings
+from django.db import transaction
+from users.models import UserModel
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from menu.utils import rebuild_search_index
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+
+FIRST_NAMES = ["علی", "مریم", "رضا", "زهرا", "حسین", "فاطمه", "Sara", "Omid", "Nima", "Leila"]
+LAST_NAMES = ["احمدی", "محمدی", "حسینی", "رضایی", "کریمی", "Moradi", "Rahimi", "Jafari"]
+CATEGORY_NAMES = ["نوشیدنی گرم", "نوشیدنی سرد", "کیک و دسر", "صبحانه", "پیش غذا", "غذای اصلی"]
+PRODUCT_NAMES = ["اسپرسو", "لاته", "کاپوچینو", "چای", "موهیتو", "چیزکیک", "املت", "سالاد"]
+
+# Multiplier coprime with 10**9, so `index -> phone suffix` is a bijection
+PHONE_MULTIPLIER = 387_420_489
+PHONE_SPACE = 10**9
+
+
+@contextmanager
+def fixed_timestamps(*models):
+    """Lets bulk inserts keep the generated created_at/updated_at values."""
+    fields = [
+        field
+        for model in models
+        for field in model._meta.fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    flags = [(field, field.auto_now, field.auto_now_add) for field in fields]
+
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in flags:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-generates a deterministic synthetic dataset (users and, optionally, "
+        "restaurant menus) for realistic-scale testing and benchmarks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10_000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--offset",
+            type=int,
+            default=0,
+            help="Index of the first generated user, to append to an existing dataset.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument(
+            "--password",
+            default="DatasetPass123!",
+            help="Password of every generated user (hashed once).",
+        )
+        parser.add_argument(
+            "--end-date",
+            default="2025-01-01",
+            help="Users are created over the --days preceding this date.",
+        )
+        parser.add_argument("--days", type=int, default=3 * 365)
+        parser.add_argument("--restaurants", type=int, default=0)
+        parser.add_argument("--categories", type=int, default=5, help="Per restaurant")
+        parser.add_argument("--products", type=int, default=10, help="Per category")
+
+    def make_uuid(self, *key):
+        """
+        Derives a UUID from the seed and a row key (e.g. `"user", index`), so
+        rows appended with --offset never collide with existing ones.
+        """
+        name = ":".join(map(str, (self.seed, *key))).encode()
+        digest = hashlib.blake2b(name, digest_size=16).digest()
+        return uuid.UUID(bytes=digest, version=4)
+
+    def make_datetime(self, end, rng, days):
+        moment = end - timedelta(seconds=rng.randrange(days * 24 * 60 * 60))
+        if settings.USE_TZ:
+            return moment.replace(tzinfo=timezone.utc)
+        return moment
+
+    def make_user(self, index, rng, password, end, days):
+        username = f"user_{index:07d}"
+        created_at = self.make_datetime(end, rng, days)
+        phone = (index * PHONE_MULTIPLIER + self.phone_offset) % PHONE_SPACE
+
+        return UserModel(
+            id=self.make_uuid("user", index),
+            username=username,
+            email=f"{username}@example.com",
+            phone_number=f"+989{phone:09d}",
+            first_name=rng.choice(FIRST_NAMES),
+            last_name=rng.choice(LAST_NAMES),
+            password=password,
+            is_active=rng.random() < 0.9,
+            is_staff=rng.random() < 0.001,
+            last_login=created_at if rng.random() < 0.7 else None,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+
+    def generate_users(self, options, rng, end):
+        """Inserts the users in batches and returns their (index, id, created_at)."""
+        password = make_password(options["password"])
+        owners = []
+        first, last = options["offset"], options["offset"] + options["users"]
+
+        for start in range(first, last, options["batch_size"]):
+            stop = min(start + options["batch_size"], last)
+            users = [
+                self.make_user(index, rng, password, end, options["days"])
+                for index in range(start, stop)
+            ]
+
+            with transaction.atomic():
+                UserModel.objects.bulk_create(users, batch_size=options["batch_size"])
+
+            # Remember enough users to own the generated restaurants
+            if len(owners) < options["restaurants"]:
+                owners += [
+                    (index, user.id, user.created_at)
+                    for index, user in zip(range(start, stop), users)
+                ]
+
+            self.stdout.write(f"Users: {stop - first}/{options['users']}", ending="\r")
+
+        self.stdout.write("")
+        return owners
+
+    def generate_menus(self, options, rng, owners):
+        """Inserts restaurants, categories and products owned by generated users."""
+        restaurants, categories, products = [], [], []
+
+        for owner_index, owner_id, created_at in owners[: options["restaurants"]]:
+            restaurant = RestaurantModel(
+                id=self.make_uuid("restaurant", owner_index),
+                owner_id=owner_id,
+                name=f"کافه {rng.randrange(1000)}",
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            restaurants.append(restaurant)
+
+            for position in range(options["categories"]):
+                category = CategoryModel(
+                    id=self.make_uuid("category", owner_index, position),
+                    restaurant_id=restaurant.id,
+                    name=CATEGORY_NAMES[position % len(CATEGORY_NAMES)],
+                    position=position,
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+                categories.append(category)
+
+                for product_position in range(options["products"]):
+                    products.append(
+                        ProductModel(
+                            id=self.make_uuid(
+                                "product", owner_index, position, product_position
+                            ),
+                            category_id=category.id,
+                            restaurant_id=restaurant.id,
+                            name=f"{rng.choice(PRODUCT_NAMES)} {product_position + 1}",
+                            price=Decimal(rng.randrange(20, 500) * 1000),
+                            position=product_position,
+                            is_available=rng.random() < 0.9,
+                            created_at=created_at,
+                            updated_at=created_at,
+                        )
+                    )
+
+        batch_size = options["batch_size"]
+        with transaction.atomic():
+            RestaurantModel.objects.bulk_create(restaurants, batch_size=batch_size)
+            CategoryModel.objects.bulk_create(categories, batch_size=batch_size)
+            ProductModel.objects.bulk_create(products, batch_size=batch_size)
+
+            # Bulk inserts bypass the signals keeping the search index in sync
+            for start in range(0, len(restaurants), 500):
+                rebuild_search_index(
+                    [restaurant.id for restaurant in restaurants[start : start + 500]]
+                )
+
+        return len(restaurants), len(categories), len(products)
+
+    def handle(self, *args, **options):
+        if options["offset"] + options["users"] > 10_000_000:
+            raise CommandError("Usernames support at most 10,000,000 users.")
+        if options["restaurants"] > options["users"]:
+            raise CommandError("Every restaurant needs a generated owner.")
+
+        self.seed = options["seed"]
+        rng = random.Random(self.seed)
+        end = datetime.fromisoformat(options["end_date"])
+        self.phone_offset = rng.randrange(PHONE_SPACE)
+        started = time.perf_counter()
+
+        with fixed_timestamps(UserModel, RestaurantModel, CategoryModel, ProductModel):
+            owners = self.generate_users(options, rng, end)
+            menus = self.generate_menus(options, rng, owners)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"Generated {options['users']} users, {menus[0]} restaurants, "
+            f"{menus[1]} categories and {menus[2]} products in {elapsed:.1f}s "
+            f"({options['users'] / elapsed:.0f} users/s)."
+        )
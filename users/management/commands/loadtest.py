@@ -0,0 +1,136 @@
+import os
+import json
+import secrets
+from decimal import Decimal
+from django.conf import settings
+from users.models import UserModel
+from django.utils.timezone import now
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+from menu.models import RestaurantModel, CategoryModel, ProductModel
+from utils.loadtest import SCENARIOS, run_scenarios, start_server, get_free_port
+
+class Command(BaseCommand):
+    help = (
+        "Starts the app under gunicorn or uvicorn and drives concurrent scenarios "
+        "against it, reporting throughput, latency percentiles and error/throttle "
+        "rates per endpoint as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--server",
+            choices=["gunicorn", "uvicorn", "none"],
+            default="gunicorn",
+            help='Use "none" with --url to target an already running server.',
+        )
+        parser.add_argument("--url", help="Base URL of an already running server.")
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--duration", type=float, default=10, help="Seconds")
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            metavar="NAME:CONCURRENCY",
+            help=f"Repeatable. Scenarios: {', '.join(SCENARIOS)} (default polling:10).",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", help="Also write the JSON report to this file.")
+        parser.add_argument(
+            "--allow-non-debug",
+            action="store_true",
+            help="Run even when DEBUG is False (the fixtures are written to, then "
+            "deleted from, the configured database).",
+        )
+
+    def parse_scenarios(self, values):
+        scenarios = []
+
+        for value in values or ["polling:10"]:
+            name, _, concurrency = value.partition(":")
+            if name not in SCENARIOS or not concurrency.isdigit():
+                raise CommandError(f"Invalid scenario: {value}")
+            scenarios.append((name, int(concurrency)))
+
+        return scenarios
+
+    def prepare_fixtures(self):
+        """
+        Creates the user and menu the scenarios work with, under random
+        credentials so they cannot be used once the run is over.
+        """
+        username = f"loadtest_{secrets.token_hex(6)}"
+        password = secrets.token_urlsafe(16)
+
+        user = UserModel.objects.create_user(
+            email=f"{username}@example.com", username=username, password=password
+        )
+        restaurant = RestaurantModel.objects.create(owner=user, name="Load Test Cafe")
+        category = CategoryModel.objects.create(restaurant=restaurant, name="Load Test")
+        product = ProductModel.objects.create(
+            category=category, name="Load Test Coffee", price=Decimal("10000")
+        )
+
+        return user, {
+            "username": username,
+            "password": password,
+            "token": str(AccessToken.for_user(user)),
+            "restaurant_id": str(restaurant.id),
+            "product_id": str(product.id),
+        }
+
+    def delete_fixtures(self, user):
+        """Deletes the load test user, with its restaurant, category and product."""
+        user.delete()
+
+    def handle(self, *args, **options):
+        scenarios = self.parse_scenarios(options["scenario"])
+
+        if not settings.DEBUG and not options["allow_non_debug"]:
+            raise CommandError(
+                "DEBUG is False, this may be a production database. "
+                "Pass --allow-non-debug to run the load test anyway."
+            )
+
+        user, context = self.prepare_fixtures()
+        process = None
+
+        try:
+            if options["server"] == "none":
+                if not options["url"]:
+                    raise CommandError("--url is required with --server none.")
+                base_url = options["url"]
+            else:
+                port = get_free_port()
+                env = dict(os.environ)
+                env["ALLOWED_HOSTS"] = "127.0.0.1,localhost"
+                try:
+                    process = start_server(
+                        options["server"], port, options["workers"], env
+                    )
+                except RuntimeError as error:
+                    raise CommandError(str(error))
+                base_url = f"http://127.0.0.1:{port}/{settings.BASE_URL}"
+
+            report = run_scenarios(
+                base_url, scenarios, context, options["duration"], options["seed"]
+            )
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+            self.delete_fixtures(user)
+
+        report = {
+            "startedAt": now().isoformat(),
+            "server": options["server"],
+            "workers": options["workers"] if process is not None else None,
+            **report,
+        }
+        output = json.dumps(report, indent=2)
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                file.write(output)
+
+        self.stdout.write(output)
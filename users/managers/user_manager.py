@@ -26,6 +26,7 @@ class UserManager(BaseUserManager):
         username = username.lower()  # Convert username to lowercase for uniqueness
 
         # Create the user instance with the provided details
+        # (save() rejects the identifiers of archived users)
         user = self.model(email=email, username=username, phone_number=phone_number)
         user.set_password(password)  # Hash the password before saving
         user.save(using=self._db)  # Save the user to the database
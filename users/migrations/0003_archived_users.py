@@ -0,0 +1,30 @@
+# Generated by Django 5.1.7 on 2026-10-19 18:26
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_created_at_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedUserModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('username', models.CharField(max_length=25, unique=True)),
+                ('phone_number', models.CharField(blank=True, max_length=15, null=True, unique=True)),
+                ('password', models.CharField(max_length=128)),
+                ('data', models.JSONField(default=list)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'archived user',
+                'verbose_name_plural': 'archived users',
+            },
+        ),
+    ]
@@ -1 +1,2 @@
 from .user_model import UserModel
+from .archived_user_model import ArchivedUserModel
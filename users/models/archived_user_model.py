@@ -0,0 +1,41 @@
+import uuid
+from django.db import models
+
+
+class ArchivedUserModel(models.Model):
+    """
+    A long-inactive user moved out of the UserModel table (see the
+    archive_users command), restored on its next successful login.
+
+    Only the login identifiers get their own (indexed) columns, the rest of
+    the account is kept as a compact JSON array (see ARCHIVED_FIELDS).
+    """
+
+    # Same id as the archived user, kept on restore
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    # Login identifiers, unique like their UserModel counterparts
+    email = models.EmailField(unique=True)
+    username = models.CharField(unique=True, max_length=25)
+    phone_number = models.CharField(max_length=15, unique=True, blank=True, null=True)
+
+    password = models.CharField(max_length=128)
+
+    # Remaining fields of the user (names, flags and ISO 8601 timestamps)
+    data = models.JSONField(default=list)
+
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Meta class for the ArchivedUserModel.
+        """
+
+        verbose_name = "archived user"
+        verbose_name_plural = "archived users"
+
+    def __str__(self):
+        """
+        String representation of the archived user.
+        """
+        return self.username
@@ -1,6 +1,9 @@
 import uuid
 from django.db import models
+from django.db.models import Q
 from users.managers import UserManager
+from django.core.exceptions import ValidationError
+from users.models.archived_user_model import ArchivedUserModel
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from users.validators import username_validator, iran_phone_validator, email_validator
 
@@ -69,6 +72,10 @@ class UserModel(AbstractBaseUser, PermissionsMixin):
         verbose_name = "user"
         verbose_name_plural = "users"
         ordering = ("-created_at",)
+        indexes = [
+            # Backs the keyset pagination of the user directory
+            models.Index(fields=["-created_at", "-id"], name="user_created_at_id_idx"),
+        ]
 
     def __str__(self):
         """
@@ -80,9 +87,57 @@ class UserModel(AbstractBaseUser, PermissionsMixin):
         """Returns the user's full name or an empty string if missing."""
         return " ".join(filter(None, [self.first_name, self.last_name])) or ""
 
+    def get_archived_identifiers(self):
+        """
+        Returns the login identifiers of the user (email, username, phone
+        number) held by another, archived user: they stay reserved until
+        that user logs in again and is restored.
+        """
+        identifiers = {"email": self.email.lower(), "username": self.username.lower()}
+        if self.phone_number:
+            identifiers["phone_number"] = self.phone_number
+
+        query = Q()
+        for field, value in identifiers.items():
+            query |= Q(**{field: value})
+
+        archived = (
+            ArchivedUserModel.objects.exclude(pk=self.pk)
+            .filter(query)
+            .values(*identifiers)
+        )
+
+        return [
+            field
+            for field, value in identifiers.items()
+            if any(row[field] == value for row in archived)
+        ]
+
+    def clean(self):
+        """Reject the identifiers of archived users (e.g. in the admin)."""
+        super().clean()
+
+        fields = self.get_archived_identifiers()
+        if fields:
+            raise ValidationError(
+                {field: "This value belongs to an archived user." for field in fields}
+            )
+
     def save(self, *args, **kwargs):
-        """Ensure consistency by storing username and email in lowercase."""
+        """
+        Ensure consistency by storing username and email in lowercase, and
+        keep the identifiers of archived users reserved.
+        """
         self.email = self.email.lower()
         self.username = self.username.lower()
 
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"email", "username", "phone_number"}.intersection(
+            update_fields
+        ):
+            if self.get_archived_identifiers():
+                raise ValueError(
+                    "Username, email or phone number belongs to an archived user"
+                )
+
         super().save(*args, **kwargs)
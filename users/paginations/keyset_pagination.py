@@ -0,0 +1,90 @@
+import json
+import uuid
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from django.db.models import Q
+from rest_framework.response import Response
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination on the `(created_at, id)` pair, newest first.
+
+    Each page is a single indexed range scan that starts right after the
+    last row of the previous page, so deep pages cost the same as the first
+    one: no OFFSET and no COUNT(*) are ever issued.
+    """
+
+    page_size = 50
+    max_page_size = 200
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "pageSize"
+
+    ordering = ("-created_at", "-id")
+
+    invalid_cursor_message = "نشانگر صفحه نامعتبر است."
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        return max(1, min(page_size, self.max_page_size))
+
+    def encode_cursor(self, instance):
+        position = [instance.created_at.isoformat(), str(instance.pk)]
+        return urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            created_at, pk = json.loads(urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(created_at), uuid.UUID(pk)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            created_at, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+            )
+
+        # Fetch one extra row to know whether a next page exists
+        results = list(queryset[: page_size + 1])
+        self.has_next = len(results) > page_size
+        results = results[:page_size]
+
+        self.next_cursor = self.encode_cursor(results[-1]) if self.has_next else None
+
+        return results
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
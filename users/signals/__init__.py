@@ -0,0 +1,7 @@
+from .permission_signals import (
+    user_permissions_changed,
+    group_permissions_changed,
+    permissions_changed,
+    user_deleted,
+)
+from .user_info_signals import user_info_changed
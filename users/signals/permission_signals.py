@@ -0,0 +1,44 @@
+from django.dispatch import receiver
+from users.models import UserModel
+from django.contrib.auth.models import Group, Permission
+from django.db.models.signals import m2m_changed, post_save, post_delete
+from users.utils import invalidate_user_permissions, invalidate_all_permissions
+
+
+@receiver(m2m_changed, sender=UserModel.groups.through)
+@receiver(m2m_changed, sender=UserModel.user_permissions.through)
+def user_permissions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalidate users whose groups or direct permissions changed."""
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        # e.g. user.groups.add(group)
+        invalidate_user_permissions(instance.pk)
+    elif pk_set:
+        # e.g. group.user_set.add(user)
+        invalidate_user_permissions(*pk_set)
+    else:
+        # e.g. group.user_set.clear(), the affected users are unknown
+        invalidate_all_permissions()
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def group_permissions_changed(sender, action, **kwargs):
+    """Group permission edits may affect every member of the group."""
+    if action.startswith("post_"):
+        invalidate_all_permissions()
+
+
+@receiver(post_delete, sender=Group)
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+def permissions_changed(sender, **kwargs):
+    """Deleted groups and added or removed permissions affect many users."""
+    invalidate_all_permissions()
+
+
+@receiver(post_delete, sender=UserModel)
+def user_deleted(sender, instance, **kwargs):
+    """Drop the cached permissions of deleted users."""
+    invalidate_user_permissions(instance.pk)
@@ -0,0 +1,11 @@
+from django.dispatch import receiver
+from users.models import UserModel
+from users.utils import invalidate_user_info
+from django.db.models.signals import post_save, post_delete
+
+
+@receiver(post_save, sender=UserModel)
+@receiver(post_delete, sender=UserModel)
+def user_info_changed(sender, instance, **kwargs):
+    """Drop the cached details of saved or deleted users."""
+    invalidate_user_info(instance.pk)
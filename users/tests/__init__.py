@@ -1,3 +1,8 @@
 from .validator_test_case import ValidatorTestCase
 from .user_model_test_case import UserModelTestCase
 from .user_manager_test_case import UserManagerTestCase
+from .user_list_view_test_case import UserListViewTestCase
+from .permission_backend_test_case import PermissionBackendTestCase
+from .generate_dataset_test_case import GenerateDatasetTestCase
+from .user_info_view_test_case import UserInfoViewTestCase
+from .user_archive_test_case import UserArchiveTestCase
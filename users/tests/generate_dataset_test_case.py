@@ -0,0 +1,68 @@
+from io import StringIO
+from django.test import TestCase
+from users.models import UserModel
+from django.core.management import call_command
+from menu.models import RestaurantModel, ProductModel
+
+
+class GenerateDatasetTestCase(TestCase):
+    """Test cases for the synthetic dataset generator"""
+
+    def generate(self, **options):
+        """Runs the command quietly and returns the generated users"""
+        call_command("generate_dataset", stdout=StringIO(), **options)
+        return list(
+            UserModel.objects.order_by("username").values_list(
+                "id", "username", "email", "phone_number", "created_at", "is_active"
+            )
+        )
+
+    def test_same_seed_same_dataset(self):
+        """A seed always produces the same rows"""
+        first = self.generate(users=50, seed=7, batch_size=20)
+        UserModel.objects.all().delete()
+        second = self.generate(users=50, seed=7, batch_size=20)
+
+        self.assertEqual(len(first), 50)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, self.generate(users=50, seed=8, offset=50))
+
+    def test_offset_appends_with_the_same_seed(self):
+        """Appending with the same seed adds new rows instead of colliding"""
+        menus = {"restaurants": 2, "categories": 1, "products": 2}
+        self.generate(users=20, seed=7, **menus)
+        self.generate(users=20, seed=7, offset=20, **menus)
+
+        self.assertEqual(UserModel.objects.count(), 40)
+        self.assertEqual(RestaurantModel.objects.count(), 4)
+        self.assertEqual(ProductModel.objects.count(), 8)
+
+    def test_users_pass_validation(self):
+        """Generated users satisfy the model validators and can log in"""
+        self.generate(users=30, batch_size=7)
+
+        for user in UserModel.objects.all():
+            user.full_clean()
+
+        user = UserModel.objects.get(username="user_0000003")
+        self.assertTrue(user.check_password("DatasetPass123!"))
+        self.assertEqual(
+            UserModel.objects.values("phone_number").distinct().count(), 30
+        )
+
+    def test_created_at_is_spread(self):
+        """Timestamps are spread over the requested window"""
+        self.generate(users=40, days=30, end_date="2024-06-01")
+        dates = UserModel.objects.values_list("created_at", flat=True)
+
+        self.assertGreater(len({date.date() for date in dates}), 10)
+        self.assertTrue(all(date.year == 2024 and date.month in (5, 6) for date in dates))
+
+    def test_menu_data(self):
+        """Restaurants are owned by generated users and fully populated"""
+        self.generate(users=10, restaurants=3, categories=2, products=4)
+
+        self.assertEqual(RestaurantModel.objects.count(), 3)
+        self.assertEqual(ProductModel.objects.count(), 24)
+        product = ProductModel.objects.select_related("category").first()
+        self.assertEqual(product.restaurant_id, product.category.restaurant_id)
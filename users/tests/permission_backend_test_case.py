@@ -0,0 +1,98 @@
+from django.test import TestCase
+from django.core.cache import cache
+from users.models import UserModel
+from users.utils import get_cached_permissions, set_cached_permissions
+from django.contrib.auth.models import Group, Permission
+
+
+class PermissionBackendTestCase(TestCase):
+    """Test cases for the cross-request permission cache"""
+
+    def setUp(self):
+        """Create a user, a group and two permissions"""
+        cache.clear()
+
+        self.user = UserModel.objects.create_user(
+            email="staff@example.com",
+            username="staff",
+            password="StaffPass123!",
+        )
+        self.group = Group.objects.create(name="editors")
+        self.view_user = Permission.objects.get(codename="view_usermodel")
+        self.change_user = Permission.objects.get(codename="change_usermodel")
+
+    def fresh_user(self):
+        """Loads the user again, as a new request would"""
+        return UserModel.objects.get(pk=self.user.pk)
+
+    def test_permissions_are_shared_across_requests(self):
+        """Only the first request resolves permissions from the database"""
+        self.user.user_permissions.add(self.view_user)
+
+        self.assertTrue(self.fresh_user().has_perm("users.view_usermodel"))
+
+        user = self.fresh_user()
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm("users.view_usermodel"))
+            self.assertFalse(user.has_perm("users.change_usermodel"))
+            self.assertTrue(user.has_module_perms("users"))
+
+    def test_user_permission_change_invalidates(self):
+        """Granting a direct permission is visible on the next request"""
+        self.assertFalse(self.fresh_user().has_perm("users.change_usermodel"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.user_permissions.add(self.change_user)
+
+        self.assertTrue(self.fresh_user().has_perm("users.change_usermodel"))
+
+    def test_group_membership_change_invalidates(self):
+        """Joining or leaving a group from either side invalidates the user"""
+        self.group.permissions.add(self.change_user)
+        self.assertFalse(self.fresh_user().has_perm("users.change_usermodel"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.user_set.add(self.user)
+        self.assertTrue(self.fresh_user().has_perm("users.change_usermodel"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.groups.remove(self.group)
+        self.assertFalse(self.fresh_user().has_perm("users.change_usermodel"))
+
+    def test_group_permission_change_invalidates(self):
+        """Editing a group's permissions affects all its members"""
+        self.user.groups.add(self.group)
+        self.assertFalse(self.fresh_user().has_perm("users.view_usermodel"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.permissions.add(self.view_user)
+
+        self.assertTrue(self.fresh_user().has_perm("users.view_usermodel"))
+
+    def test_status_flags_are_part_of_the_key(self):
+        """Promoting to superuser or deactivating is never served stale"""
+        self.assertFalse(self.fresh_user().has_perm("users.change_usermodel"))
+
+        UserModel.objects.filter(pk=self.user.pk).update(is_superuser=True)
+        self.assertTrue(self.fresh_user().has_perm("users.change_usermodel"))
+
+        UserModel.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertFalse(self.fresh_user().has_perm("users.change_usermodel"))
+
+    def test_change_during_resolution_is_not_cached(self):
+        """Permissions resolved before a revoke commits are never served after it"""
+        self.user.user_permissions.add(self.change_user)
+        self.assertTrue(self.fresh_user().has_perm("users.change_usermodel"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.user_permissions.remove(self.change_user)
+
+        # A request resolved the old set, then stores it after the revoke
+        user = self.fresh_user()
+        _, versions = get_cached_permissions(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.user_permissions.add(self.view_user)
+        set_cached_permissions(user, {"users.change_usermodel"}, versions)
+
+        self.assertEqual(get_cached_permissions(self.fresh_user())[0], None)
+        self.assertFalse(self.fresh_user().has_perm("users.change_usermodel"))
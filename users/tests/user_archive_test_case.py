@@ -0,0 +1,142 @@
+from io import StringIO
+from datetime import timedelta
+from django.urls import reverse
+from django.test import TestCase
+from django.utils import timezone
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from menu.models import RestaurantModel
+from users.models import UserModel, ArchivedUserModel
+from users.utils import archive_users, get_cold_users, get_table_sizes
+
+
+class UserArchiveTestCase(TestCase):
+    """Test cases for the cold user archive"""
+
+    def setUp(self):
+        """Create cold and recent users, plus cold users that must stay"""
+        long_ago = timezone.now() - timedelta(days=400)
+
+        for index in range(5):
+            user = UserModel.objects.create_user(
+                email=f"cold{index}@example.com",
+                username=f"cold{index}",
+                phone_number=f"+98912000000{index}",
+                password="ColdPass123!",
+            )
+            # Half of them logged in long ago, the others never did
+            UserModel.objects.filter(pk=user.pk).update(
+                created_at=long_ago,
+                last_login=long_ago if index % 2 else None,
+                first_name="Cold",
+            )
+
+        UserModel.objects.create_user(
+            email="recent@example.com", username="recent", password="RecentPass123!"
+        )
+        staff = UserModel.objects.create_superuser(
+            email="admin@example.com", username="admin", password="AdminPass123!"
+        )
+        owner = UserModel.objects.create_user(
+            email="owner@example.com", username="owner", password="OwnerPass123!"
+        )
+        RestaurantModel.objects.create(owner=owner, name="Cafe")
+        UserModel.objects.filter(pk__in=[staff.pk, owner.pk]).update(
+            created_at=long_ago, last_login=long_ago
+        )
+
+        self.cold = UserModel.objects.get(username="cold1")
+
+    def test_cold_users_are_archived_in_chunks(self):
+        """Only regular users inactive beyond the threshold are moved"""
+        self.assertEqual(list(archive_users(days=365, batch_size=2)), [2, 2, 1])
+
+        self.assertEqual(ArchivedUserModel.objects.count(), 5)
+        self.assertEqual(
+            sorted(UserModel.objects.values_list("username", flat=True)),
+            ["admin", "owner", "recent"],
+        )
+
+        archived = ArchivedUserModel.objects.get(pk=self.cold.pk)
+        self.assertEqual(archived.phone_number, "+989120000001")
+        self.assertEqual(archived.data[0], "Cold")
+
+    def test_login_restores_archived_users(self):
+        """A successful login moves the user back, with its id and timestamps"""
+        list(archive_users(days=365))
+        client = APIClient()
+        url = reverse("login")
+
+        response = client.post(url, {"username": "cold1", "password": "Wrong123!"})
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(ArchivedUserModel.objects.filter(pk=self.cold.pk).exists())
+
+        response = client.post(
+            url, {"username": "+989120000001", "password": "ColdPass123!"}
+        )
+        self.assertEqual(response.status_code, 200)
+
+        user = UserModel.objects.get(pk=self.cold.pk)
+        self.assertEqual(user.first_name, "Cold")
+        self.assertEqual(user.created_at, self.cold.created_at)
+        self.assertFalse(ArchivedUserModel.objects.filter(pk=self.cold.pk).exists())
+        # Restored users are not cold anymore
+        self.assertEqual(list(archive_users(days=365)), [])
+
+    def test_logins_keep_users_warm(self):
+        """Logging in through the API records the login"""
+        response = APIClient().post(
+            reverse("login"), {"username": "cold1", "password": "ColdPass123!"}
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertIsNotNone(UserModel.objects.get(pk=self.cold.pk).last_login)
+        self.assertNotIn(self.cold, get_cold_users(days=365))
+
+    def test_archived_identifiers_stay_reserved(self):
+        """New users cannot take the username of an archived user"""
+        list(archive_users(days=365))
+
+        with self.assertRaises(ValueError):
+            UserModel.objects.create_user(
+                email="new@example.com", username="cold1", password="NewPass123!"
+            )
+
+    def test_archived_identifiers_are_validated(self):
+        """Forms (e.g. the admin) and saves reject identifiers of archived users"""
+        list(archive_users(days=365))
+        user = UserModel.objects.get(username="recent")
+        user.email = "cold2@example.com"
+
+        with self.assertRaises(ValidationError) as context:
+            user.full_clean()
+        self.assertEqual(list(context.exception.message_dict), ["email"])
+
+        with self.assertRaises(ValueError):
+            user.save()
+
+    def test_deactivated_users_stay_archived(self):
+        """Archived users that were deactivated are not restored by a login"""
+        UserModel.objects.filter(pk=self.cold.pk).update(is_active=False)
+        list(archive_users(days=365))
+
+        response = APIClient().post(
+            reverse("login"), {"username": "cold1", "password": "ColdPass123!"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(ArchivedUserModel.objects.filter(pk=self.cold.pk).exists())
+        self.assertFalse(UserModel.objects.filter(pk=self.cold.pk).exists())
+
+    def test_size_report(self):
+        """The command reports the users table size before and after"""
+        self.assertEqual(
+            set(get_table_sizes(UserModel)), {UserModel._meta.db_table}
+        )
+
+        output = StringIO()
+        call_command("archive_users", "--days", "365", stdout=output)
+
+        self.assertIn("Archived 5 users", output.getvalue())
+        self.assertIn(f"{UserModel._meta.db_table}: table", output.getvalue())
@@ -0,0 +1,34 @@
+from django.urls import reverse
+from django.test import TestCase
+from django.core.cache import cache
+from users.models import UserModel
+from rest_framework.test import APIClient
+from users.utils import get_cached_user_info
+
+
+class UserInfoViewTestCase(TestCase):
+    """Test cases for the cached details of the authenticated user"""
+
+    def setUp(self):
+        cache.clear()
+
+        self.user = UserModel.objects.create_user(
+            email="user@example.com",
+            username="user",
+            password="UserPass123!",
+        )
+        self.url = reverse("user-info")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_details_are_cached_until_the_user_changes(self):
+        """Saving the user drops the cached details on commit"""
+        self.assertEqual(self.client.get(self.url).json()["username"], "user")
+        self.assertEqual(get_cached_user_info(self.user.pk)["username"], "user")
+
+        self.user.first_name = "Sara"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        self.assertIsNone(get_cached_user_info(self.user.pk))
+        self.assertEqual(self.client.get(self.url).json()["firstName"], "Sara")
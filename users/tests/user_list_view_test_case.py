@@ -0,0 +1,99 @@
+from datetime import timedelta
+from django.urls import reverse
+from django.test import TestCase
+from django.db import connection
+from django.utils.timezone import now
+from users.models import UserModel
+from rest_framework.test import APIClient
+from django.test.utils import CaptureQueriesContext
+
+
+class UserListViewTestCase(TestCase):
+    """Test cases for the staff user directory"""
+
+    def setUp(self):
+        """Create a staff user and a handful of regular users"""
+        self.staff = UserModel.objects.create_superuser(
+            email="admin@example.com",
+            username="admin",
+            password="AdminPass123!",
+        )
+        base = now() - timedelta(days=30)
+        for index in range(7):
+            user = UserModel.objects.create_user(
+                email=f"user{index}@example.com",
+                username=f"user{index}",
+                phone_number=f"+98912000000{index}",
+                password="UserPass123!",
+            )
+            # Two users share a timestamp to exercise the id tie-breaker
+            created_at = base + timedelta(days=min(index, 5))
+            UserModel.objects.filter(pk=user.pk).update(
+                created_at=created_at, is_active=index % 2 == 0
+            )
+
+        self.url = reverse("user-list")
+        self.client = APIClient()
+        self.client.force_authenticate(self.staff)
+
+    def test_regular_users_are_forbidden(self):
+        """Only staff can list users"""
+        user = UserModel.objects.get(username="user0")
+        self.client.force_authenticate(user)
+
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_pages_cover_every_user_once_in_order(self):
+        """Walking the cursors returns all users newest first, no duplicates"""
+        usernames = []
+        url = self.url + "?pageSize=3"
+
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+            for query in queries.captured_queries:
+                self.assertNotIn("OFFSET", query["sql"].upper())
+                self.assertNotIn("COUNT(", query["sql"].upper())
+
+            usernames += [user["username"] for user in response.data["results"]]
+            url = response.data["next"]
+
+        expected = list(
+            UserModel.objects.order_by("-created_at", "-id").values_list(
+                "username", flat=True
+            )
+        )
+        self.assertEqual(usernames, expected)
+        self.assertEqual(len(usernames), 8)
+
+    def test_filters(self):
+        """Boolean, date range and identifier prefix filters"""
+        response = self.client.get(self.url, {"isActive": "false"})
+        self.assertEqual(
+            sorted(user["username"] for user in response.data["results"]),
+            ["user1", "user3", "user5"],
+        )
+
+        response = self.client.get(self.url, {"isStaff": "true"})
+        self.assertEqual([u["username"] for u in response.data["results"]], ["admin"])
+
+        created_before = (now() - timedelta(days=28, hours=12)).isoformat()
+        response = self.client.get(self.url, {"createdBefore": created_before})
+        self.assertEqual(
+            sorted(user["username"] for user in response.data["results"]),
+            ["user0", "user1"],
+        )
+
+        response = self.client.get(self.url, {"identifier": "09120000003"})
+        self.assertEqual([u["username"] for u in response.data["results"]], ["user3"])
+
+        response = self.client.get(self.url, {"identifier": "USER6@"})
+        self.assertEqual([u["username"] for u in response.data["results"]], ["user6"])
+
+    def test_invalid_cursor_returns_404(self):
+        """Tampered cursors are rejected"""
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, 404)
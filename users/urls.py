@@ -1,7 +1,8 @@
 from django.urls import path
-from users.views import UserInfoView, LoginView
+from users.views import UserInfoView, UserListView, LoginView
 
 urlpatterns = [
+    path("", UserListView.as_view(), name="user-list"),
     path("login/", LoginView.as_view(), name="login"),
     path("user-info/", UserInfoView.as_view(), name="user-info"),
     # path("logout/", LogoutView.as_view(), name="logout"),
@@ -1 +1,18 @@
 from .phone_utils import normalize_phone_number
+from .permission_cache_utils import (
+    get_cached_permissions,
+    set_cached_permissions,
+    invalidate_user_permissions,
+    invalidate_all_permissions,
+)
+from .user_info_cache_utils import (
+    get_cached_user_info,
+    set_cached_user_info,
+    invalidate_user_info,
+)
+from .user_archive_utils import (
+    archive_users,
+    get_cold_users,
+    get_table_sizes,
+    restore_archived_user,
+)
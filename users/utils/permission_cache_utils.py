@@ -0,0 +1,98 @@
+import uuid
+from django.conf import settings
+from django.db import transaction
+from django.core.cache import cache
+
+# ----------------------------------
+# Cache keys
+# ----------------------------------
+
+# Bumped whenever a change may affect the permissions of many users
+PERMISSION_VERSION_CACHE_KEY = "users:permissions:version"
+
+# Random token replaced whenever a change affects the permissions of one user
+USER_PERMISSION_VERSION_CACHE_KEY = "users:permissions:{user_id}:version"
+
+# ((permission version, user version), is_active, is_superuser, permissions) of one user
+USER_PERMISSIONS_CACHE_KEY = "users:permissions:{user_id}"
+
+
+def get_user_permissions_cache_key(user_id):
+    """Returns the cache key holding the resolved permissions of a user."""
+    return USER_PERMISSIONS_CACHE_KEY.format(user_id=user_id)
+
+
+def get_user_permission_version_cache_key(user_id):
+    """Returns the cache key holding the permission version of a user."""
+    return USER_PERMISSION_VERSION_CACHE_KEY.format(user_id=user_id)
+
+
+def get_cached_permissions(user):
+    """
+    Returns `(permissions, versions)`: the cached permission set of a user,
+    or None if it is missing or stale, and the current permission versions
+    to pass to `set_cached_permissions`. Costs a single cache round-trip.
+    """
+    key = get_user_permissions_cache_key(user.pk)
+    version_key = get_user_permission_version_cache_key(user.pk)
+    values = cache.get_many([PERMISSION_VERSION_CACHE_KEY, version_key, key])
+    versions = (values.get(PERMISSION_VERSION_CACHE_KEY, 0), values.get(version_key))
+    entry = values.get(key)
+
+    if entry is None or versions[1] is None:
+        return None, versions
+
+    if entry[:3] != (versions, user.is_active, user.is_superuser):
+        return None, versions
+
+    return entry[3], versions
+
+
+def set_cached_permissions(user, permissions, versions):
+    """
+    Stores the resolved permission set of a user, stamped with the versions
+    read (by `get_cached_permissions`) before it was resolved: a change
+    committed meanwhile bumps a version and leaves the entry stale.
+    """
+    global_version, user_version = versions
+
+    if user_version is None:
+        # First entry of the user, fails if an invalidation got in first
+        user_version = uuid.uuid4().hex
+        if not cache.add(
+            get_user_permission_version_cache_key(user.pk), user_version, None
+        ):
+            return
+
+    entry = (
+        (global_version, user_version),
+        user.is_active,
+        user.is_superuser,
+        permissions,
+    )
+
+    cache.set(
+        get_user_permissions_cache_key(user.pk),
+        entry,
+        settings.PERMISSION_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_user_permissions(*user_ids):
+    """Makes the cached permissions of the given users stale once the transaction commits."""
+    keys = [get_user_permission_version_cache_key(user_id) for user_id in user_ids]
+
+    def replace_versions():
+        cache.set_many({key: uuid.uuid4().hex for key in keys}, None)
+
+    transaction.on_commit(replace_versions)
+
+
+def invalidate_all_permissions():
+    """Makes every cached permission set stale once the transaction commits."""
+
+    def bump_version():
+        cache.add(PERMISSION_VERSION_CACHE_KEY, 0, None)
+        cache.incr(PERMISSION_VERSION_CACHE_KEY)
+
+    transaction.on_commit(bump_version)
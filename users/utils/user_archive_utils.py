@@ -0,0 +1,200 @@
+from logging import getLogger
+from datetime import datetime, timedelta
+from django.db.models import Q
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.contrib.auth.hashers import check_password
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from users.models import UserModel, ArchivedUserModel
+
+logger = getLogger(__name__)
+
+# UserModel fields kept, in this order, in the JSON array of an archived user
+ARCHIVED_FIELDS = (
+    "first_name",
+    "last_name",
+    "is_active",
+    "last_login",
+    "created_at",
+    "updated_at",
+)
+
+# ----------------------------------
+# Archiving
+# ----------------------------------
+
+
+def get_cold_users(days=None):
+    """
+    Returns the users without a login (or, if they never logged in, created)
+    for more than `days` (USER_ARCHIVE_AFTER_DAYS by default).
+
+    Staff, restaurant owners and users with groups or permissions are never
+    archived: their rows are referenced by other tables.
+    """
+    if days is None:
+        days = settings.USER_ARCHIVE_AFTER_DAYS
+
+    cutoff = timezone.now() - timedelta(days=days)
+
+    return UserModel.objects.filter(
+        Q(last_login__lt=cutoff) | Q(last_login__isnull=True, created_at__lt=cutoff),
+        is_staff=False,
+        is_superuser=False,
+        restaurants__isnull=True,
+        groups__isnull=True,
+        user_permissions__isnull=True,
+    )
+
+
+def get_archived_value(value):
+    # Full precision, DjangoJSONEncoder would round datetimes to milliseconds
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def get_archived_user(user):
+    """Returns the (unsaved) archive row of a user."""
+    return ArchivedUserModel(
+        id=user.id,
+        email=user.email,
+        username=user.username,
+        phone_number=user.phone_number,
+        password=user.password,
+        data=[get_archived_value(getattr(user, field)) for field in ARCHIVED_FIELDS],
+    )
+
+
+def archive_users(days=None, batch_size=1000):
+    """
+    Moves the cold users (see `get_cold_users`) to the archive, walking
+    them by id in chunks of `batch_size`, one transaction per chunk.
+    Yields the number of users archived by each chunk.
+    """
+    users = get_cold_users(days).order_by("pk")
+    last_id = None
+
+    while True:
+        chunk = users if last_id is None else users.filter(pk__gt=last_id)
+
+        with transaction.atomic():
+            # Locked, so users logging in meanwhile are not archived
+            batch = list(chunk.select_for_update(of=("self",))[:batch_size])
+
+            if not batch:
+                return
+
+            ArchivedUserModel.objects.bulk_create(
+                [get_archived_user(user) for user in batch]
+            )
+            UserModel.objects.filter(pk__in=[user.pk for user in batch]).delete()
+
+        last_id = batch[-1].pk
+        yield len(batch)
+
+
+# ----------------------------------
+# Restoring
+# ----------------------------------
+
+
+def restore_archived_user(username, password):
+    """
+    Looks up an archived user by email, username or phone number and, if
+    the password matches, moves it back to UserModel with its original id
+    and timestamps. Deactivated users stay archived. Returns the restored
+    user, or None. The restore counts as a login, so the user is not
+    archived again by the next run.
+    """
+    archived = ArchivedUserModel.objects.filter(
+        Q(email=username) | Q(username=username) | Q(phone_number=username)
+    ).first()
+
+    if archived is None:
+        return None
+
+    data = dict(zip(ARCHIVED_FIELDS, archived.data))
+
+    if not data.get("is_active", True) or not check_password(password, archived.password):
+        return None
+
+    user = UserModel(
+        id=archived.id,
+        email=archived.email,
+        username=archived.username,
+        phone_number=archived.phone_number,
+        password=archived.password,
+        first_name=data.get("first_name"),
+        last_name=data.get("last_name"),
+        is_active=data.get("is_active", True),
+        last_login=timezone.now(),
+    )
+    timestamps = {
+        field: parse_datetime(data[field])
+        for field in ("created_at", "updated_at")
+        if data.get(field)
+    }
+
+    try:
+        with transaction.atomic():
+            user.save(force_insert=True)
+            # auto_now_add ignores the given values on insert
+            UserModel.objects.filter(pk=user.pk).update(**timestamps)
+            archived.delete()
+    except IntegrityError:
+        # Another account took the username, email or phone number meanwhile
+        logger.warning("Could not restore the archived user %s", archived.pk)
+        return None
+
+    for field, value in timestamps.items():
+        setattr(user, field, value)
+
+    return user
+
+
+# ----------------------------------
+# Reporting
+# ----------------------------------
+
+
+def get_table_sizes(*models):
+    """
+    Returns `{table: (table bytes, index bytes)}` for the tables of the
+    given models, from dbstat on SQLite or the relation sizes on
+    PostgreSQL. Returns None on other databases (or without dbstat).
+    """
+    sizes = {}
+
+    try:
+        with connection.cursor() as cursor:
+            for model in models:
+                table = model._meta.db_table
+
+                if connection.vendor == "sqlite":
+                    cursor.execute(
+                        "SELECT name FROM sqlite_master "
+                        "WHERE type = 'index' AND tbl_name = %s",
+                        [table],
+                    )
+                    indexes = [row[0] for row in cursor.fetchall()]
+                    cursor.execute(
+                        "SELECT name, SUM(pgsize) FROM dbstat WHERE name IN (%s) GROUP BY name"
+                        % ", ".join(["%s"] * (len(indexes) + 1)),
+                        [table, *indexes],
+                    )
+                    pages = dict(cursor.fetchall())
+                    sizes[table] = (
+                        pages.get(table, 0),
+                        sum(pages.get(index, 0) for index in indexes),
+                    )
+                elif connection.vendor == "postgresql":
+                    cursor.execute(
+                        "SELECT pg_table_size(%s), pg_indexes_size(%s)", [table, table]
+                    )
+                    sizes[table] = cursor.fetchone()
+                else:
+                    return None
+    except DatabaseError:
+        return None
+
+    return sizes
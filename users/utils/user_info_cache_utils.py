@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.db import transaction
+from django.core.cache import cache
+
+# Serialized details of one user, as returned by UserInfoView
+USER_INFO_CACHE_KEY = "users:info:{user_id}"
+
+
+def get_user_info_cache_key(user_id):
+    """Returns the cache key holding the serialized details of a user."""
+    return USER_INFO_CACHE_KEY.format(user_id=user_id)
+
+
+def get_cached_user_info(user_id):
+    """Returns the cached details of a user, or None if they are missing."""
+    return cache.get(get_user_info_cache_key(user_id))
+
+
+def set_cached_user_info(user_id, data):
+    """Stores the serialized details of a user."""
+    cache.set(
+        get_user_info_cache_key(user_id), dict(data), settings.USER_INFO_CACHE_TIMEOUT
+    )
+
+
+def invalidate_user_info(*user_ids):
+    """Drops the cached details of the given users once the transaction commits."""
+    keys = [get_user_info_cache_key(user_id) for user_id in user_ids]
+    transaction.on_commit(lambda: cache.delete_many(keys))
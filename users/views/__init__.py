@@ -1,2 +1,2 @@
 from .login_view import LoginView
-from .user_views import UserInfoView
+from .user_views import UserInfoView, UserListView
@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from users.serializers import LoginUserSerializer
 from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth.models import update_last_login
 from rest_framework.throttling import ScopedRateThrottle
 
 
@@ -25,6 +26,8 @@ class LoginView(APIView):
         if serializer.is_valid():
 
             user = serializer.validated_data["user"]
+            # Keeps active users out of the cold user archive
+            update_last_login(None, user)
 
             refresh = RefreshToken.for_user(user)
 
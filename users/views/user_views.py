@@ -1,12 +1,21 @@
+from users.models import UserModel
+from rest_framework.response import Response
+from users.filters import UserFilter
 from users.serializers import UserSerializer
-from rest_framework.generics import RetrieveAPIView
-from rest_framework.permissions import IsAuthenticated
+from users.paginations import KeysetPagination
+from users.utils import get_cached_user_info, set_cached_user_info
 from rest_framework.throttling import ScopedRateThrottle
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.generics import RetrieveAPIView, ListAPIView
 
 
 class UserInfoView(RetrieveAPIView):
     """
     API endpoint to retrieve the details of the authenticated user.
+
+    The serialized details are cached per user and dropped whenever the
+    user is saved (see users.signals).
     """
 
     http_method_names = ["get"]
@@ -18,3 +27,31 @@ class UserInfoView(RetrieveAPIView):
 
     def get_object(self):
         return self.request.user
+
+    def retrieve(self, request, *args, **kwargs):
+        data = get_cached_user_info(request.user.pk)
+
+        if data is None:
+            data = self.get_serializer(self.get_object()).data
+            set_cached_user_info(request.user.pk, data)
+
+        return Response(data)
+
+
+class UserListView(ListAPIView):
+    """
+    Staff-only API endpoint listing users, newest first, with filters and
+    keyset pagination.
+    """
+
+    http_method_names = ["get"]
+    serializer_class = UserSerializer
+    permission_classes = [IsAdminUser]
+
+    queryset = UserModel.objects.all()
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = UserFilter
+    pagination_class = KeysetPagination
+
+    throttle_scope = "user"
+    throttle_classes = [ScopedRateThrottle]
@@ -0,0 +1 @@
+from .two_tier_cache_backend import TwoTierCache
@@ -0,0 +1,473 @@
+import os
+import mmap
+import time
+import pickle
+import struct
+import sqlite3
+import threading
+from pathlib import Path
+from collections import Counter, OrderedDict
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+
+# Latest change id, shared by every process through a memory-mapped file
+STAMP_FORMAT = "<Q"
+STAMP_SIZE = struct.calcsize(STAMP_FORMAT)
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS entries ("
+    "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)",
+    "CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)",
+    # Keys written since, a NULL key stands for clear()
+    "CREATE TABLE IF NOT EXISTS changes (id INTEGER PRIMARY KEY, key TEXT)",
+)
+
+# L2 housekeeping (expired entries, culling, change log) every N writes
+CLEANUP_EVERY = 200
+
+
+class TwoTierCache(BaseCache):
+    """
+    Cache backend keeping a bounded in-process LRU (L1) in front of a
+    SQLite file shared by the workers of the host (L2).
+
+    Values are pickled once on write and kept as bytes in both tiers, so
+    L1 hits only cost an unpickle and callers never share mutable values.
+    L1 entries are evicted by count, total size (L1_MAX_ENTRIES,
+    L1_MAX_BYTES) and age (L1_TIMEOUT, on top of the entry's own timeout).
+
+    Every write to L2 appends the key to a change log and publishes the
+    change id in a memory-mapped stamp file. Reads compare that stamp with
+    the last change seen by the process, a memory read, and drop the L1
+    copies of the keys changed by other workers before answering.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+
+        options = params.get("OPTIONS", {})
+        self.path = Path(location)
+        self.l1_max_entries = int(options.get("L1_MAX_ENTRIES", 1000))
+        self.l1_max_bytes = int(options.get("L1_MAX_BYTES", 16 * 1024 * 1024))
+        self.l1_timeout = float(options.get("L1_TIMEOUT", 60))
+        self.change_log_size = int(options.get("CHANGE_LOG_SIZE", 10000))
+
+        self.l1 = OrderedDict()  # key -> (expires, value bytes)
+        self.l1_bytes = 0
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.stats = Counter()
+        self.writes = 0
+        self.pid = None
+
+    # ----------------------------------
+    # Shared state
+    # ----------------------------------
+
+    def connect(self):
+        """Returns the L2 connection of the current thread (and process)."""
+        connection = getattr(self.local, "connection", None)
+
+        if connection is None or self.local.pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # Cached data does not need to survive a power loss
+            connection.execute("PRAGMA synchronous=OFF")
+            for statement in SCHEMA:
+                connection.execute(statement)
+
+            self.local.connection = connection
+            self.local.pid = os.getpid()
+
+        return connection
+
+    def setup(self):
+        """Maps the stamp file, once per process (L1 is not inherited across forks)."""
+        if self.pid == os.getpid():
+            return
+
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+
+            stamp_path = self.path.with_name(self.path.name + ".stamp")
+            stamp_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(stamp_path, "a+b") as file:
+                if os.fstat(file.fileno()).st_size < STAMP_SIZE:
+                    file.truncate(STAMP_SIZE)
+                self.stamp = mmap.mmap(file.fileno(), STAMP_SIZE)
+
+            row = self.connect().execute("SELECT MAX(id) FROM changes").fetchone()
+            self.seen = row[0] or 0
+
+            # The database was recreated, restart the stamps along with it
+            if self.read_stamp() > self.seen:
+                struct.pack_into(STAMP_FORMAT, self.stamp, 0, self.seen)
+
+            self.l1.clear()
+            self.l1_bytes = 0
+            self.pid = os.getpid()
+
+    def read_stamp(self):
+        return struct.unpack_from(STAMP_FORMAT, self.stamp)[0]
+
+    def log_changes(self, connection, keys):
+        """
+        Logs the changed keys and publishes the last change id in the stamp.
+        Runs in the L2 write transaction, before COMMIT: writers hold the
+        database lock in turn, so the stamp only moves forward. Returns the
+        change id.
+        """
+        connection.executemany(
+            "INSERT INTO changes (key) VALUES (?)", [(key,) for key in keys]
+        )
+        change_id = connection.execute("SELECT MAX(id) FROM changes").fetchone()[0]
+        struct.pack_into(STAMP_FORMAT, self.stamp, 0, change_id)
+
+        return change_id
+
+    def mark_seen(self, change_id, count):
+        """Marks the last `count` changes, up to `change_id`, committed by this process."""
+        with self.lock:
+            # Our own changes need no invalidation, unless others came in between
+            if self.seen == change_id - count:
+                self.seen = change_id
+
+    def sync(self):
+        """Drops the L1 copies of the keys changed by other processes."""
+        self.setup()
+
+        if self.read_stamp() <= self.seen:
+            return
+
+        rows = (
+            self.connect()
+            .execute("SELECT id, key FROM changes WHERE id > ? ORDER BY id", (self.seen,))
+            .fetchall()
+        )
+
+        # Published by a writer that has not committed yet
+        if not rows:
+            return
+
+        with self.lock:
+            # The log was pruned past the last change seen, or the cache cleared
+            if rows[0][0] != self.seen + 1 or any(key is None for _, key in rows):
+                self.stats["l1_invalidations"] += len(self.l1)
+                self.l1.clear()
+                self.l1_bytes = 0
+            else:
+                for _, key in rows:
+                    if self.l1_discard(key):
+                        self.stats["l1_invalidations"] += 1
+
+            self.seen = max(self.seen, rows[-1][0])
+
+    # ----------------------------------
+    # L1
+    # ----------------------------------
+
+    def l1_get(self, key):
+        with self.lock:
+            entry = self.l1.get(key)
+            if entry is None:
+                return None
+
+            if entry[0] <= time.time():
+                self.l1_discard(key)
+                return None
+
+            self.l1.move_to_end(key)
+            return entry[1]
+
+    def l1_set(self, key, value, expires):
+        if len(value) > self.l1_max_bytes:
+            return
+
+        # Copies are only kept for L1_TIMEOUT, even if the entry lives longer
+        expires = min(expires or float("inf"), time.time() + self.l1_timeout)
+
+        with self.lock:
+            self.l1_discard(key)
+            self.l1[key] = (expires, value)
+            self.l1_bytes += len(value)
+
+            while len(self.l1) > self.l1_max_entries or self.l1_bytes > self.l1_max_bytes:
+                _, (_, evicted) = self.l1.popitem(last=False)
+                self.l1_bytes -= len(evicted)
+                self.stats["l1_evictions"] += 1
+
+    def l1_discard(self, key):
+        """Drops a key from L1, the lock must be held. Returns whether it was there."""
+        entry = self.l1.pop(key, None)
+        if entry is None:
+            return False
+
+        self.l1_bytes -= len(entry[1])
+        return True
+
+    # ----------------------------------
+    # L2
+    # ----------------------------------
+
+    def write(self, statements, keys):
+        """
+        Runs `(sql, params)` statements in one L2 transaction, logs the
+        changed keys and publishes the change. Returns the statement cursors.
+        """
+        self.setup()
+        connection = self.connect()
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            cursors = [connection.execute(sql, params) for sql, params in statements]
+            if keys:
+                change_id = self.log_changes(connection, keys)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        if keys:
+            self.mark_seen(change_id, len(keys))
+
+        self.writes += 1
+        if self.writes % CLEANUP_EVERY == 0:
+            self.cleanup()
+
+        return cursors
+
+    def cleanup(self):
+        """Deletes expired entries, culls L2 down to MAX_ENTRIES and prunes the change log."""
+        connection = self.connect()
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("DELETE FROM entries WHERE expires <= ?", (time.time(),))
+            count = connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if count > self._max_entries:
+                culled = count - self._max_entries + self._max_entries // self._cull_frequency
+                # Entries closest to expiry go first, then those without a timeout
+                connection.execute(
+                    "DELETE FROM entries WHERE key IN ("
+                    "SELECT key FROM entries ORDER BY expires IS NULL, expires LIMIT ?)",
+                    (culled,),
+                )
+                self.stats["l2_evictions"] += culled
+            connection.execute(
+                "DELETE FROM changes WHERE id <= (SELECT MAX(id) FROM changes) - ?",
+                (self.change_log_size,),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def l2_get(self, key):
+        row = (
+            self.connect()
+            .execute("SELECT value, expires FROM entries WHERE key = ?", (key,))
+            .fetchone()
+        )
+
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return None, None
+
+        return row
+
+    @staticmethod
+    def serialize(value):
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    # ----------------------------------
+    # Cache API
+    # ----------------------------------
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self.sync()
+
+        value = self.l1_get(key)
+        if value is not None:
+            self.stats["l1_hits"] += 1
+            return pickle.loads(value)
+
+        value, expires = self.l2_get(key)
+        if value is None:
+            self.stats["misses"] += 1
+            return default
+
+        self.stats["l2_hits"] += 1
+        self.l1_set(key, value, expires)
+        return pickle.loads(value)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.set_many({key: value}, timeout, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        expires = self.get_backend_timeout(timeout)
+        entries = {
+            self.make_and_validate_key(key, version=version): self.serialize(value)
+            for key, value in data.items()
+        }
+
+        self.write(
+            [
+                (
+                    "INSERT OR REPLACE INTO entries (key, value, expires) VALUES (?, ?, ?)",
+                    (key, value, expires),
+                )
+                for key, value in entries.items()
+            ],
+            list(entries),
+        )
+
+        for key, value in entries.items():
+            self.l1_set(key, value, expires)
+
+        self.stats["sets"] += len(entries)
+        return []
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        expires = self.get_backend_timeout(timeout)
+        value = self.serialize(value)
+
+        # Replaces expired entries only
+        cursor, = self.write(
+            [
+                (
+                    "INSERT INTO entries (key, value, expires) VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+                    "expires = excluded.expires WHERE entries.expires <= ?",
+                    (key, value, expires, time.time()),
+                )
+            ],
+            [key],
+        )
+
+        if not cursor.rowcount:
+            return False
+
+        self.l1_set(key, value, expires)
+        self.stats["sets"] += 1
+        return True
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        expires = self.get_backend_timeout(timeout)
+
+        cursor, = self.write(
+            [
+                (
+                    "UPDATE entries SET expires = ? "
+                    "WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                    (expires, key, time.time()),
+                )
+            ],
+            [key],
+        )
+
+        with self.lock:
+            self.l1_discard(key)
+
+        return bool(cursor.rowcount)
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self.setup()
+        connection = self.connect()
+
+        # Read and written in one transaction, atomic across processes
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT value FROM entries WHERE key = ? "
+                "AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            ).fetchone()
+            if row is None:
+                raise ValueError("Key '%s' not found" % key)
+
+            value = pickle.loads(row[0]) + delta
+            connection.execute(
+                "UPDATE entries SET value = ? WHERE key = ?", (self.serialize(value), key)
+            )
+            change_id = self.log_changes(connection, [key])
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        self.mark_seen(change_id, 1)
+
+        with self.lock:
+            self.l1_discard(key)
+
+        return value
+
+    def delete(self, key, version=None):
+        return self.delete_many([key], version) > 0
+
+    def delete_many(self, keys, version=None):
+        keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        if not keys:
+            return 0
+
+        cursors = self.write(
+            [("DELETE FROM entries WHERE key = ?", (key,)) for key in keys], keys
+        )
+
+        with self.lock:
+            for key in keys:
+                self.l1_discard(key)
+
+        return sum(cursor.rowcount for cursor in cursors)
+
+    def has_key(self, key, version=None):
+        return self.get(key, self, version) is not self
+
+    def clear(self):
+        self.write([("DELETE FROM entries", ())], [None])
+
+        with self.lock:
+            self.l1.clear()
+            self.l1_bytes = 0
+
+    def close(self, **kwargs):
+        # Connections are kept open for the life of the thread
+        pass
+
+    # ----------------------------------
+    # Stats
+    # ----------------------------------
+
+    def get_stats(self):
+        """
+        Returns the counters of the current process: L1 and L2 hits, misses,
+        sets, L1 evictions and invalidations, L2 evictions, and the L1 size.
+        """
+        with self.lock:
+            stats = {
+                name: self.stats[name]
+                for name in (
+                    "l1_hits",
+                    "l2_hits",
+                    "misses",
+                    "sets",
+                    "l1_evictions",
+                    "l1_invalidations",
+                    "l2_evictions",
+                )
+            }
+            stats["l1_entries"] = len(self.l1)
+            stats["l1_bytes"] = self.l1_bytes
+
+        reads = stats["l1_hits"] + stats["l2_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["l1_hits"] + stats["l2_hits"]) / reads if reads else 0.0
+
+        return stats
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats.clear()
@@ -0,0 +1,9 @@
+from .compression_utils import (
+    accepts_gzip,
+    etag_matches,
+    is_compressible,
+    add_gzip_etag_suffix,
+    strip_gzip_etag_suffix,
+    build_compressed_payload,
+    compressed_payload_response,
+)
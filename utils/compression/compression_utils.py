@@ -0,0 +1,127 @@
+import re
+import gzip
+import hashlib
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.http import parse_etags
+from django.utils.cache import patch_vary_headers
+
+# ----------------------------------
+# Content negotiation
+# ----------------------------------
+
+ACCEPTS_GZIP_PATTERN = re.compile(r"\bgzip\b")
+
+# Suffix appended inside the ETag of gzip-encoded representations
+GZIP_ETAG_SUFFIX = "-gzip"
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def accepts_gzip(request):
+    """Returns True if the client accepts gzip-encoded responses."""
+    return bool(ACCEPTS_GZIP_PATTERN.search(request.META.get("HTTP_ACCEPT_ENCODING", "")))
+
+
+def is_compressible(content_type):
+    """Returns True if responses of the given content type are worth compressing."""
+    return content_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
+
+
+def add_gzip_etag_suffix(etag):
+    """Turns `"abc"` into `"abc-gzip"` (weak ETags keep their W/ prefix)."""
+    if not etag.endswith('"') or etag.endswith(GZIP_ETAG_SUFFIX + '"'):
+        return etag
+
+    return etag[:-1] + GZIP_ETAG_SUFFIX + '"'
+
+
+def strip_gzip_etag_suffix(header):
+    """
+    Removes the gzip suffix from every ETag of an If-None-Match / If-Match
+    header so views can compare them against the identity ETag.
+    """
+    return header.replace(GZIP_ETAG_SUFFIX + '"', '"')
+
+
+def get_etag_value(etag):
+    """Returns the opaque value of an ETag, without W/ and the gzip suffix."""
+    if etag.startswith("W/"):
+        etag = etag[2:]
+
+    return strip_gzip_etag_suffix(etag)
+
+
+def etag_matches(header, etag):
+    """
+    Returns True if an If-None-Match header matches the ETag, comparing
+    each listed ETag weakly (either representation matches) and treating
+    `*` as a match.
+    """
+    etags = parse_etags(header)
+
+    if etags == ["*"]:
+        return True
+
+    value = get_etag_value(etag)
+
+    return any(get_etag_value(candidate) == value for candidate in etags)
+
+
+# ----------------------------------
+# Pre-compressed payloads
+# ----------------------------------
+
+
+def build_compressed_payload(body, content_type="application/json"):
+    """
+    Prepares a cacheable payload holding the identity bytes, their gzip
+    encoding (when worth it) and a strong ETag, so that repeat requests
+    never compress the same bytes twice.
+    """
+    compressed = None
+
+    if len(body) >= settings.COMPRESSION_MIN_SIZE:
+        compressed = gzip.compress(
+            body, compresslevel=settings.PRECOMPRESSION_LEVEL, mtime=0
+        )
+        if len(compressed) >= len(body):
+            compressed = None
+
+    return {
+        "body": body,
+        "gzip": compressed,
+        "etag": '"%s"' % hashlib.sha1(body).hexdigest(),
+        "content_type": content_type,
+    }
+
+
+def compressed_payload_response(request, payload):
+    """
+    Returns the response for a payload built by `build_compressed_payload`,
+    picking the gzip bytes when the client accepts them and answering
+    matching If-None-Match requests with 304.
+    """
+    use_gzip = payload["gzip"] is not None and accepts_gzip(request)
+    etag = add_gzip_etag_suffix(payload["etag"]) if use_gzip else payload["etag"]
+
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH", "")
+
+    if if_none_match and etag_matches(if_none_match, etag):
+        response = HttpResponse(status=304)
+    elif use_gzip:
+        response = HttpResponse(payload["gzip"], content_type=payload["content_type"])
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(payload["body"], content_type=payload["content_type"])
+
+    response.headers["ETag"] = etag
+    patch_vary_headers(response, ("Accept-Encoding",))
+
+    return response
@@ -0,0 +1,9 @@
+from .load_test_utils import (
+    SCENARIOS,
+    LoadTestClient,
+    summarize,
+    percentile,
+    run_scenarios,
+    start_server,
+    get_free_port,
+)
@@ -0,0 +1,263 @@
+import sys
+import json
+import time
+import socket
+import random
+import threading
+import subprocess
+import importlib.util
+from http.client import HTTPConnection, HTTPException
+from urllib.parse import urlsplit
+
+# ----------------------------------
+# Result aggregation
+# ----------------------------------
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples, duration):
+    """
+    Aggregates (endpoint, status, latency seconds) samples into per-endpoint
+    throughput, latency percentiles (ms) and error/throttle rates.
+    Status 0 stands for a connection error.
+    """
+    endpoints = {}
+
+    for endpoint, status, latency in samples:
+        endpoints.setdefault(endpoint, []).append((status, latency))
+
+    report = {}
+
+    for endpoint, results in sorted(endpoints.items()):
+        latencies = sorted(latency * 1000 for _, latency in results)
+        count = len(results)
+        errors = sum(1 for status, _ in results if status == 0 or status >= 500)
+        throttled = sum(1 for status, _ in results if status == 429)
+
+        report[endpoint] = {
+            "requests": count,
+            "throughput": round(count / duration, 2),
+            "p50": round(percentile(latencies, 0.50), 2),
+            "p95": round(percentile(latencies, 0.95), 2),
+            "p99": round(percentile(latencies, 0.99), 2),
+            "max": round(latencies[-1], 2),
+            "errorRate": round(errors / count, 4),
+            "throttleRate": round(throttled / count, 4),
+        }
+
+    return report
+
+
+# ----------------------------------
+# HTTP client
+# ----------------------------------
+
+
+class LoadTestClient:
+    """
+    A keep-alive HTTP connection used by a single virtual user, recording
+    the status and latency of every request it sends.
+    """
+
+    def __init__(self, base_url, samples, timeout=30):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.samples = samples
+        self.timeout = timeout
+        self.connection = None
+
+    def request(self, method, path, endpoint, body=None, token=None):
+        """Sends a request and returns (status, parsed JSON body or None)."""
+        headers = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+        if body is not None:
+            body = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        start = time.perf_counter()
+        try:
+            if self.connection is None:
+                self.connection = HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self.connection.request(method, self.prefix + path, body, headers)
+            response = self.connection.getresponse()
+            content = response.read()
+            status = response.status
+        # Refused or reset connections, and responses cut short by the server
+        except (OSError, HTTPException):
+            self.close()
+            status, content = 0, b""
+
+        self.samples.append((endpoint, status, time.perf_counter() - start))
+
+        try:
+            is_json = content and response.getheader("Content-Encoding") != "gzip"
+            return status, json.loads(content) if is_json else None
+        except ValueError:
+            return status, None
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+# ----------------------------------
+# Scenarios
+# ----------------------------------
+
+
+def login_storm(client, context, rng):
+    """Every iteration logs in again, stressing password hashing and throttling."""
+    client.request(
+        "POST",
+        "/users/login/",
+        "POST /users/login/",
+        body={"username": context["username"], "password": context["password"]},
+    )
+
+
+def token_polling(client, context, rng):
+    """An authenticated client polling its profile."""
+    client.request(
+        "GET", "/users/user-info/", "GET /users/user-info/", token=context["token"]
+    )
+
+
+def mixed_read_write(client, context, rng):
+    """Mostly public menu reads with occasional owner price updates."""
+    if rng.random() < context.get("write_ratio", 0.1):
+        client.request(
+            "PATCH",
+            f"/products/{context['product_id']}/",
+            "PATCH /products/{id}/",
+            body={"price": str(rng.randint(10, 500) * 1000)},
+            token=context["token"],
+        )
+    else:
+        client.request(
+            "GET", f"/menu/{context['restaurant_id']}/", "GET /menu/{id}/"
+        )
+
+
+SCENARIOS = {
+    "login-storm": login_storm,
+    "polling": token_polling,
+    "mixed": mixed_read_write,
+}
+
+
+def run_scenarios(base_url, scenarios, context, duration, seed=0):
+    """
+    Runs each (scenario name, concurrency) pair with one thread per virtual
+    user for `duration` seconds and returns the aggregated report.
+    """
+    samples = []
+    deadline = time.perf_counter() + duration
+
+    def virtual_user(scenario, index):
+        client = LoadTestClient(base_url, samples)
+        rng = random.Random(f"{seed}-{scenario.__name__}-{index}")
+        try:
+            while time.perf_counter() < deadline:
+                scenario(client, context, rng)
+        finally:
+            client.close()
+
+    threads = [
+        threading.Thread(target=virtual_user, args=(SCENARIOS[name], index), daemon=True)
+        for name, concurrency in scenarios
+        for index in range(concurrency)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "duration": round(elapsed, 2),
+        "scenarios": dict(scenarios),
+        "endpoints": summarize(samples, elapsed),
+    }
+
+
+# ----------------------------------
+# Application server
+# ----------------------------------
+
+
+def get_free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(server, port, workers, env):
+    """
+    Starts the application under gunicorn (WSGI) or uvicorn (ASGI), from
+    the current Python environment.
+    """
+    if server not in ("gunicorn", "uvicorn"):
+        raise ValueError(f"Unknown server: {server}")
+
+    if importlib.util.find_spec(server) is None:
+        raise RuntimeError(f"{server} is not installed (see requirements.txt).")
+
+    if server == "gunicorn":
+        command = [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "OnlineMenuApi.wsgi:application",
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--workers",
+            str(workers),
+        ]
+    else:
+        command = [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "OnlineMenuApi.asgi:application",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+        ]
+
+    process = subprocess.Popen(
+        command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    wait_for_port(port, process)
+
+    return process
+
+
+def wait_for_port(port, process, timeout=30):
+    """Blocks until the server accepts connections."""
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("The application server exited during startup.")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError("The application server did not start in time.")
@@ -0,0 +1,3 @@
+from .compression_middleware import CompressionMiddleware
+from .session_route_middleware import SessionRouteMiddleware
+from .profiling_middleware import ProfilingMiddleware
@@ -0,0 +1,73 @@
+import gzip
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from utils.compression import (
+    accepts_gzip,
+    is_compressible,
+    add_gzip_etag_suffix,
+    strip_gzip_etag_suffix,
+)
+
+
+class CompressionMiddleware:
+    """
+    Gzips text and JSON responses larger than COMPRESSION_MIN_SIZE.
+
+    Unlike Django's GZipMiddleware, compressed responses keep a strong ETag
+    with a "-gzip" suffix. The suffix is stripped from conditional request
+    headers before the view runs, so views only ever deal with the ETag of
+    the identity representation. Responses that already carry a
+    Content-Encoding (e.g. pre-compressed cached payloads) are left alone.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        suffixed = False
+
+        for header in ("HTTP_IF_NONE_MATCH", "HTTP_IF_MATCH"):
+            value = request.META.get(header)
+            if value and strip_gzip_etag_suffix(value) != value:
+                request.META[header] = strip_gzip_etag_suffix(value)
+                suffixed = True
+
+        response = self.get_response(request)
+
+        # A 304 must repeat the ETag of the representation the client holds
+        if response.status_code == 304:
+            if suffixed and response.has_header("ETag"):
+                response.headers["ETag"] = add_gzip_etag_suffix(response["ETag"])
+            return response
+
+        if (
+            response.streaming
+            or response.has_header("Content-Encoding")
+            or not is_compressible(response.get("Content-Type", ""))
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        if not accepts_gzip(request):
+            return response
+
+        compressed = gzip.compress(
+            response.content, compresslevel=settings.COMPRESSION_LEVEL, mtime=0
+        )
+
+        # Return the compressed content only if it's actually shorter
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        response.headers["Content-Encoding"] = "gzip"
+
+        if response.has_header("ETag"):
+            response.headers["ETag"] = add_gzip_etag_suffix(response["ETag"])
+
+        return response
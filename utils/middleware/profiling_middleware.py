@@ -0,0 +1,119 @@
+import time
+import random
+import cProfile
+from contextlib import ExitStack
+from django.conf import settings
+from django.db import connections
+from django.core.exceptions import MiddlewareNotUsed
+from utils.profiling import (
+    STACK_MODE,
+    CPROFILE_MODE,
+    QueryRecorder,
+    StackSampler,
+    write_profile,
+    get_profile_id,
+    get_pstats_timings,
+    load_profiling_token,
+)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles individual requests on demand and writes the results to
+    PROFILING_DIR.
+
+    A request is profiled when it carries a valid signed X-Profile header
+    (see ProfilingTokenView) or is picked by PROFILING_SAMPLE_RATE. Each
+    profile records the SQL queries with their durations, the time spent
+    hashing passwords and handling JWTs, and either cProfile stats (.pstats)
+    or stack samples (.speedscope.json). Other requests only pay for a
+    header lookup; with PROFILING_ENABLED off the middleware is removed.
+    """
+
+    sync_capable = True
+    async_capable = False
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.header = "HTTP_" + settings.PROFILING_HEADER.upper().replace("-", "_")
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+
+    def get_mode(self, request):
+        token = request.META.get(self.header)
+        if token:
+            return load_profiling_token(token)
+
+        if self.sample_rate and random.random() < self.sample_rate:
+            return STACK_MODE
+
+        return None
+
+    def __call__(self, request):
+        mode = self.get_mode(request)
+        if mode is None:
+            return self.get_response(request)
+
+        return self.profile(request, mode)
+
+    def profile(self, request, mode):
+        profiler = sampler = None
+        recorder = QueryRecorder()
+
+        if mode == CPROFILE_MODE:
+            profiler = cProfile.Profile()
+        else:
+            sampler = StackSampler()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+
+            started = time.perf_counter()
+            if profiler is not None:
+                try:
+                    profiler.enable()
+                except ValueError:
+                    # Another profiler is already active on this thread
+                    profiler, sampler = None, StackSampler()
+            if sampler is not None:
+                sampler.start()
+
+            try:
+                response = self.get_response(request)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+                if sampler is not None:
+                    sampler.stop()
+                duration = time.perf_counter() - started
+
+        profile_id = get_profile_id(request)
+        write_profile(
+            profile_id,
+            {
+                "id": profile_id,
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "mode": CPROFILE_MODE if profiler is not None else STACK_MODE,
+                "duration": round(duration * 1000, 3),
+                "queryCount": len(recorder.queries),
+                "queryDuration": round(
+                    sum(query["duration"] for query in recorder.queries), 3
+                ),
+                "queries": recorder.queries,
+                "timings": (
+                    get_pstats_timings(profiler)
+                    if profiler is not None
+                    else sampler.get_timings()
+                ),
+            },
+            profiler=profiler,
+            sampler=sampler,
+        )
+
+        response["X-Profile-Id"] = profile_id
+        return response
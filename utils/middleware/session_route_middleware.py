@@ -0,0 +1,89 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.module_loading import import_string
+from django.core.handlers.exception import convert_exception_to_response
+
+
+class SessionRouteMiddleware:
+    """
+    Runs the SESSION_MIDDLEWARE stack only for SESSION_ROUTE_PREFIXES.
+
+    The JWT API never reads sessions, cookies-based CSRF tokens, messages or
+    the lazy `request.user` set up by those middleware, so API requests skip
+    them entirely. Requests to the admin (or any other session route) go
+    through the full stack, including the `process_view`,
+    `process_exception` and `process_template_response` hooks, which are
+    forwarded here because Django only collects them from MIDDLEWARE.
+    """
+
+    sync_capable = True
+    async_capable = False
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefixes = tuple(settings.SESSION_ROUTE_PREFIXES)
+
+        self.view_middleware = []
+        self.template_response_middleware = []
+        self.exception_middleware = []
+
+        # Build the inner chain the same way Django's BaseHandler does
+        handler = get_response
+        for middleware_path in reversed(settings.SESSION_MIDDLEWARE):
+            try:
+                instance = import_string(middleware_path)(handler)
+            except MiddlewareNotUsed:
+                continue
+
+            if hasattr(instance, "process_view"):
+                self.view_middleware.insert(0, instance.process_view)
+            if hasattr(instance, "process_template_response"):
+                self.template_response_middleware.append(
+                    instance.process_template_response
+                )
+            if hasattr(instance, "process_exception"):
+                self.exception_middleware.append(instance.process_exception)
+
+            handler = convert_exception_to_response(instance)
+
+        self.session_handler = handler
+
+    def is_session_route(self, request):
+        return request.path_info.startswith(self.prefixes)
+
+    def __call__(self, request):
+        if self.is_session_route(request):
+            return self.session_handler(request)
+
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not self.is_session_route(request):
+            return None
+
+        for process_view in self.view_middleware:
+            response = process_view(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+
+        return None
+
+    def process_exception(self, request, exception):
+        if not self.is_session_route(request):
+            return None
+
+        for process_exception in self.exception_middleware:
+            response = process_exception(request, exception)
+            if response is not None:
+                return response
+
+        return None
+
+    def process_template_response(self, request, response):
+        if not self.is_session_route(request):
+            return response
+
+        for process_template_response in self.template_response_middleware:
+            response = process_template_response(request, response)
+
+        return response
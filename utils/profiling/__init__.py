@@ -0,0 +1,13 @@
+from .profiling_utils import (
+    STACK_MODE,
+    CPROFILE_MODE,
+    PROFILING_MODES,
+    QueryRecorder,
+    StackSampler,
+    write_profile,
+    prune_profiles,
+    get_profile_id,
+    get_pstats_timings,
+    load_profiling_token,
+    create_profiling_token,
+)
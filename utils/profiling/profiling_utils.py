@@ -0,0 +1,280 @@
+import sys
+import json
+import time
+import uuid
+import pstats
+import threading
+from pathlib import Path
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+
+PROFILING_TOKEN_SALT = "utils.profiling"
+
+# Number of requests profiled with one token so far
+PROFILING_TOKEN_USES_CACHE_KEY = "profiling:token:{token_id}:uses"
+
+CPROFILE_MODE = "cprofile"
+STACK_MODE = "stack"
+PROFILING_MODES = (CPROFILE_MODE, STACK_MODE)
+
+# Functions whose cumulative time is reported on its own, matched by file
+# suffix and function name in both the cProfile stats and the stack samples
+TIMED_FUNCTIONS = {
+    "passwordHashing": [
+        ("django/contrib/auth/hashers.py", "check_password"),
+        ("django/contrib/auth/hashers.py", "make_password"),
+    ],
+    "jwtAuthentication": [
+        ("rest_framework_simplejwt/authentication.py", "authenticate"),
+    ],
+    "jwtEncoding": [
+        ("rest_framework_simplejwt/backends.py", "encode"),
+    ],
+    "jwtDecoding": [
+        ("rest_framework_simplejwt/backends.py", "decode"),
+    ],
+}
+
+# ----------------------------------
+# Trigger tokens
+# ----------------------------------
+
+
+def create_profiling_token(user, mode=CPROFILE_MODE):
+    """
+    Returns a signed X-Profile header value, valid for PROFILING_TOKEN_MAX_AGE
+    seconds and PROFILING_TOKEN_MAX_USES requests.
+    """
+    return signing.dumps(
+        {"id": uuid.uuid4().hex, "user": str(user.pk), "mode": mode},
+        salt=PROFILING_TOKEN_SALT,
+    )
+
+
+def load_profiling_token(token):
+    """
+    Returns the profiling mode of a valid token, or None. Every call counts
+    as a use of the token, a leaked token profiles a handful of requests.
+    """
+    try:
+        data = signing.loads(
+            token, salt=PROFILING_TOKEN_SALT, max_age=settings.PROFILING_TOKEN_MAX_AGE
+        )
+    except signing.BadSignature:
+        return None
+
+    if not isinstance(data, dict) or data.get("mode") not in PROFILING_MODES:
+        return None
+
+    key = PROFILING_TOKEN_USES_CACHE_KEY.format(token_id=data.get("id"))
+    cache.add(key, 0, settings.PROFILING_TOKEN_MAX_AGE)
+
+    try:
+        uses = cache.incr(key)
+    except ValueError:
+        # Evicted meanwhile, refuse rather than allow unlimited uses
+        return None
+
+    return data["mode"] if uses <= settings.PROFILING_TOKEN_MAX_USES else None
+
+
+# ----------------------------------
+# SQL queries
+# ----------------------------------
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper recording every query with its duration.
+    Parameters are left out, they may hold credentials or tokens.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                {
+                    "alias": context["connection"].alias,
+                    "sql": sql,
+                    "many": many,
+                    "duration": round((time.perf_counter() - started) * 1000, 3),
+                }
+            )
+
+
+# ----------------------------------
+# Stack sampling
+# ----------------------------------
+
+
+class StackSampler:
+    """
+    Samples the call stack of one thread from a background thread, at
+    PROFILING_SAMPLE_INTERVAL, and exports it in the speedscope format.
+    Cheaper than cProfile on deep call trees, at the cost of precision.
+    """
+
+    def __init__(self, thread_id=None, interval=None):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval or settings.PROFILING_SAMPLE_INTERVAL
+
+        self.frames = []
+        self.frame_indexes = {}
+        self.samples = []
+        self.weights = []
+
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        self.elapsed = time.perf_counter() - self.started
+
+    def get_frame_index(self, code):
+        key = (code.co_filename, code.co_name, code.co_firstlineno)
+        if key not in self.frame_indexes:
+            self.frame_indexes[key] = len(self.frames)
+            self.frames.append({"name": key[1], "file": key[0], "line": key[2]})
+
+        return self.frame_indexes[key]
+
+    def run(self):
+        last = time.perf_counter()
+
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+
+            stack = []
+            while frame is not None:
+                stack.append(self.get_frame_index(frame.f_code))
+                frame = frame.f_back
+
+            if stack:
+                # Speedscope expects stacks from the root to the leaf
+                self.samples.append(stack[::-1])
+                self.weights.append(now - last)
+            last = now
+
+    def get_timings(self):
+        """Returns the sampled time spent in TIMED_FUNCTIONS (ms)."""
+        timings = {}
+
+        for name, functions in TIMED_FUNCTIONS.items():
+            indexes = {
+                index
+                for (file, function, line), index in self.frame_indexes.items()
+                if any(
+                    file.endswith(suffix) and function == target
+                    for suffix, target in functions
+                )
+            }
+            total = sum(
+                weight
+                for stack, weight in zip(self.samples, self.weights)
+                if indexes.intersection(stack)
+            )
+            timings[name] = round(total * 1000, 3)
+
+        return timings
+
+    def to_speedscope(self, name):
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "OnlineMenuApi",
+            "shared": {"frames": self.frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.elapsed,
+                    "samples": self.samples,
+                    "weights": self.weights,
+                }
+            ],
+        }
+
+
+def get_pstats_timings(profiler):
+    """Returns the cumulative time spent in TIMED_FUNCTIONS from cProfile stats (ms)."""
+    stats = pstats.Stats(profiler).stats
+    timings = {}
+
+    for name, functions in TIMED_FUNCTIONS.items():
+        total = sum(
+            cumulative
+            for (file, line, function), (_, _, _, cumulative, _) in stats.items()
+            if any(
+                file.endswith(suffix) and function == target
+                for suffix, target in functions
+            )
+        )
+        timings[name] = round(total * 1000, 3)
+
+    return timings
+
+
+# ----------------------------------
+# Output
+# ----------------------------------
+
+
+def get_profile_id(request):
+    """Returns a sortable, unique base name for the files of one profiled request."""
+    return "%s-%s-%s" % (
+        time.strftime("%Y%m%d-%H%M%S"),
+        request.method.lower(),
+        uuid.uuid4().hex[:8],
+    )
+
+
+def write_profile(profile_id, summary, profiler=None, sampler=None):
+    """
+    Writes `<id>.json` (request, SQL and timing summary) and either
+    `<id>.pstats` or `<id>.speedscope.json` to PROFILING_DIR.
+    """
+    directory = Path(settings.PROFILING_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    if profiler is not None:
+        summary["profile"] = f"{profile_id}.pstats"
+        profiler.dump_stats(directory / summary["profile"])
+    elif sampler is not None:
+        summary["profile"] = f"{profile_id}.speedscope.json"
+        (directory / summary["profile"]).write_text(
+            json.dumps(sampler.to_speedscope(summary["path"]))
+        )
+
+    (directory / f"{profile_id}.json").write_text(
+        json.dumps(summary, ensure_ascii=False, indent=2)
+    )
+
+    prune_profiles(directory)
+
+
+def prune_profiles(directory, keep=None):
+    """Deletes the files of all but the `keep` (PROFILING_MAX_PROFILES) newest profiles."""
+    keep = settings.PROFILING_MAX_PROFILES if keep is None else keep
+    files = {}
+
+    # Profile ids start with their timestamp, so they sort by age
+    for path in directory.iterdir():
+        files.setdefault(path.name.split(".", 1)[0], []).append(path)
+
+    for profile_id in sorted(files)[: max(len(files) - keep, 0)]:
+        for path in files[profile_id]:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,11 @@
+from .pubsub_utils import (
+    Hub,
+    BaseBroker,
+    LocalBroker,
+    SQLiteBroker,
+    Subscription,
+    publish,
+    get_hub,
+    get_broker,
+    reset_pubsub,
+)
@@ -0,0 +1,272 @@
+import time
+import sqlite3
+import asyncio
+import logging
+import threading
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# ----------------------------------
+# Brokers
+# ----------------------------------
+
+
+class BaseBroker:
+    """
+    Carries published messages (strings) to every process running a Hub.
+
+    `publish` may be called from any thread or process. `start` is called
+    once, by the Hub of a process that has subscribers, with the callback
+    receiving `(channel, message)` for every published message.
+    """
+
+    def publish(self, channel, message):
+        raise NotImplementedError
+
+    def start(self, deliver):
+        raise NotImplementedError
+
+    def stop(self):
+        pass
+
+
+class LocalBroker(BaseBroker):
+    """Delivers messages within the current process only (single worker)."""
+
+    def __init__(self):
+        self.deliver = None
+
+    def publish(self, channel, message):
+        if self.deliver is not None:
+            self.deliver(channel, message)
+
+    def start(self, deliver):
+        self.deliver = deliver
+
+
+class SQLiteBroker(BaseBroker):
+    """
+    Multi-process stand-in for a Redis/PostgreSQL pub/sub broker: messages
+    are appended to a table of the PUBSUB_SQLITE_PATH file, which every
+    subscribed process polls every PUBSUB_POLL_INTERVAL seconds.
+    Messages older than PUBSUB_RETENTION seconds are pruned.
+    """
+
+    def __init__(self, path=None, interval=None):
+        self.path = str(path or settings.PUBSUB_SQLITE_PATH)
+        self.interval = interval or settings.PUBSUB_POLL_INTERVAL
+        self.local = threading.local()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.published = 0
+
+        with self.connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS messages ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "channel TEXT NOT NULL, message TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    def connect(self):
+        """Returns the SQLite connection of the current thread."""
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self.local.connection = connection
+
+        return connection
+
+    def publish(self, channel, message):
+        connection = self.connect()
+        connection.execute(
+            "INSERT INTO messages (channel, message, created) VALUES (?, ?, ?)",
+            (channel, message, time.time()),
+        )
+
+        self.published += 1
+        if self.published % 100 == 0:
+            connection.execute(
+                "DELETE FROM messages WHERE created < ?",
+                (time.time() - settings.PUBSUB_RETENTION,),
+            )
+
+    def start(self, deliver):
+        # Only messages published from now on are delivered
+        row = self.connect().execute("SELECT MAX(id) FROM messages").fetchone()
+        self.last_id = row[0] or 0
+
+        self.thread = threading.Thread(target=self.run, args=(deliver,), daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def poll(self, deliver):
+        rows = self.connect().execute(
+            "SELECT id, channel, message FROM messages WHERE id > ? ORDER BY id",
+            (self.last_id,),
+        )
+        for self.last_id, channel, message in rows.fetchall():
+            deliver(channel, message)
+
+    def run(self, deliver):
+        while not self.stopped.wait(self.interval):
+            try:
+                self.poll(deliver)
+            except sqlite3.Error:
+                logger.exception("Polling the pub/sub database failed")
+
+
+# ----------------------------------
+# Fan-out
+# ----------------------------------
+
+
+class Subscription:
+    """
+    Messages of one channel for one consumer, read from its event loop.
+    A consumer falling more than `max_size` messages behind is closed
+    (`get` returns None) instead of buffering without bounds.
+    """
+
+    def __init__(self, hub, channel, max_size):
+        self.hub = hub
+        self.channel = channel
+        self.max_size = max_size
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        self.closed = False
+
+    def put(self, message):
+        """Called on the subscription's event loop."""
+        if self.closed:
+            return
+
+        if self.queue.qsize() >= self.max_size:
+            self.closed = True
+            message = None
+
+        self.queue.put_nowait(message)
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.closed = True
+        self.hub.unsubscribe(self)
+
+
+class Hub:
+    """
+    In-process fan-out of broker messages to the subscriptions of a worker.
+
+    Subscriptions live on event loops (usually one per worker) while
+    messages arrive on broker or request threads, so a message is handed
+    to each loop once, with a single `call_soon_threadsafe`, however many
+    idle subscribers that loop holds.
+    """
+
+    def __init__(self, broker):
+        self.broker = broker
+        self.channels = {}
+        self.lock = threading.Lock()
+        self.started = False
+
+    def subscribe(self, channel, max_size=None):
+        """Returns a new Subscription, must be called from an event loop."""
+        subscription = Subscription(
+            self, channel, max_size or settings.PUBSUB_QUEUE_SIZE
+        )
+
+        with self.lock:
+            self.channels.setdefault(channel, set()).add(subscription)
+            if not self.started:
+                self.started = True
+                self.broker.start(self.deliver)
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscriptions = self.channels.get(subscription.channel, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self.channels.pop(subscription.channel, None)
+
+    def count(self, channel=None):
+        """Returns the number of subscriptions (of a channel, or in total)."""
+        with self.lock:
+            if channel is not None:
+                return len(self.channels.get(channel, ()))
+            return sum(len(subscriptions) for subscriptions in self.channels.values())
+
+    def deliver(self, channel, message):
+        """Hands a message to every subscription of the channel, from any thread."""
+        with self.lock:
+            subscriptions = list(self.channels.get(channel, ()))
+
+        loops = {}
+        for subscription in subscriptions:
+            loops.setdefault(subscription.loop, []).append(subscription)
+
+        for loop, group in loops.items():
+            try:
+                loop.call_soon_threadsafe(self.put_many, group, message)
+            except RuntimeError:
+                # The loop was closed, its subscriptions are gone
+                for subscription in group:
+                    self.unsubscribe(subscription)
+
+    @staticmethod
+    def put_many(subscriptions, message):
+        for subscription in subscriptions:
+            subscription.put(message)
+
+
+_broker = None
+_hub = None
+_lock = threading.Lock()
+
+
+def get_broker():
+    """Returns the process-wide PUBSUB_BROKER instance."""
+    global _broker
+
+    with _lock:
+        if _broker is None:
+            _broker = import_string(settings.PUBSUB_BROKER)()
+
+    return _broker
+
+
+def get_hub():
+    """Returns the process-wide Hub, fed by the PUBSUB_BROKER."""
+    global _hub
+
+    broker = get_broker()
+    with _lock:
+        if _hub is None:
+            _hub = Hub(broker)
+
+    return _hub
+
+
+def publish(channel, message):
+    """Publishes a message (a string) to the subscribers of a channel, in every process."""
+    get_broker().publish(channel, message)
+
+
+def reset_pubsub():
+    """Stops the broker, the next use creates one (and a hub) from the current settings."""
+    global _broker, _hub
+
+    with _lock:
+        if _broker is not None:
+            _broker.stop()
+        _broker = _hub = None
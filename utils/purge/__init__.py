@@ -0,0 +1,13 @@
+from .purge_utils import (
+    purge,
+    NullPurger,
+    BasePurger,
+    HTTPPurger,
+    PurgeServer,
+    get_purger,
+    reset_purger,
+    get_media_tag,
+    schedule_purge,
+    add_cache_tags,
+    patch_edge_cache_control,
+)
@@ -0,0 +1,233 @@
+import hashlib
+import logging
+import threading
+from django.conf import settings
+from utils.transaction import on_commit_once
+from concurrent.futures import ThreadPoolExecutor
+from django.utils.module_loading import import_string
+from urllib.request import ProxyHandler, Request, build_opener
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Tags sent in one purge request, keeps the header within proxy limits
+MAX_TAGS_PER_REQUEST = 100
+
+# ----------------------------------
+# Purgers
+# ----------------------------------
+
+
+class BasePurger:
+    """
+    Evicts the reverse-proxy cache entries tagged with any of the given
+    tags (the `Surrogate-Key` values of the cached responses).
+    """
+
+    def purge(self, tags):
+        raise NotImplementedError
+
+
+class NullPurger(BasePurger):
+    """Purges nothing, for deployments without a tag-aware cache."""
+
+    def purge(self, tags):
+        pass
+
+
+class HTTPPurger(BasePurger):
+    """
+    Sends `PURGE` requests carrying the tags (space separated, in the
+    CACHE_PURGE_HEADER header) to every CACHE_PURGE_URLS endpoint, e.g. a
+    Varnish listener calling xkey.purge() on that header.
+
+    Failures are logged and never raised: edge entries then expire after
+    EDGE_CACHE_MAX_AGE seconds.
+    """
+
+    def __init__(self, urls=None, header=None, timeout=None):
+        self.urls = urls if urls is not None else settings.CACHE_PURGE_URLS
+        self.header = header or settings.CACHE_PURGE_HEADER
+        self.timeout = timeout or settings.CACHE_PURGE_TIMEOUT
+        # Purge endpoints are internal, environment proxies must not be used
+        self.opener = build_opener(ProxyHandler({}))
+
+    def purge(self, tags):
+        tags = list(tags)
+
+        for start in range(0, len(tags), MAX_TAGS_PER_REQUEST):
+            batch = tags[start : start + MAX_TAGS_PER_REQUEST]
+
+            for url in self.urls:
+                request = Request(
+                    url, method="PURGE", headers={self.header: " ".join(batch)}
+                )
+
+                try:
+                    with self.opener.open(request, timeout=self.timeout) as response:
+                        response.read()
+                except OSError:
+                    logger.exception("Failed to purge %d cache tags at %s", len(batch), url)
+
+
+_purger = None
+_executor = None
+_lock = threading.Lock()
+
+
+def get_purger():
+    """Returns the process-wide CACHE_PURGER instance."""
+    global _purger
+
+    with _lock:
+        if _purger is None:
+            _purger = import_string(settings.CACHE_PURGER)()
+
+    return _purger
+
+
+def _get_executor():
+    """Lazily creates the process-wide purge worker pool."""
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.CACHE_PURGE_WORKERS,
+                thread_name_prefix="cache-purge",
+            )
+
+    return _executor
+
+
+def send_purge(tags):
+    try:
+        get_purger().purge(tags)
+    except Exception:
+        logger.exception("Failed to purge %d cache tags", len(tags))
+
+
+def purge(*tags):
+    """
+    Purges the cache entries tagged with any of the given tags, in the
+    background purge workers so requests never wait for purge endpoints.
+    Runs inline when CACHE_PURGE_WORKERS is 0.
+    """
+    if not tags:
+        return
+
+    tags = sorted(set(tags))
+
+    if settings.CACHE_PURGE_WORKERS > 0:
+        _get_executor().submit(send_purge, tags)
+    else:
+        send_purge(tags)
+
+
+def schedule_purge(*tags):
+    """
+    Purges the given tags once the current transaction commits. Tags of
+    one transaction are merged into a single purge, and purges of rolled
+    back transactions are dropped with them.
+    """
+    on_commit_once("purge", lambda pending: purge(*pending), tags)
+
+
+def reset_purger():
+    """Drops the purger, the next purge creates one from the current settings."""
+    global _purger
+
+    with _lock:
+        _purger = None
+
+
+# ----------------------------------
+# Local stand-in
+# ----------------------------------
+
+
+class PurgeServer:
+    """
+    Local stand-in for a tag-aware cache, receiving the requests of an
+    HTTPPurger: the tags of every `PURGE` request are appended to `purged`.
+    Used by the tests, or to watch purges during development.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, header=None):
+        self.header = header or settings.CACHE_PURGE_HEADER
+        self.purged = []
+        self.server = ThreadingHTTPServer((host, port), self.get_handler())
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def get_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_PURGE(self):
+                server.purged.append(self.headers.get(server.header, "").split())
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+
+# ----------------------------------
+# Response tagging
+# ----------------------------------
+
+
+def get_media_tag(name):
+    """Returns the tag of a media file (paths may hold any character)."""
+    return "media-" + hashlib.sha256(name.encode()).hexdigest()[:16]
+
+
+def add_cache_tags(response, tags):
+    """
+    Tags a response for the edge cache: `Surrogate-Key` (Varnish xkey,
+    Fastly) holds the tags space separated, `Cache-Tag` (Cloudflare)
+    comma separated.
+    """
+    tags = list(dict.fromkeys(tags))
+
+    response.headers["Surrogate-Key"] = " ".join(tags)
+    response.headers["Cache-Tag"] = ",".join(tags)
+
+    return response
+
+
+def patch_edge_cache_control(response, max_age=0):
+    """
+    Lets shared caches keep a response EDGE_CACHE_MAX_AGE seconds (browsers
+    `max_age` seconds) and serve it stale for EDGE_CACHE_STALE_WHILE_REVALIDATE
+    more seconds while refetching it. Tagged responses are purged as soon
+    as their data changes, so the edge lifetime can be long.
+    """
+    if not settings.EDGE_CACHE_MAX_AGE:
+        return response
+
+    response.headers["Cache-Control"] = (
+        f"public, max-age={max_age}, s-maxage={settings.EDGE_CACHE_MAX_AGE}, "
+        f"stale-while-revalidate={settings.EDGE_CACHE_STALE_WHILE_REVALIDATE}"
+    )
+
+    return response
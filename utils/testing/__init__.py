@@ -0,0 +1 @@
+from .test_runner import TestRunner
@@ -0,0 +1,35 @@
+import shutil
+import tempfile
+from pathlib import Path
+from django.conf import settings
+from django.test.utils import override_settings
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Runs the tests with a cache of their own: tests clear the cache, so the
+    default cache file (shared with running development servers) is swapped
+    for one in a temporary directory, removed when the run ends.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+
+        self.cache_dir = tempfile.mkdtemp(prefix="test-cache-")
+        self.cache_settings = override_settings(
+            CACHES={
+                **settings.CACHES,
+                "default": {
+                    **settings.CACHES["default"],
+                    "LOCATION": str(Path(self.cache_dir) / "cache.sqlite3"),
+                },
+            }
+        )
+        self.cache_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.cache_settings.disable()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,9 @@
+from .media_view_test_case import MediaViewTestCase
+from .compression_test_case import CompressionTestCase
+from .session_route_middleware_test_case import SessionRouteMiddlewareTestCase
+from .load_test_test_case import LoadTestReportTestCase, LoadTestCommandTestCase
+from .profiling_middleware_test_case import ProfilingMiddlewareTestCase
+from .persian_text_test_case import PersianTextTestCase
+from .two_tier_cache_test_case import TwoTierCacheTestCase
+from .purge_test_case import PurgeTestCase
+from .transaction_test_case import OnCommitOnceTestCase
@@ -0,0 +1,139 @@
+import gzip
+from django.test import SimpleTestCase, RequestFactory
+from django.http import HttpResponse, StreamingHttpResponse
+from utils.middleware import CompressionMiddleware
+from utils.compression import (
+    etag_matches,
+    build_compressed_payload,
+    compressed_payload_response,
+)
+
+BODY = b'{"name": "' + b"menu " * 500 + b'"}'
+
+
+class CompressionTestCase(SimpleTestCase):
+    """Test cases for response compression and pre-compressed payloads"""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def middleware(self, response):
+        return CompressionMiddleware(lambda request: response)
+
+    def test_large_json_is_compressed(self):
+        """JSON responses above the threshold are gzipped"""
+        response = HttpResponse(BODY, content_type="application/json")
+        response.headers["ETag"] = '"abc"'
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING="gzip")
+
+        response = self.middleware(response)(request)
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), BODY)
+        self.assertEqual(response["ETag"], '"abc-gzip"')
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_small_responses_are_not_compressed(self):
+        """Bodies under the threshold are sent as-is, with Vary set"""
+        response = HttpResponse(b"{}", content_type="application/json")
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING="gzip")
+
+        response = self.middleware(response)(request)
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_client_without_gzip_gets_identity(self):
+        """Clients that do not accept gzip get the identity body"""
+        response = HttpResponse(BODY, content_type="application/json")
+
+        response = self.middleware(response)(self.factory.get("/"))
+
+        self.assertEqual(response.content, BODY)
+
+    def test_binary_and_streaming_responses_are_skipped(self):
+        """Images and streamed files are never recompressed"""
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING="gzip")
+
+        image = self.middleware(HttpResponse(BODY, content_type="image/jpeg"))(request)
+        stream = self.middleware(
+            StreamingHttpResponse([BODY], content_type="application/json")
+        )(request)
+
+        self.assertFalse(image.has_header("Content-Encoding"))
+        self.assertFalse(stream.has_header("Content-Encoding"))
+
+    def test_suffixed_etag_is_stripped_for_views(self):
+        """Views see the identity ETag and 304s repeat the suffixed one"""
+        seen = {}
+
+        def view(request):
+            seen["if_none_match"] = request.META["HTTP_IF_NONE_MATCH"]
+            response = HttpResponse(status=304)
+            response.headers["ETag"] = '"abc"'
+            return response
+
+        request = self.factory.get(
+            "/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH='"abc-gzip"'
+        )
+        response = CompressionMiddleware(view)(request)
+
+        self.assertEqual(seen["if_none_match"], '"abc"')
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], '"abc-gzip"')
+
+    def test_precompressed_payload_is_served(self):
+        """Pre-compressed payloads are sent without recompressing"""
+        payload = build_compressed_payload(BODY)
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING="gzip")
+
+        response = CompressionMiddleware(
+            lambda request: compressed_payload_response(request, payload)
+        )(request)
+
+        self.assertIs(response.content, payload["gzip"])
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertTrue(response["ETag"].endswith('-gzip"'))
+
+    def test_precompressed_payload_conditional_request(self):
+        """A matching ETag returns 304 for both representations"""
+        payload = build_compressed_payload(BODY)
+        handler = CompressionMiddleware(
+            lambda request: compressed_payload_response(request, payload)
+        )
+
+        gzip_etag = handler(self.factory.get("/", HTTP_ACCEPT_ENCODING="gzip"))["ETag"]
+        gzip_response = handler(
+            self.factory.get(
+                "/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=gzip_etag
+            )
+        )
+        identity_response = handler(
+            self.factory.get("/", HTTP_IF_NONE_MATCH=payload["etag"])
+        )
+
+        self.assertEqual(gzip_response.status_code, 304)
+        self.assertEqual(gzip_response["ETag"], gzip_etag)
+        self.assertEqual(identity_response.status_code, 304)
+        self.assertEqual(identity_response["ETag"], payload["etag"])
+
+    def test_if_none_match_is_parsed(self):
+        """ETag lists are compared weakly, per ETag, and `*` matches anything"""
+        self.assertTrue(etag_matches('"x", W/"abc"', '"abc"'))
+        self.assertTrue(etag_matches('"abc-gzip"', '"abc"'))
+        self.assertTrue(etag_matches("*", '"abc"'))
+        self.assertFalse(etag_matches('"abcd"', '"abc"'))
+        self.assertFalse(etag_matches('"ab"', '"abc"'))
+
+        payload = build_compressed_payload(BODY)
+        # A truncated ETag used to match as a substring
+        truncated = '"other", ' + payload["etag"][:-2] + '"'
+        response = compressed_payload_response(
+            self.factory.get("/", HTTP_IF_NONE_MATCH=truncated), payload
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = compressed_payload_response(
+            self.factory.get("/", HTTP_IF_NONE_MATCH="*"), payload
+        )
+        self.assertEqual(response.status_code, 304)
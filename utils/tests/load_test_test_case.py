@@ -0,0 +1,105 @@
+import json
+import socket
+import threading
+from io import StringIO
+from users.models import UserModel
+from django.core.cache import cache
+from menu.models import RestaurantModel
+from django.core.management import call_command, CommandError
+from django.test import SimpleTestCase, LiveServerTestCase
+from utils.loadtest import LoadTestClient, percentile, summarize
+
+
+class LoadTestReportTestCase(SimpleTestCase):
+    """Test cases for the load test report aggregation"""
+
+    def test_percentile_nearest_rank(self):
+        """Percentiles use the nearest-rank method"""
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 0.50), 50)
+        self.assertEqual(percentile(values, 0.95), 95)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([7], 0.99), 7)
+        self.assertIsNone(percentile([], 0.5))
+
+    def test_summarize_rates(self):
+        """Errors, throttles and throughput are computed per endpoint"""
+        samples = [("GET /a/", 200, 0.010)] * 6 + [
+            ("GET /a/", 429, 0.001),
+            ("GET /a/", 500, 0.020),
+            ("GET /a/", 0, 0.030),
+            ("GET /a/", 200, 0.040),
+        ]
+
+        report = summarize(samples, duration=2)["GET /a/"]
+
+        self.assertEqual(report["requests"], 10)
+        self.assertEqual(report["throughput"], 5)
+        self.assertEqual(report["p50"], 10)
+        self.assertEqual(report["max"], 40)
+        self.assertEqual(report["errorRate"], 0.2)
+        self.assertEqual(report["throttleRate"], 0.1)
+
+    def test_malformed_responses_are_errors(self):
+        """A response cut short or unparsable is a failed request"""
+        listener = socket.create_server(("127.0.0.1", 0))
+        self.addCleanup(listener.close)
+
+        def answer():
+            connection, _ = listener.accept()
+            connection.recv(1024)
+            connection.sendall(b"garbage\r\n\r\n")
+            connection.close()
+
+        thread = threading.Thread(target=answer, daemon=True)
+        thread.start()
+
+        samples = []
+        port = listener.getsockname()[1]
+        client = LoadTestClient(f"http://127.0.0.1:{port}/", samples, timeout=5)
+
+        self.assertEqual(client.request("GET", "/", "GET /"), (0, None))
+        self.assertEqual(samples[0][:2], ("GET /", 0))
+        thread.join()
+
+
+class LoadTestCommandTestCase(LiveServerTestCase):
+    """Runs the load test command against a live test server"""
+
+    def test_command_reports_json(self):
+        """A short mixed run reports every endpoint it exercised"""
+        cache.clear()
+        stdout = StringIO()
+
+        call_command(
+            "loadtest",
+            server="none",
+            url=self.live_server_url,
+            duration=1,
+            scenario=["polling:2", "mixed:2"],
+            allow_non_debug=True,
+            stdout=stdout,
+        )
+
+        report = json.loads(stdout.getvalue())
+        endpoints = report["endpoints"]
+
+        self.assertEqual(report["scenarios"], {"polling": 2, "mixed": 2})
+        self.assertIn("GET /users/user-info/", endpoints)
+        self.assertIn("GET /menu/{id}/", endpoints)
+        for stats in endpoints.values():
+            self.assertGreater(stats["requests"], 0)
+            self.assertEqual(stats["errorRate"], 0)
+            self.assertLessEqual(stats["p50"], stats["p99"])
+
+        # The fixtures are removed once the run is over
+        self.assertFalse(UserModel.objects.exists())
+        self.assertFalse(RestaurantModel.objects.exists())
+
+    def test_command_refuses_non_debug_databases(self):
+        """Without DEBUG, nothing is written unless explicitly allowed"""
+        with self.assertRaises(CommandError):
+            call_command("loadtest", server="none", url=self.live_server_url)
+
+        self.assertFalse(UserModel.objects.exists())
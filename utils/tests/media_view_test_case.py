@@ -0,0 +1,137 @@
+import os
+import shutil
+import tempfile
+from utils.purge import get_media_tag
+from django.test import TestCase, override_settings
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, MEDIA_SERVE_MODE="django")
+class MediaViewTestCase(TestCase):
+    """Test cases for the production media serving view"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        os.makedirs(os.path.join(MEDIA_ROOT, "products", "variants"), exist_ok=True)
+        with open(os.path.join(MEDIA_ROOT, "products", "photo.jpg"), "wb") as file:
+            file.write(bytes(range(256)) * 4)
+        variant = os.path.join(
+            MEDIA_ROOT, "products", "variants", "0123456789abcdef-card.webp"
+        )
+        with open(variant, "wb") as file:
+            file.write(b"webp")
+        with open(os.path.join(MEDIA_ROOT, ".secret"), "wb") as file:
+            file.write(b"secret")
+        open(os.path.join(MEDIA_ROOT, "products", "empty.jpg"), "wb").close()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def test_full_file_is_streamed(self):
+        """A plain GET streams the whole file with validators"""
+        response = self.client.get("/media/products/photo.jpg")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), bytes(range(256)) * 4)
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(
+            response["Cache-Control"],
+            "public, max-age=3600, stale-while-revalidate=30",
+        )
+        self.assertEqual(
+            response["Surrogate-Key"], get_media_tag("products/photo.jpg")
+        )
+
+    def test_matching_etag_returns_304(self):
+        """A matching If-None-Match short-circuits the body"""
+        etag = self.client.get("/media/products/photo.jpg")["ETag"]
+        response = self.client.get(
+            "/media/products/photo.jpg", HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_range_request_returns_partial_content(self):
+        """Byte ranges are served as 206 with the right slice"""
+        response = self.client.get("/media/products/photo.jpg", HTTP_RANGE="bytes=10-19")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 10-19/1024")
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(b"".join(response.streaming_content), bytes(range(10, 20)))
+
+    def test_suffix_range(self):
+        """Suffix ranges return the end of the file"""
+        response = self.client.get("/media/products/photo.jpg", HTTP_RANGE="bytes=-6")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), bytes(range(250, 256)))
+
+    def test_unsatisfiable_range_returns_416(self):
+        """Ranges past the end of the file cannot be satisfied"""
+        response = self.client.get(
+            "/media/products/photo.jpg", HTTP_RANGE="bytes=5000-"
+        )
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */1024")
+
+    def test_ranges_of_empty_files_return_416(self):
+        """Empty files satisfy no range, not even a suffix range"""
+        for header in ("bytes=-5", "bytes=0-"):
+            response = self.client.get(
+                "/media/products/empty.jpg", HTTP_RANGE=header
+            )
+
+            self.assertEqual(response.status_code, 416)
+            self.assertEqual(response["Content-Range"], "bytes */0")
+
+    def test_stale_if_range_returns_full_file(self):
+        """An outdated If-Range falls back to the full file"""
+        response = self.client.get(
+            "/media/products/photo.jpg",
+            HTTP_RANGE="bytes=0-9",
+            HTTP_IF_RANGE='"stale"',
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_hashed_names_are_immutable(self):
+        """Content-hashed names are cached for a year"""
+        response = self.client.get(
+            "/media/products/variants/0123456789abcdef-card.webp"
+        )
+
+        self.assertIn("immutable", response["Cache-Control"])
+
+    def test_hidden_and_missing_files_are_not_served(self):
+        """Hidden files, traversal and missing files return 404"""
+        self.assertEqual(self.client.get("/media/.secret").status_code, 404)
+        self.assertEqual(self.client.get("/media/../manage.py").status_code, 404)
+        self.assertEqual(self.client.get("/media/missing.jpg").status_code, 404)
+
+    @override_settings(MEDIA_SERVE_MODE="accel")
+    def test_accel_redirect_offload(self):
+        """In accel mode the file is handed to nginx"""
+        response = self.client.get("/media/products/photo.jpg")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["X-Accel-Redirect"], "/protected-media/products/photo.jpg"
+        )
+        self.assertEqual(response.content, b"")
+
+    @override_settings(MEDIA_SERVE_MODE="sendfile")
+    def test_sendfile_offload(self):
+        """In sendfile mode the absolute path is handed to the server"""
+        response = self.client.get("/media/products/photo.jpg")
+
+        self.assertEqual(
+            response["X-Sendfile"], os.path.join(MEDIA_ROOT, "products", "photo.jpg")
+        )
@@ -0,0 +1,28 @@
+from django.test import SimpleTestCase
+from utils.text import normalize_persian_text, split_persian_words
+
+
+class PersianTextTestCase(SimpleTestCase):
+    """Test cases for the shared Persian text normalizer"""
+
+    def test_arabic_letters_are_unified(self):
+        """Arabic yeh, kaf and alef variants become their Persian forms"""
+        self.assertEqual(normalize_persian_text("كيك"), "کیک")
+        self.assertEqual(normalize_persian_text("آب أنار"), "اب انار")
+        self.assertEqual(normalize_persian_text("قهوهٔ"), "قهوه")
+
+    def test_digits_and_invisible_characters(self):
+        """Digits become ASCII; ZWNJ, tatweel and diacritics are dropped"""
+        self.assertEqual(normalize_persian_text("۱۲ ٣٤"), "12 34")
+        self.assertEqual(normalize_persian_text("می‌خواهم"), "میخواهم")
+        self.assertEqual(normalize_persian_text("شـــیر"), "شیر")
+        self.assertEqual(normalize_persian_text("مُحَمَّد"), "محمد")
+
+    def test_case_and_whitespace(self):
+        """Latin text is case-folded and whitespace collapsed"""
+        self.assertEqual(normalize_persian_text("  Iced\tLATTE \n"), "iced latte")
+        self.assertEqual(normalize_persian_text(None), "")
+
+    def test_split_words(self):
+        """Words are split on punctuation and underscores"""
+        self.assertEqual(split_persian_words("چاي، كيك_شكلاتي!"), ["چای", "کیک", "شکلاتی"])
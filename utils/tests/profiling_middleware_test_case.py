@@ -0,0 +1,129 @@
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from django.urls import reverse
+from django.core.cache import cache
+from users.models import UserModel
+from rest_framework.test import APIClient
+from django.test import TestCase, override_settings
+from utils.profiling import STACK_MODE, prune_profiles, create_profiling_token
+
+
+class ProfilingMiddlewareTestCase(TestCase):
+    """Test cases for the on-demand request profiling middleware"""
+
+    def setUp(self):
+        """Enable profiling into a temporary directory"""
+        cache.clear()
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        profiling_settings = override_settings(
+            PROFILING_ENABLED=True, PROFILING_DIR=self.directory
+        )
+        profiling_settings.enable()
+        self.addCleanup(profiling_settings.disable)
+
+        self.staff = UserModel.objects.create_superuser(
+            email="admin@example.com",
+            username="admin",
+            password="AdminPass123!",
+        )
+        self.client = APIClient()
+
+    def login(self, **extra):
+        return self.client.post(
+            reverse("login"),
+            {"username": "admin", "password": "AdminPass123!"},
+            **extra,
+        )
+
+    def read_summary(self, response):
+        return json.loads((self.directory / f"{response['X-Profile-Id']}.json").read_text())
+
+    def test_requests_without_header_are_not_profiled(self):
+        """Untriggered requests leave no trace"""
+        response = self.login()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("X-Profile-Id"))
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+    def test_invalid_token_is_ignored(self):
+        """Unsigned or tampered header values do not trigger profiling"""
+        token = create_profiling_token(self.staff) + "x"
+        response = self.login(HTTP_X_PROFILE=token)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("X-Profile-Id"))
+
+    def test_cprofile_captures_sql_and_timings(self):
+        """A signed header writes pstats plus SQL and hashing/JWT timings"""
+        response = self.login(HTTP_X_PROFILE=create_profiling_token(self.staff))
+        summary = self.read_summary(response)
+
+        self.assertEqual(summary["mode"], "cprofile")
+        self.assertEqual(summary["status"], 200)
+        self.assertTrue((self.directory / summary["profile"]).exists())
+        self.assertGreater(summary["queryCount"], 0)
+        self.assertIn("users_usermodel", summary["queries"][0]["sql"])
+        self.assertGreater(summary["timings"]["passwordHashing"], 0)
+        self.assertGreater(summary["timings"]["jwtEncoding"], 0)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_sampled_requests_use_the_stack_sampler(self):
+        """Sampled requests are written as speedscope profiles"""
+        response = self.login()
+        summary = self.read_summary(response)
+        profile = json.loads((self.directory / summary["profile"]).read_text())
+
+        self.assertEqual(summary["mode"], STACK_MODE)
+        self.assertTrue(summary["profile"].endswith(".speedscope.json"))
+        self.assertEqual(profile["profiles"][0]["type"], "sampled")
+        self.assertEqual(
+            len(profile["profiles"][0]["samples"]),
+            len(profile["profiles"][0]["weights"]),
+        )
+
+    @override_settings(PROFILING_TOKEN_MAX_USES=2)
+    def test_tokens_are_limited_in_uses(self):
+        """A token stops profiling after PROFILING_TOKEN_MAX_USES requests"""
+        token = create_profiling_token(self.staff)
+
+        self.assertIn("X-Profile-Id", self.login(HTTP_X_PROFILE=token))
+        self.assertIn("X-Profile-Id", self.login(HTTP_X_PROFILE=token))
+        self.assertNotIn("X-Profile-Id", self.login(HTTP_X_PROFILE=token))
+
+        # Other tokens have their own budget
+        other_token = create_profiling_token(self.staff)
+        self.assertIn("X-Profile-Id", self.login(HTTP_X_PROFILE=other_token))
+
+    def test_old_profiles_are_pruned(self):
+        """Only the newest PROFILING_MAX_PROFILES profiles are kept"""
+        for index in range(4):
+            (self.directory / f"20240101-00000{index}-get-abc.json").write_text("{}")
+            (self.directory / f"20240101-00000{index}-get-abc.pstats").write_text("")
+
+        prune_profiles(self.directory, keep=1)
+
+        self.assertEqual(
+            sorted(path.name for path in self.directory.iterdir()),
+            ["20240101-000003-get-abc.json", "20240101-000003-get-abc.pstats"],
+        )
+
+    def test_token_endpoint_is_staff_only(self):
+        """Only staff can issue profiling tokens"""
+        user = UserModel.objects.create_user(
+            email="user@example.com", username="user", password="UserPass123!"
+        )
+        self.client.force_authenticate(user)
+        self.assertEqual(self.client.post(reverse("profiling-token")).status_code, 403)
+
+        self.client.force_authenticate(self.staff)
+        response = self.client.post(reverse("profiling-token"), {"mode": "stack"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["header"], "X-Profile")
+
+        response = self.client.post(reverse("profiling-token"), {"mode": "trace"})
+        self.assertEqual(response.status_code, 400)
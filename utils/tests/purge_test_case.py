@@ -0,0 +1,124 @@
+import time
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import TestCase, override_settings
+from utils.purge import (
+    HTTPPurger,
+    PurgeServer,
+    purge,
+    get_purger,
+    reset_purger,
+    schedule_purge,
+    add_cache_tags,
+    patch_edge_cache_control,
+)
+
+
+class PurgeTestCase(TestCase):
+    """Test cases for the edge cache tagging and purging"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = PurgeServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.purged.clear()
+        self.enterContext(
+            self.settings(
+                CACHE_PURGER="utils.purge.HTTPPurger",
+                CACHE_PURGE_URLS=[self.server.url],
+                CACHE_PURGE_WORKERS=0,
+            )
+        )
+        # The purger is created from the settings on first use
+        reset_purger()
+        self.addCleanup(reset_purger)
+
+    def test_http_purger_sends_the_tags(self):
+        """Tags travel space separated in a PURGE request, in batches"""
+        HTTPPurger().purge(["restaurant-1", "product-2"])
+        self.assertEqual(self.server.purged, [["restaurant-1", "product-2"]])
+
+        self.server.purged.clear()
+        HTTPPurger().purge([f"product-{index}" for index in range(250)])
+        self.assertEqual([len(tags) for tags in self.server.purged], [100, 100, 50])
+
+    def test_unreachable_endpoints_are_logged(self):
+        """A failing purge endpoint never breaks the saving request"""
+        purger = HTTPPurger(urls=["http://127.0.0.1:9/", self.server.url], timeout=1)
+
+        with self.assertLogs("utils.purge.purge_utils", "ERROR"):
+            purger.purge(["restaurant-1"])
+
+        self.assertEqual(self.server.purged, [["restaurant-1"]])
+
+    def test_purges_wait_for_the_commit(self):
+        """Tags of one transaction are purged once, after it commits"""
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                schedule_purge("restaurant-1", "product-2")
+                schedule_purge("restaurant-1", "category-3")
+                self.assertEqual(self.server.purged, [])
+
+        self.assertEqual(
+            self.server.purged, [["category-3", "product-2", "restaurant-1"]]
+        )
+
+    def test_rolled_back_purges_are_dropped(self):
+        """Nothing is purged for a rolled back transaction"""
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    schedule_purge("restaurant-1")
+                    raise ValueError
+            except ValueError:
+                pass
+
+            schedule_purge("product-2")
+
+        self.assertEqual(self.server.purged, [["product-2"]])
+
+    def test_purges_run_in_the_background(self):
+        """With purge workers, the committing thread never waits for the endpoints"""
+        with self.settings(CACHE_PURGE_WORKERS=1):
+            purge("restaurant-1")
+
+        deadline = time.monotonic() + 5
+        while not self.server.purged and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.server.purged, [["restaurant-1"]])
+
+    @override_settings(CACHE_PURGER="utils.purge.NullPurger")
+    def test_purger_is_pluggable(self):
+        """CACHE_PURGER selects the purger class"""
+        reset_purger()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            schedule_purge("restaurant-1")
+
+        self.assertEqual(type(get_purger()).__name__, "NullPurger")
+        self.assertEqual(self.server.purged, [])
+
+    @override_settings(EDGE_CACHE_MAX_AGE=86400, EDGE_CACHE_STALE_WHILE_REVALIDATE=30)
+    def test_response_headers(self):
+        """Responses carry the tags in both header formats and an edge lifetime"""
+        response = patch_edge_cache_control(
+            add_cache_tags(HttpResponse(), ["restaurant-1", "product-2", "product-2"])
+        )
+
+        self.assertEqual(response["Surrogate-Key"], "restaurant-1 product-2")
+        self.assertEqual(response["Cache-Tag"], "restaurant-1,product-2")
+        self.assertEqual(
+            response["Cache-Control"],
+            "public, max-age=0, s-maxage=86400, stale-while-revalidate=30",
+        )
+
+        with self.settings(EDGE_CACHE_MAX_AGE=0):
+            self.assertNotIn("Cache-Control", patch_edge_cache_control(HttpResponse()))
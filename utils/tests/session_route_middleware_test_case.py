@@ -0,0 +1,61 @@
+from django.test import TestCase, Client
+from django.urls import reverse
+from users.models import UserModel
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+class SessionRouteMiddlewareTestCase(TestCase):
+    """Test cases for running the session middleware on admin routes only"""
+
+    def setUp(self):
+        self.user = UserModel.objects.create_superuser(
+            email="admin@example.com",
+            username="admin",
+            password="AdminPass123!",
+        )
+
+    def test_api_routes_skip_session_stack(self):
+        """API responses carry no session, CSRF or clickjacking work"""
+        token = AccessToken.for_user(self.user)
+        response = self.client.get(
+            reverse("user-info"), HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("X-Frame-Options"))
+        self.assertNotIn("Cookie", response.get("Vary", ""))
+        self.assertFalse(hasattr(response.wsgi_request, "session"))
+
+    def test_admin_routes_run_session_stack(self):
+        """The admin still gets sessions, messages and X-Frame-Options"""
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("admin:index"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Frame-Options"], "DENY")
+        self.assertTrue(hasattr(response.wsgi_request, "session"))
+
+    def test_admin_csrf_is_enforced(self):
+        """CsrfViewMiddleware.process_view is forwarded for admin routes"""
+        client = Client(enforce_csrf_checks=True)
+        response = client.post(
+            reverse("admin:login"), {"username": "admin", "password": "AdminPass123!"}
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_admin_login_flow(self):
+        """Logging into the admin works end to end with a CSRF token"""
+        client = Client(enforce_csrf_checks=True)
+        client.get(reverse("admin:login"))
+        response = client.post(
+            reverse("admin:login"),
+            {
+                "username": "admin",
+                "password": "AdminPass123!",
+                "csrfmiddlewaretoken": client.cookies["csrftoken"].value,
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(client.get(reverse("admin:index")).status_code, 200)
@@ -0,0 +1,41 @@
+from django.db import transaction
+from django.test import TestCase
+from utils.transaction import on_commit_once
+
+
+class OnCommitOnceTestCase(TestCase):
+    """Test cases for the calls coalesced until the transaction commits"""
+
+    def test_calls_of_a_key_are_merged(self):
+        """One call per key, with the items of every call, after the commit"""
+        calls = []
+
+        with self.captureOnCommitCallbacks(execute=True):
+            on_commit_once("a", calls.append, [1])
+            on_commit_once("a", calls.append, [2, 1])
+            on_commit_once("b", calls.append, [3])
+            self.assertEqual(calls, [])
+
+        self.assertEqual(calls, [{1, 2}, {3}])
+
+        # A new transaction starts over
+        with self.captureOnCommitCallbacks(execute=True):
+            on_commit_once("a", calls.append, [4])
+
+        self.assertEqual(calls[2:], [{4}])
+
+    def test_rolled_back_calls_are_dropped(self):
+        """Items of a rolled back transaction never reach a later commit"""
+        calls = []
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    on_commit_once("a", calls.append, [1])
+                    raise ValueError
+            except ValueError:
+                pass
+
+            on_commit_once("a", calls.append, [2])
+
+        self.assertEqual(calls, [{2}])
@@ -0,0 +1,144 @@
+import time
+import tempfile
+from pathlib import Path
+from unittest import mock
+from django.test import SimpleTestCase
+from utils.cache import TwoTierCache
+
+
+class TwoTierCacheTestCase(SimpleTestCase):
+    """Test cases for the in-process LRU in front of the shared SQLite cache"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.location = Path(directory.name) / "cache.sqlite3"
+
+        # Two instances on one file stand for two worker processes
+        self.worker = self.create_cache()
+        self.other = self.create_cache()
+
+    def create_cache(self, **options):
+        return TwoTierCache(str(self.location), {"OPTIONS": options})
+
+    def test_reads_hit_l1_then_l2(self):
+        """Values written by a worker are shared, and kept in memory once read"""
+        value = {"items": [1, 2]}
+        self.worker.set("menu", value)
+        value["items"].append(3)
+
+        self.assertEqual(self.other.get("menu"), {"items": [1, 2]})
+        self.assertEqual(self.other.get("menu"), {"items": [1, 2]})
+        self.assertIsNone(self.other.get("missing"))
+
+        # Callers get copies, never the cached object itself
+        self.other.get("menu")["items"].append(4)
+        self.assertEqual(self.other.get("menu"), {"items": [1, 2]})
+
+        stats = self.other.get_stats()
+        self.assertEqual((stats["l1_hits"], stats["l2_hits"], stats["misses"]), (3, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.8)
+
+    def test_writes_invalidate_other_workers(self):
+        """Sets, deletes and clears of one worker are seen by the others"""
+        self.worker.set("price", 10)
+        self.assertEqual(self.other.get("price"), 10)
+
+        # A worker's own writes do not evict its in-memory copies
+        self.assertEqual(self.worker.get("price"), 10)
+        self.assertEqual(self.worker.get_stats()["l1_hits"], 1)
+
+        self.worker.set("price", 12)
+        self.assertEqual(self.other.get("price"), 12)
+        self.assertEqual(self.other.get_stats()["l1_invalidations"], 1)
+
+        self.worker.delete("price")
+        self.assertIsNone(self.other.get("price"))
+
+        self.other.set("price", 15)
+        self.worker.clear()
+        self.assertIsNone(self.other.get("price"))
+
+    def test_changes_published_before_commit_are_not_skipped(self):
+        """The stamp moves inside the write transaction, readers wait for the commit"""
+        self.worker.set("price", 10)
+        self.assertEqual(self.other.get("price"), 10)
+
+        key = self.worker.make_key("price")
+        connection = self.worker.connect()
+        connection.execute("BEGIN IMMEDIATE")
+        connection.execute(
+            "UPDATE entries SET value = ? WHERE key = ?",
+            (self.worker.serialize(12), key),
+        )
+        self.worker.log_changes(connection, [key])
+
+        self.assertEqual(self.other.get("price"), 10)
+        connection.execute("COMMIT")
+        self.assertEqual(self.other.get("price"), 12)
+
+    def test_l1_is_bounded(self):
+        """L1 evicts the least recently used entries by count and size"""
+        cache = self.create_cache(L1_MAX_ENTRIES=2, L1_MAX_BYTES=1024)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(list(cache.l1), [cache.make_key("a"), cache.make_key("c")])
+
+        cache.set("large", b"x" * 2048)
+        self.assertNotIn(cache.make_key("large"), cache.l1)
+        self.assertEqual(cache.get("large"), b"x" * 2048)
+        self.assertEqual(cache.get("b"), 2)  # Still shared through L2
+        self.assertLessEqual(cache.get_stats()["l1_bytes"], 1024)
+        self.assertGreaterEqual(cache.get_stats()["l1_evictions"], 1)
+
+    def test_timeouts(self):
+        """Entries expire in both tiers, L1 copies after L1_TIMEOUT at most"""
+        cache = self.create_cache(L1_TIMEOUT=0)
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get_stats()["l2_hits"], 1)
+
+        # Both tiers and Django's timeout computation read the mocked clock
+        now = time.time()
+        with mock.patch("time.time", lambda: now):
+            self.worker.set("b", 1, timeout=5)
+            self.assertEqual(self.worker.get("b"), 1)
+            now += 6
+            self.assertIsNone(self.worker.get("b"))
+            self.assertIsNone(self.other.get("b"))
+
+            self.worker.set("c", 1, timeout=5)
+            self.assertTrue(self.other.touch("c", None))
+            now += 6
+            self.assertEqual(self.worker.get("c"), 1)
+
+    def test_add_and_incr_are_shared(self):
+        """add and incr are atomic across workers"""
+        self.assertTrue(self.worker.add("count", 1))
+        self.assertFalse(self.other.add("count", 5))
+
+        self.assertEqual(self.other.get("count"), 1)
+        self.assertEqual(self.worker.incr("count"), 2)
+        self.assertEqual(self.other.incr("count", 3), 5)
+        self.assertEqual(self.worker.get("count"), 5)
+        self.assertEqual(self.other.get("count"), 5)
+
+        with self.assertRaises(ValueError):
+            self.worker.incr("missing")
+
+    def test_cleanup_culls_and_prunes(self):
+        """L2 is culled to MAX_ENTRIES, pruned change logs invalidate all of L1"""
+        worker = self.create_cache(MAX_ENTRIES=4, CHANGE_LOG_SIZE=2)
+        self.other.set("kept", 1)
+        self.assertEqual(self.other.get("kept"), 1)
+
+        worker.set_many({f"key{index}": index for index in range(8)})
+        worker.set("kept", 2)
+        worker.cleanup()
+
+        count = worker.connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        self.assertLessEqual(count, 4)
+        self.assertEqual(self.other.get("kept"), 2)
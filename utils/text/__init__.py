@@ -0,0 +1 @@
+from .persian_text_utils import normalize_persian_text, split_persian_words
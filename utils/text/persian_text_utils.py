@@ -0,0 +1,63 @@
+import re
+
+# ----------------------------------
+# Character mapping
+# ----------------------------------
+
+# Arabic code points commonly typed instead of their Persian counterparts
+PERSIAN_CHARACTERS = {
+    "ي": "ی",  # Arabic yeh
+    "ى": "ی",  # Alef maksura
+    "ئ": "ی",  # Yeh with hamza
+    "ك": "ک",  # Arabic kaf
+    "ة": "ه",  # Teh marbuta
+    "ۀ": "ه",  # Heh with yeh above
+    "ؤ": "و",  # Waw with hamza
+    "أ": "ا",  # Alef with hamza above
+    "إ": "ا",  # Alef with hamza below
+    "آ": "ا",  # Alef with madda
+    "ٱ": "ا",  # Alef wasla
+}
+
+# Persian (U+06F0..) and Arabic-Indic (U+0660..) digits
+DIGITS = {chr(0x06F0 + digit): str(digit) for digit in range(10)}
+DIGITS.update({chr(0x0660 + digit): str(digit) for digit in range(10)})
+
+# Invisible and decorative characters; ZWNJ is dropped so "می‌خواهم" matches "میخواهم"
+REMOVED_CHARACTERS = [
+    "\u200c",  # Zero-width non-joiner
+    "\u200d",  # Zero-width joiner
+    "\u200e",  # Left-to-right mark
+    "\u200f",  # Right-to-left mark
+    "\ufeff",  # Byte order mark
+    "\u0640",  # Tatweel (kashida)
+    "\u0670",  # Superscript alef
+]
+# Harakat, tanwin, shadda, sukun, hamza above/below, ...
+REMOVED_CHARACTERS += [chr(code) for code in range(0x064B, 0x0660)]
+
+PERSIAN_TRANSLATION = str.maketrans(
+    {**PERSIAN_CHARACTERS, **DIGITS, **dict.fromkeys(REMOVED_CHARACTERS)}
+)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+WORD_PATTERN = re.compile(r"[^\W_]+")  # Letters and digits
+
+
+def normalize_persian_text(text):
+    """
+    Normalizes Persian text for comparison and search: unifies Arabic and
+    Persian letter variants, converts digits to ASCII, drops diacritics,
+    tatweel and zero-width characters, case-folds Latin letters and
+    collapses whitespace.
+    """
+    if not text:
+        return ""
+
+    text = text.translate(PERSIAN_TRANSLATION).casefold()
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def split_persian_words(text):
+    """Returns the normalized words of a text, e.g. to build search terms."""
+    return WORD_PATTERN.findall(normalize_persian_text(text))
@@ -0,0 +1 @@
+from .transaction_utils import on_commit_once
@@ -0,0 +1,50 @@
+import weakref
+import threading
+from django.db import transaction
+
+# Calls waiting for the current transaction to commit (per thread)
+_pending_calls = threading.local()
+
+
+class PendingCall:
+    """Items collected by the calls of one key, and their on_commit callbacks."""
+
+    def __init__(self):
+        self.items = set()
+        self.callbacks = weakref.WeakSet()
+
+    def is_scheduled(self):
+        return len(self.callbacks) > 0
+
+
+def on_commit_once(key, function, items=()):
+    """
+    Calls `function(items)` once the current transaction commits, where
+    `items` is the set of the items given by every call made with the same
+    key during the transaction (right away outside of transactions).
+
+    Every call registers a callback, held by Django alone, and the first
+    one to run does the work. A rollback drops the callbacks of the calls
+    it undid, which tells the next call to start over. Items added in a
+    rolled back savepoint still reach the enclosing commit, so functions
+    should act on the committed state rather than the items' values.
+    """
+    pending = getattr(_pending_calls, "calls", None)
+
+    if pending is None:
+        pending = _pending_calls.calls = {}
+
+    call = pending.get(key)
+
+    if call is None or not call.is_scheduled():
+        call = pending[key] = PendingCall()
+
+    call.items.update(items)
+
+    def run_on_commit():
+        if pending.get(key) is call:
+            del pending[key]
+            function(call.items)
+
+    call.callbacks.add(run_on_commit)
+    transaction.on_commit(run_on_commit)
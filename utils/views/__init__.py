@@ -0,0 +1,2 @@
+from .media_view import MediaView
+from .profiling_token_view import ProfilingTokenView
@@ -0,0 +1,197 @@
+import os
+import re
+import mimetypes
+from django.conf import settings
+from django.views import View
+from urllib.parse import quote
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.utils.cache import get_conditional_response
+from utils.purge import add_cache_tags, get_media_tag
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
+
+# ----------------------------------
+# Media serving configuration
+# ----------------------------------
+
+# Names generated from the content hash (e.g. image variants) never change
+IMMUTABLE_MEDIA_PATTERN = re.compile(r"(^|/)[0-9a-f]{16}-[\w-]+\.\w+$")
+
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeFile:
+    """
+    Read-only view over a byte range of an open file, streamed by FileResponse.
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b""
+
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+
+        data = self.file.read(size)
+        self.remaining -= len(data)
+
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range_header(header, size):
+    """
+    Parses a single-range `Range` header against a file of the given size.
+
+    Returns a (start, end) tuple with an inclusive end, None if the header
+    should be ignored (missing, malformed or multi-range) and raises
+    ValueError if the range cannot be satisfied.
+    """
+    match = RANGE_PATTERN.match(header.strip()) if header else None
+
+    if match is None:
+        return None
+
+    start, end = match.groups()
+
+    if not start and not end:
+        return None
+
+    if size == 0:
+        # An empty file has no byte to serve
+        raise ValueError("Empty file")
+
+    if not start:
+        # Suffix range, e.g. "bytes=-500" is the last 500 bytes
+        length = int(end)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+
+    if start >= size or start > end:
+        raise ValueError("Unsatisfiable range")
+
+    return start, end
+
+
+class MediaView(View):
+    """
+    Serves uploaded media files.
+
+    Depending on MEDIA_SERVE_MODE, the file is either handed to the front
+    proxy ("accel" for nginx X-Accel-Redirect, "sendfile" for X-Sendfile)
+    or streamed by Django ("django") with strong ETags, conditional
+    requests and single byte-range support.
+    """
+
+    http_method_names = ["get", "head"]
+
+    def has_access(self, request, path):
+        """
+        Returns True if the given media path may be served to the request.
+        Hidden files and directories are never served.
+        """
+        return not any(part.startswith(".") for part in path.split("/"))
+
+    def get(self, request, path):
+        try:
+            full_path = safe_join(settings.MEDIA_ROOT, path)
+        except SuspiciousFileOperation:
+            raise Http404("Media file not found.")
+
+        if not self.has_access(request, path) or not os.path.isfile(full_path):
+            raise Http404("Media file not found.")
+
+        stat = os.stat(full_path)
+        etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        last_modified = int(stat.st_mtime)
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+
+        if response is None:
+            response = self.serve(request, path, full_path, stat.st_size, etag)
+
+        response.headers["ETag"] = etag
+        response.headers["Last-Modified"] = http_date(last_modified)
+        response.headers["Cache-Control"] = self.get_cache_control(path)
+
+        # Purged from the edge cache when the file is deleted
+        return add_cache_tags(response, [get_media_tag(path)])
+
+    def get_cache_control(self, path):
+        """Content-hashed names are cached forever, other files for a while."""
+        if IMMUTABLE_MEDIA_PATTERN.search(path):
+            return f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+
+        return (
+            f"public, max-age={settings.MEDIA_CACHE_MAX_AGE}, "
+            f"stale-while-revalidate={settings.EDGE_CACHE_STALE_WHILE_REVALIDATE}"
+        )
+
+    def serve(self, request, path, full_path, size, etag):
+        """Builds the response carrying the file content."""
+        content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+
+        if settings.MEDIA_SERVE_MODE == "accel":
+            # nginx serves the file from its `internal` location
+            response = HttpResponse(content_type=content_type)
+            response.headers["X-Accel-Redirect"] = quote(
+                settings.MEDIA_ACCEL_REDIRECT_PREFIX + path
+            )
+            return response
+
+        if settings.MEDIA_SERVE_MODE == "sendfile":
+            # Apache (mod_xsendfile) or lighttpd serve the file from disk
+            response = HttpResponse(content_type=content_type)
+            response.headers["X-Sendfile"] = full_path
+            return response
+
+        try:
+            byte_range = parse_range_header(request.headers.get("Range"), size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response.headers["Content-Range"] = f"bytes */{size}"
+            return response
+
+        # A stale If-Range means the client's partial copy is outdated
+        if_range = request.headers.get("If-Range")
+        if byte_range and if_range and if_range != etag:
+            byte_range = None
+
+        if request.method == "HEAD":
+            response = HttpResponse(content_type=content_type)
+            response.headers["Content-Length"] = size
+        elif byte_range is None:
+            # A plain file lets the WSGI server use sendfile()
+            response = FileResponse(open(full_path, "rb"), content_type=content_type)
+            response.block_size = settings.MEDIA_BLOCK_SIZE
+        else:
+            start, end = byte_range
+            length = end - start + 1
+            response = FileResponse(
+                RangeFile(open(full_path, "rb"), start, length),
+                status=206,
+                content_type=content_type,
+            )
+            response.block_size = settings.MEDIA_BLOCK_SIZE
+            response.headers["Content-Length"] = length
+            response.headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        response.headers["Accept-Ranges"] = "bytes"
+
+        return response
@@ -0,0 +1,37 @@
+from django.conf import settings
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+from rest_framework.throttling import ScopedRateThrottle
+from utils.profiling import CPROFILE_MODE, PROFILING_MODES, create_profiling_token
+
+
+class ProfilingTokenView(APIView):
+    """
+    Staff-only API endpoint issuing a signed header value that makes
+    ProfilingMiddleware profile the requests carrying it.
+    """
+
+    http_method_names = ["post"]
+    permission_classes = [IsAdminUser]
+
+    throttle_scope = "user"
+    throttle_classes = [ScopedRateThrottle]
+
+    def post(self, request):
+        mode = request.data.get("mode", CPROFILE_MODE)
+        if mode not in PROFILING_MODES:
+            return Response(
+                {"mode": ["حالت پروفایل نامعتبر است."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {
+                "header": settings.PROFILING_HEADER,
+                "token": create_profiling_token(request.user, mode),
+                "expiresIn": settings.PROFILING_TOKEN_MAX_AGE,
+                "maxUses": settings.PROFILING_TOKEN_MAX_USES,
+            }
+        )